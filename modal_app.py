@@ -26,7 +26,7 @@ SUPABASE_ANON_KEY = (
     "CI6MjA4NDAwMDg5OH0.FprGrDgkfT0j3nK51VGtCozs6y1pfhtZ07qDUHBm8Go"
 )
 
-# Image: two layers so prerender always runs fresh while app build stays cached
+# Image: app build and full prerender stay cached; an incremental prerender runs fresh
 image = (
     modal.Image.debian_slim(python_version="3.11")
     .apt_install("curl", "ca-certificates", "git")
@@ -35,6 +35,7 @@ image = (
         "curl -fsSL https://deb.nodesource.com/setup_20.x | bash -",
         "apt-get install -y nodejs",
     )
+    .pip_install("brotli")
     .run_commands(
         # Layer 1: Clone, install, build — cached until APP_VERSION is bumped
         f"echo 'app-build: {APP_VERSION}'",
@@ -47,48 +48,598 @@ image = (
         " npm run build",
     )
     .run_commands(
-        # Layer 2: Pre-render — cache-busted every deploy to pick up new bills
-        f"echo 'prerender: {_now}'",
+        # Layer 2: Full pre-render — cached with the app build
+        f"echo 'prerender-full: {APP_VERSION}'",
         f"cd /app && SUPABASE_ANON_KEY={SUPABASE_ANON_KEY}"
         " node scripts/prerender.mjs",
+        # Precompressed .br/.gz variants, negotiated by the static manifest
+        "cd /app && python scripts/precompress_dist.py dist",
+    )
+    .run_commands(
+        # Layer 3: Incremental pre-render — cache-busted every deploy to pick up
+        # new bills, but only rewrites pages whose rows changed since Layer 2
+        f"echo 'prerender: {_now}'",
+        f"cd /app && SUPABASE_ANON_KEY={SUPABASE_ANON_KEY}"
+        " node scripts/prerender.mjs --incremental",
+        "cd /app && python scripts/precompress_dist.py dist",
     )
-    .pip_install("fastapi", "uvicorn", "aiofiles", "httpx", "resend")
+    .pip_install("fastapi", "uvicorn", "aiofiles", "httpx[http2]", "resend")
 )
 
 
-@app.function(
-    image=image,
-    allow_concurrent_inputs=100,
-    secrets=[modal.Secret.from_name(RUNTIME_SECRET_NAME)],
-)
-@modal.asgi_app(label="state-legislative-tracker")
-def web():
-    """Serve static files with FastAPI."""
+# Bill request jobs spooled at shutdown or after exhausting retries. A Volume,
+# so the next container replays them rather than losing them with /tmp
+BILL_SPOOL_VOLUME = modal.Volume.from_name("state-research-tracker-bill-spool", create_if_missing=True)
+BILL_SPOOL_MOUNT = "/bill-request-spool"
+
+
+# Files at least this large are memory-mapped instead of read into the manifest
+STATIC_MMAP_THRESHOLD = 1024 * 1024
+
+
+# Precompressed variants written by scripts/precompress_dist.py, in order of preference
+STATIC_ENCODINGS = [("br", ".br"), ("gzip", ".gz")]
+
+
+def _read_static_file(full_path: str):
+    """File contents as bytes, or a read-only memoryview over an mmap for large files."""
+    import mmap
+    import os
+
+    with open(full_path, "rb") as f:
+        if os.path.getsize(full_path) >= STATIC_MMAP_THRESHOLD:
+            return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        return f.read()
+
+
+def build_static_manifest(dist_path: str) -> dict:
+    """Index every file under dist_path for in-memory serving.
+
+    dist/ is baked into the image and never changes at runtime, so each file
+    is read (or mmapped) once at startup. Keys are URL paths relative to
+    dist_path; values hold the body, content type, ETag and size, plus any
+    precompressed .br/.gz variants under "encodings" (served by content
+    negotiation rather than as paths of their own).
+    """
+    import hashlib
+    import mimetypes
+    import os
+
+    paths = set()
+    for root, _, files in os.walk(dist_path):
+        for name in files:
+            paths.add(os.path.relpath(os.path.join(root, name), dist_path).replace(os.sep, "/"))
+
+    variant_paths = {
+        path for path in paths
+        for _, suffix in STATIC_ENCODINGS
+        if path.endswith(suffix) and path[: -len(suffix)] in paths
+    }
+
+    manifest = {}
+    for rel_path in sorted(paths - variant_paths):
+        body = _read_static_file(os.path.join(dist_path, rel_path))
+
+        content_type = mimetypes.guess_type(rel_path)[0] or "application/octet-stream"
+        if content_type.startswith("text/") or content_type in ("application/javascript", "application/json"):
+            content_type += "; charset=utf-8"
+
+        etag = hashlib.sha256(body).hexdigest()[:32]
+        encodings = {}
+        for encoding, suffix in STATIC_ENCODINGS:
+            if rel_path + suffix in variant_paths:
+                encoded = _read_static_file(os.path.join(dist_path, rel_path + suffix))
+                encodings[encoding] = {"body": encoded, "etag": f'"{etag}-{encoding}"'}
+
+        manifest[rel_path] = {
+            "body": body,
+            "content_type": content_type,
+            "etag": f'"{etag}"',
+            "size": len(body),
+            "encodings": encodings,
+            "cache_control": cache_control_for(rel_path, content_type),
+        }
+    return manifest
+
+
+# Vite content-hashes everything it emits under _tracker/ (e.g. index-B1x9aQ2f.js)
+HASHED_ASSET_PATTERN = r"^_tracker/.+-[A-Za-z0-9_-]{8,}\.[A-Za-z0-9]+$"
+
+
+def cache_control_for(path: str, content_type: str) -> str:
+    """Cache-Control policy for a dist/ file (path relative to dist/).
+
+    Hashed _tracker assets never change under the same name, so they are
+    cached for a year as immutable. HTML (prerendered pages and the SPA
+    shell served for valid routes) gets a short max-age and is revalidated
+    by ETag; STATIC_STALE_WHILE_REVALIDATE (seconds, 0 = off) lets browsers
+    and CDNs serve the old copy while they revalidate. Everything else
+    (robots.txt, sitemap.xml, favicons, _valid_routes.json) gets a moderate
+    max-age.
+    """
+    import os
+    import re
+
+    if re.match(HASHED_ASSET_PATTERN, path):
+        return "public, max-age=31536000, immutable"
+
+    stale = int(os.environ.get("STATIC_STALE_WHILE_REVALIDATE", "0"))
+    swr = f", stale-while-revalidate={stale}" if stale > 0 else ""
+    if content_type.startswith("text/html"):
+        max_age = int(os.environ.get("STATIC_HTML_MAX_AGE", "300"))
+        # must-revalidate forbids serving stale copies, so it only applies without SWR
+        return f"public, max-age={max_age}{swr}" if swr else f"public, max-age={max_age}, must-revalidate"
+    return f"public, max-age=3600{swr}"
+
+
+def accepted_encodings(accept_encoding: str | None) -> set:
+    """Content codings the client accepts (q > 0) from an Accept-Encoding header."""
+    accepted = set()
+    for item in (accept_encoding or "").split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if q > 0:
+            accepted.add(coding)
+    if "*" in accepted:
+        accepted.update(encoding for encoding, _ in STATIC_ENCODINGS)
+    return accepted
+
+
+# PostHog endpoints that only record events (safe to acknowledge locally and batch)
+POSTHOG_CAPTURE_PATHS = {"e", "i/v0/e", "batch", "capture", "track"}
+
+
+def parse_capture_events(body: bytes, content_type: str, compression: str | None) -> list | None:
+    """Decode a posthog-js capture request into [(api_key, event), ...].
+
+    Handles JSON, gzip-js and base64 form (data=...) payloads, whether they
+    hold one event, a list, or a {"api_key", "batch"} envelope. Returns None
+    for anything it can't decode or events without a project key, so the
+    caller can fall back to proxying the request unchanged.
+    """
+    import base64
+    import gzip
+    import json
+    from urllib.parse import parse_qs
+
+    try:
+        if compression == "gzip-js" or body[:2] == b"\x1f\x8b":
+            body = gzip.decompress(body)
+        if "application/x-www-form-urlencoded" in (content_type or "") or body.startswith(b"data="):
+            data = parse_qs(body.decode()).get("data", [""])[0]
+            body = base64.b64decode(data + "=" * (-len(data) % 4))
+        payload = json.loads(body)
+    except (OSError, ValueError, UnicodeDecodeError):
+        return None
+
+    default_key = None
+    if isinstance(payload, dict) and isinstance(payload.get("batch"), list):
+        default_key = payload.get("api_key")
+        payload = payload["batch"]
+    events = payload if isinstance(payload, list) else [payload]
+
+    parsed = []
+    for event in events:
+        if not isinstance(event, dict) or "event" not in event:
+            return None
+        properties = event.get("properties") or {}
+        api_key = event.get("api_key") or properties.get("token") or default_key
+        if not api_key:
+            return None
+        parsed.append((api_key, event))
+    return parsed or None
+
+
+# Histogram buckets: request/upstream latency (seconds) and response size (bytes)
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+# Upstream hosts, labelled by service in the metrics
+UPSTREAM_SERVICES = {
+    "us.i.posthog.com": "posthog",
+    "us-assets.i.posthog.com": "posthog",
+    "api.policyengine.org": "policyengine",
+}
+
+
+class Histogram:
+    """Cumulative-on-render Prometheus histogram keyed by a label tuple."""
+
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        self.series = {}  # labels -> [per-bucket counts..., +Inf count, sum]
+
+    def observe(self, labels: tuple, value: float):
+        import bisect
+
+        counts = self.series.get(labels)
+        if counts is None:
+            counts = self.series[labels] = [0] * (len(self.buckets) + 2)
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        counts[-1] += value
+
+    def render(self, name: str, label_names: tuple) -> list[str]:
+        lines = [f"# TYPE {name} histogram"]
+        for labels, counts in sorted(self.series.items()):
+            base = ",".join(f'{k}="{v}"' for k, v in zip(label_names, labels))
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += count
+                lines.append(f'{name}_bucket{{{base},le="{bound}"}} {cumulative}')
+            lines.append(f"{name}_sum{{{base}}} {counts[-1]:.6f}")
+            lines.append(f"{name}_count{{{base}}} {cumulative}")
+        return lines
+
+
+class AppMetrics:
+    """Request and upstream metrics for create_app, rendered as Prometheus text."""
+
+    def __init__(self):
+        self.requests = Histogram(LATENCY_BUCKETS)  # (route, method, status)
+        self.sizes = Histogram(SIZE_BUCKETS)  # (route,)
+        self.upstream = Histogram(LATENCY_BUCKETS)  # (service, outcome)
+        self.in_flight = {}  # route group -> count
+
+    def observe_upstream(self, host: str, outcome: str, seconds: float):
+        service = UPSTREAM_SERVICES.get(host) or ("supabase" if "supabase" in host else host)
+        self.upstream.observe((service, outcome), seconds)
+
+    def render(self) -> str:
+        lines = self.requests.render("tracker_request_duration_seconds", ("route", "method", "status"))
+        lines += self.sizes.render("tracker_response_size_bytes", ("route",))
+        lines += self.upstream.render("tracker_upstream_duration_seconds", ("service", "outcome"))
+        lines.append("# TYPE tracker_requests_in_flight gauge")
+        lines += [f'tracker_requests_in_flight{{group="{group}"}} {n}' for group, n in sorted(self.in_flight.items())]
+        return "\n".join(lines) + "\n"
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording latency, size and in-flight counts.
+
+    Routes are labelled by their template (e.g. /api/state/{state}); the
+    catch-all SPA route is split into /_tracker assets and everything else,
+    and its 404s show up under status="404". With access_log, one JSON line
+    per request is printed.
+    """
+
+    def __init__(self, app, metrics: AppMetrics, access_log: bool = False):
+        self.app = app
+        self.metrics = metrics
+        self.access_log = access_log
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        import time
+
+        path = scope["path"]
+        group = "api" if path.startswith("/api/") else "ingest" if path.startswith("/ingest/") else "static"
+        in_flight = self.metrics.in_flight
+        in_flight[group] = in_flight.get(group, 0) + 1
+        status = 500
+        size = 0
+
+        async def send_wrapper(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            in_flight[group] -= 1
+            route = self.route_label(scope)
+            self.metrics.requests.observe((route, scope["method"], status), elapsed)
+            self.metrics.sizes.observe((route,), size)
+            if self.access_log:
+                self.log(scope, route, status, elapsed, size)
+
+    @staticmethod
+    def route_label(scope) -> str:
+        route = getattr(scope.get("route"), "path", None)
+        if route is None:
+            return "unmatched"
+        if route == "/{full_path:path}":
+            return "/_tracker/{asset}" if scope["path"].startswith("/_tracker/") else "/{spa}"
+        return route
+
+    @staticmethod
+    def log(scope, route: str, status: int, elapsed: float, size: int):
+        import json
+
+        headers = dict(scope.get("headers") or [])
+        forwarded = proxy_client_ip(headers.get(b"x-forwarded-for", b"").decode("latin-1"))
+        print(json.dumps({
+            "method": scope["method"],
+            "path": scope["path"],
+            "route": route,
+            "status": status,
+            "duration_ms": round(elapsed * 1000, 2),
+            "bytes": size,
+            "client": forwarded or (scope.get("client") or [None])[0],
+            "user_agent": headers.get(b"user-agent", b"").decode("latin-1") or None,
+        }, separators=(",", ":")))
+
+
+def proxy_client_ip(forwarded_for: str) -> str | None:
+    """Client address from X-Forwarded-For, as appended by Modal's proxy.
+
+    Only the right-most entry is trusted: anything before it came from the
+    caller, who can put whatever they like there.
+    """
+    hops = [hop.strip() for hop in forwarded_for.split(",") if hop.strip()]
+    return hops[-1] if hops else None
+
+
+def create_app(dist_path: str = "/app/dist", static_manifest: bool | None = None, spool_volume=None):
+    """Build the FastAPI app serving the SPA, API routes and analytics proxy.
+
+    With static_manifest (default; STATIC_MANIFEST=0 disables it) dist/ is
+    served from memory via build_static_manifest; otherwise files are read
+    from disk per request with FileResponse/StaticFiles. spool_volume is the
+    modal.Volume mounted at BILL_SPOOL_MOUNT, if any; bill request jobs are
+    spooled there so they outlive the container.
+    """
     from fastapi import FastAPI, HTTPException, Request
     from fastapi.staticfiles import StaticFiles
-    from fastapi.responses import FileResponse, Response
+    from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
+    from starlette.background import BackgroundTask
     from pydantic import BaseModel
+    from collections import OrderedDict, deque
+    import asyncio
+    import contextlib
+    import hashlib
     import httpx
+    import importlib.util
     import json
     import os
+    import random
+    import time
+
+    # Coroutines run in order when the container starts / shuts down
+    startup_hooks = []
+    shutdown_hooks = []
+
+    @contextlib.asynccontextmanager
+    async def lifespan(_app):
+        for hook in startup_hooks:
+            await hook()
+        yield
+        for hook in shutdown_hooks:
+            await hook()
+
+    api = FastAPI(lifespan=lifespan)
 
-    api = FastAPI()
-    http_client = httpx.AsyncClient()
+    # Per-route latency/size histograms and upstream timings for /metrics
+    # (METRICS=0 disables; ACCESS_LOG=1 adds one JSON log line per request).
+    # /metrics and the other operational stats endpoints require METRICS_TOKEN
+    # as a bearer token (404 when unset): they aren't for the public modal.run host
+    metrics = AppMetrics()
+    METRICS_ENABLED = os.environ.get("METRICS", "1") != "0"
+    METRICS_TOKEN = os.environ.get("METRICS_TOKEN")
 
-    dist_path = "/app/dist"
+    def require_metrics_token(request: Request):
+        """Gate for operational endpoints: 404 unless METRICS_TOKEN is set, then bearer auth."""
+        import hmac
 
-    # Load valid routes generated by prerender script
+        if not METRICS_TOKEN:
+            raise HTTPException(status_code=404, detail="Not Found")
+        if not hmac.compare_digest(request.headers.get("authorization", ""), f"Bearer {METRICS_TOKEN}"):
+            raise HTTPException(status_code=401, detail="Unauthorized")
+    if METRICS_ENABLED:
+        api.add_middleware(MetricsMiddleware, metrics=metrics, access_log=os.environ.get("ACCESS_LOG", "0") == "1")
+
+    async def upstream_request_started(request):
+        request.extensions["metrics_start"] = time.perf_counter()
+
+    async def upstream_response_received(response):
+        # Time to response headers; streamed bodies are relayed afterwards
+        start = response.request.extensions.get("metrics_start")
+        if start is not None:
+            outcome = f"{response.status_code // 100}xx"
+            metrics.observe_upstream(response.request.url.host, outcome, time.perf_counter() - start)
+
+    upstream_hooks = {"request": [upstream_request_started], "response": [upstream_response_received]}
+    http_client = httpx.AsyncClient(event_hooks=upstream_hooks)
+
+    if static_manifest is None:
+        static_manifest = os.environ.get("STATIC_MANIFEST", "1") != "0"
+
+    # Load valid routes generated by prerender script. The route refresher
+    # swaps in a new table as bills are published, so readers always look up
+    # route_table["valid"] rather than holding on to the set.
     _routes_file = f"{dist_path}/_valid_routes.json"
-    valid_routes = set(json.load(open(_routes_file))) if os.path.isfile(_routes_file) else set()
+    baked_routes = frozenset(json.load(open(_routes_file))) if os.path.isfile(_routes_file) else frozenset()
+    route_table = {"valid": baked_routes, "bills": {}}
+
+    static_files = build_static_manifest(dist_path) if static_manifest else None
+
+    class MemoryResponse(Response):
+        """Response whose body is already bytes or a memoryview (mmap)."""
+
+        def render(self, content):
+            if isinstance(content, (bytes, memoryview)):
+                return content
+            return super().render(content)
 
-    # Serve static assets (renamed from assets/ to _tracker/ to avoid collisions with proxy host)
-    if os.path.exists(f"{dist_path}/_tracker"):
-        api.mount("/_tracker", StaticFiles(directory=f"{dist_path}/_tracker"), name="tracker_assets")
+    def static_response(entry: dict, request: Request):
+        body, etag, headers = entry["body"], entry["etag"], {"Cache-Control": entry["cache_control"]}
+        if entry["encodings"]:
+            # Caches must key on Accept-Encoding whichever variant we pick
+            headers["Vary"] = "Accept-Encoding"
+            accepted = accepted_encodings(request.headers.get("accept-encoding"))
+            for encoding, _ in STATIC_ENCODINGS:
+                variant = entry["encodings"].get(encoding)
+                if variant and encoding in accepted:
+                    body, etag = variant["body"], variant["etag"]
+                    headers["Content-Encoding"] = encoding
+                    break
+        headers["ETag"] = etag
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+            headers.pop("Content-Encoding", None)
+            return Response(status_code=304, headers=headers)
+        return MemoryResponse(content=body, media_type=entry["content_type"], headers=headers)
+
+    # Serve static assets (renamed from assets/ to _tracker/ to avoid collisions with proxy host).
+    # With the manifest, serve_spa serves them from memory instead.
+    class CachedStaticFiles(StaticFiles):
+        """StaticFiles with the cache_control_for() policy."""
+
+        def file_response(self, full_path, *args, **kwargs):
+            response = super().file_response(full_path, *args, **kwargs)
+            rel_path = os.path.relpath(full_path, dist_path).replace(os.sep, "/")
+            response.headers["Cache-Control"] = cache_control_for(rel_path, response.media_type or "")
+            return response
+
+    if not static_manifest and os.path.exists(f"{dist_path}/_tracker"):
+        api.mount("/_tracker", CachedStaticFiles(directory=f"{dist_path}/_tracker"), name="tracker_assets")
 
     # PostHog reverse proxy — routes analytics through our domain to avoid ad blockers
     POSTHOG_HOST = "https://us.i.posthog.com"
     POSTHOG_ASSETS_HOST = "https://us-assets.i.posthog.com"
 
+    # Dedicated pool for analytics so slow PostHog responses can't starve the
+    # shared client; HTTP/2 multiplexes requests when the h2 package is present
+    posthog_client = httpx.AsyncClient(
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=30.0),
+        timeout=httpx.Timeout(10.0, connect=3.0),
+        event_hooks=upstream_hooks,
+    )
+    # Hop-by-hop headers are per-connection and must not be forwarded
+    HOP_BY_HOP_HEADERS = {
+        "connection", "keep-alive", "proxy-authenticate", "proxy-authorization",
+        "te", "trailer", "transfer-encoding", "upgrade",
+    }
+
+    async def close_http_clients():
+        await posthog_client.aclose()
+        await http_client.aclose()
+
+    # Optional server-side batching of capture events (POSTHOG_BATCHING=1):
+    # the browser gets an immediate {"status": 1} and events are flushed to
+    # PostHog's /batch/ endpoint by size or time, and on shutdown.
+    POSTHOG_BATCHING = os.environ.get("POSTHOG_BATCHING", "0") == "1"
+    POSTHOG_BATCH_SIZE = int(os.environ.get("POSTHOG_BATCH_SIZE", "100"))
+    POSTHOG_FLUSH_INTERVAL = float(os.environ.get("POSTHOG_FLUSH_INTERVAL", "2.0"))
+    POSTHOG_QUEUE_MAX = int(os.environ.get("POSTHOG_QUEUE_MAX", "10000"))
+    ingest_queue = deque()  # (api_key, event)
+    ingest_flush_needed = asyncio.Event()
+    ingest_stats = {"enqueued": 0, "flushed": 0, "dropped": 0, "batches": 0, "flush_failures": 0}
+
+    def client_ip(request: Request) -> str | None:
+        forwarded = proxy_client_ip(request.headers.get("x-forwarded-for", ""))
+        if forwarded:
+            return forwarded
+        return request.client.host if request.client else None
+
+    def enqueue_events(events: list, ip: str | None):
+        for api_key, event in events:
+            if len(ingest_queue) >= POSTHOG_QUEUE_MAX:
+                ingest_stats["dropped"] += 1
+                continue
+            # Events now reach PostHog from our IP; keep the visitor's for geoip
+            if ip:
+                event.setdefault("properties", {}).setdefault("$ip", ip)
+            ingest_queue.append((api_key, event))
+            ingest_stats["enqueued"] += 1
+        if len(ingest_queue) >= POSTHOG_BATCH_SIZE:
+            ingest_flush_needed.set()
+
+    async def flush_ingest_queue():
+        while ingest_queue:
+            chunk = [ingest_queue.popleft() for _ in range(min(POSTHOG_BATCH_SIZE, len(ingest_queue)))]
+            by_key = {}
+            for api_key, event in chunk:
+                by_key.setdefault(api_key, []).append((api_key, event))
+
+            groups = list(by_key.items())
+            for i, (api_key, items) in enumerate(groups):
+                try:
+                    response = await posthog_client.post(
+                        f"{POSTHOG_HOST}/batch/",
+                        json={"api_key": api_key, "batch": [event for _, event in items]},
+                    )
+                    response.raise_for_status()
+                    ingest_stats["flushed"] += len(items)
+                    ingest_stats["batches"] += 1
+                except httpx.HTTPError as exc:
+                    ingest_stats["flush_failures"] += 1
+                    status = exc.response.status_code if isinstance(exc, httpx.HTTPStatusError) else None
+                    if status is not None and status < 500 and status != 429:
+                        # Rejected outright (bad key, invalid payload): retrying can't help
+                        ingest_stats["dropped"] += len(items)
+                        continue
+                    # Transient: requeue this group and every one not yet sent, once
+                    # there's room; the next interval retries them
+                    unsent = [item for _, group in groups[i:] for item in group]
+                    room = max(0, POSTHOG_QUEUE_MAX - len(ingest_queue))
+                    ingest_queue.extendleft(reversed(unsent[:room]))
+                    ingest_stats["dropped"] += max(0, len(unsent) - room)
+                    return
+
+    async def ingest_flusher():
+        while True:
+            try:
+                await asyncio.wait_for(ingest_flush_needed.wait(), timeout=POSTHOG_FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            ingest_flush_needed.clear()
+            await flush_ingest_queue()
+
+    flusher_task = None
+
+    async def start_ingest_flusher():
+        nonlocal flusher_task
+        flusher_task = asyncio.create_task(ingest_flusher())
+
+    async def stop_ingest_flusher():
+        if flusher_task:
+            flusher_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await flusher_task
+        # Final flush before the HTTP clients close
+        await flush_ingest_queue()
+
+    if POSTHOG_BATCHING:
+        startup_hooks.append(start_ingest_flusher)
+        shutdown_hooks.append(stop_ingest_flusher)
+
+    if METRICS_ENABLED and METRICS_TOKEN:
+        @api.get("/metrics")
+        async def metrics_endpoint(request: Request):
+            """Prometheus text exposition of the request and upstream metrics."""
+            require_metrics_token(request)
+            return Response(content=metrics.render(), media_type="text/plain; version=0.0.4")
+
+    @api.get("/api/ingest-stats")
+    async def ingest_stats_endpoint(request: Request):
+        require_metrics_token(request)
+        return {
+            "batching": POSTHOG_BATCHING,
+            "queue_depth": len(ingest_queue),
+            "queue_max": POSTHOG_QUEUE_MAX,
+            **ingest_stats,
+        }
+
     class BillAnalysisRequest(BaseModel):
         state: str
         bill_number: str
@@ -98,7 +649,12 @@ def web():
         subscribe_newsletter: bool = False
         request_source: str | None = None
 
-    async def store_request(payload: BillAnalysisRequest, request: Request):
+        @property
+        def normalized_email(self) -> str:
+            """Email as stored and compared: dedup and throttling ignore case and padding."""
+            return self.requester_email.strip().lower()
+
+    async def store_request(payload: BillAnalysisRequest, origin: str, user_agent: str | None):
         supabase_url = os.environ.get("SUPABASE_URL")
         supabase_key = os.environ.get("SUPABASE_KEY")
         if not supabase_url or not supabase_key:
@@ -109,11 +665,11 @@ def web():
             "bill_number": payload.bill_number,
             "title": payload.title,
             "bill_url": payload.bill_url,
-            "requester_email": payload.requester_email,
+            "requester_email": payload.normalized_email,
             "subscribe_newsletter": payload.subscribe_newsletter,
             "request_source": payload.request_source,
-            "origin": str(request.base_url).rstrip("/"),
-            "user_agent": request.headers.get("user-agent"),
+            "origin": origin,
+            "user_agent": user_agent,
         }
 
         response = await http_client.post(
@@ -159,6 +715,145 @@ def web():
         })
         return True
 
+    # Background jobs for bill requests: notification emails always, the
+    # Supabase insert too with BILL_REQUEST_ASYNC_STORE=1. Jobs retry with
+    # exponential backoff. Jobs still queued at shutdown (including ones
+    # waiting out a backoff) are spooled to disk and re-queued on the next
+    # startup with their attempt count intact; ones that exhaust retries go to
+    # failed/ under the spool dir, which is never replayed. Only a spool on
+    # spool_volume survives the container; the /tmp default just covers
+    # restarts within one.
+    BILL_REQUEST_WORKERS = int(os.environ.get("BILL_REQUEST_WORKERS", "2"))
+    BILL_REQUEST_MAX_ATTEMPTS = int(os.environ.get("BILL_REQUEST_MAX_ATTEMPTS", "5"))
+    BILL_REQUEST_ASYNC_STORE = os.environ.get("BILL_REQUEST_ASYNC_STORE", "0") == "1"
+    BILL_REQUEST_SPOOL_DIR = os.environ.get(
+        "BILL_REQUEST_SPOOL_DIR", BILL_SPOOL_MOUNT if spool_volume else "/tmp/bill-request-spool"
+    )
+    bill_jobs = asyncio.Queue(maxsize=int(os.environ.get("BILL_REQUEST_QUEUE_MAX", "1000")))
+    bill_job_tasks = set()
+
+    async def run_bill_job(job: dict):
+        payload = BillAnalysisRequest(**job["payload"])
+        if job["kind"] == "store":
+            await store_request(payload, job["origin"], job["user_agent"])
+        else:
+            # resend is synchronous; keep it off the event loop
+            start = time.perf_counter()
+            try:
+                await asyncio.to_thread(send_notification_email, payload)
+            except Exception:
+                metrics.observe_upstream("resend", "error", time.perf_counter() - start)
+                raise
+            metrics.observe_upstream("resend", "ok", time.perf_counter() - start)
+
+    BILL_REQUEST_FAILED_DIR = os.path.join(BILL_REQUEST_SPOOL_DIR, "failed")
+
+    def spool_bill_job(job: dict, failed: bool = False):
+        spool_dir = BILL_REQUEST_FAILED_DIR if failed else BILL_REQUEST_SPOOL_DIR
+        os.makedirs(spool_dir, exist_ok=True)
+        name = f"{time.time():.6f}-{job['kind']}-{os.getpid()}-{id(job)}.json"
+        tmp_path = os.path.join(spool_dir, f".{name}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(job, f)
+        os.replace(tmp_path, os.path.join(spool_dir, name))
+
+    def enqueue_bill_job(job: dict) -> bool:
+        try:
+            bill_jobs.put_nowait(job)
+            return True
+        except asyncio.QueueFull:
+            spool_bill_job(job)
+            return False
+
+    async def retry_bill_job_later(job: dict, delay: float):
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            # Shutting down mid-backoff: keep the job for the next container
+            spool_bill_job(job)
+            raise
+        enqueue_bill_job(job)
+
+    async def sync_spool(method: str):
+        if spool_volume is None:
+            return
+        try:
+            await asyncio.to_thread(getattr(spool_volume, method))
+        except Exception as exc:
+            print(f"Bill request spool {method} failed: {exc}")
+
+    async def bill_job_worker():
+        while True:
+            job = await bill_jobs.get()
+            try:
+                await run_bill_job(job)
+            except asyncio.CancelledError:
+                spool_bill_job(job)
+                raise
+            except Exception as exc:
+                job["attempts"] = job.get("attempts", 0) + 1
+                job["last_error"] = str(exc)[:500]
+                if job["attempts"] >= BILL_REQUEST_MAX_ATTEMPTS:
+                    # Set aside for inspection; retrying on every start won't help
+                    spool_bill_job(job, failed=True)
+                    print(f"Bill request job failed {job['attempts']} times, moved to {BILL_REQUEST_FAILED_DIR}")
+                else:
+                    delay = min(2 ** job["attempts"], 300) * random.uniform(0.5, 1.5)
+                    task = asyncio.create_task(retry_bill_job_later(job, delay))
+                    bill_job_tasks.add(task)
+                    task.add_done_callback(bill_job_tasks.discard)
+            finally:
+                bill_jobs.task_done()
+
+    async def start_bill_jobs():
+        # Replay jobs spooled by earlier containers or failed retries. Two
+        # containers starting together can both see a job; the commit right
+        # after replay keeps that window short.
+        await sync_spool("reload")
+        replayed = False
+        if os.path.isdir(BILL_REQUEST_SPOOL_DIR):
+            for name in sorted(os.listdir(BILL_REQUEST_SPOOL_DIR)):
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(BILL_REQUEST_SPOOL_DIR, name)
+                try:
+                    with open(path) as f:
+                        job = json.load(f)
+                except (OSError, ValueError):
+                    continue
+                if job.get("attempts", 0) >= BILL_REQUEST_MAX_ATTEMPTS:
+                    # Spooled before exhausted jobs went to failed/
+                    os.makedirs(BILL_REQUEST_FAILED_DIR, exist_ok=True)
+                    os.replace(path, os.path.join(BILL_REQUEST_FAILED_DIR, name))
+                    replayed = True
+                    continue
+                if bill_jobs.full():
+                    break
+                bill_jobs.put_nowait(job)
+                os.remove(path)
+                replayed = True
+        if replayed:
+            await sync_spool("commit")
+        for _ in range(BILL_REQUEST_WORKERS):
+            task = asyncio.create_task(bill_job_worker())
+            bill_job_tasks.add(task)
+            task.add_done_callback(bill_job_tasks.discard)
+
+    async def stop_bill_jobs():
+        try:
+            await asyncio.wait_for(bill_jobs.join(), timeout=10)
+        except asyncio.TimeoutError:
+            pass
+        for task in list(bill_job_tasks):
+            task.cancel()
+        await asyncio.gather(*bill_job_tasks, return_exceptions=True)
+        while not bill_jobs.empty():
+            spool_bill_job(bill_jobs.get_nowait())
+        await sync_spool("commit")
+
+    startup_hooks.append(start_bill_jobs)
+    shutdown_hooks.append(stop_bill_jobs)
+
     @api.api_route("/ingest/{path:path}", methods=["GET", "POST", "OPTIONS"])
     async def posthog_proxy(path: str, request: Request):
         # Static assets come from a different host
@@ -167,71 +862,671 @@ def web():
         else:
             target = f"{POSTHOG_HOST}/{path}"
 
+        if POSTHOG_BATCHING and request.method == "POST" and path.strip("/") in POSTHOG_CAPTURE_PATHS:
+            events = parse_capture_events(
+                await request.body(),
+                request.headers.get("content-type", ""),
+                request.query_params.get("compression"),
+            )
+            if events:
+                enqueue_events(events, client_ip(request))
+                return JSONResponse({"status": 1})
+            # Undecodable payloads are proxied as-is (request.stream() replays the read body)
+
+        # Content-Length is kept so the streamed body isn't re-chunked upstream
         headers = {
             k: v for k, v in request.headers.items()
-            if k.lower() not in ("host", "content-length")
+            if k.lower() != "host" and k.lower() not in HOP_BY_HOP_HEADERS
         }
-        body = await request.body()
+        has_body = request.method == "POST"
 
-        resp = await http_client.request(
+        upstream_request = posthog_client.build_request(
             method=request.method,
             url=target,
             headers=headers,
-            content=body,
+            content=request.stream() if has_body else None,
             params=dict(request.query_params),
         )
-        # httpx decompresses gzip/br automatically, so strip hop-by-hop
-        # and encoding headers to avoid browser trying to double-decompress
-        excluded = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+        try:
+            resp = await posthog_client.send(upstream_request, stream=True)
+        except httpx.TimeoutException:
+            return Response(status_code=504, content="Analytics upstream timed out")
+        except httpx.HTTPError:
+            return Response(status_code=502, content="Analytics upstream unavailable")
+
+        # Raw (still-encoded) bytes are relayed, so Content-Encoding and
+        # Content-Length pass through unchanged
         resp_headers = {
             k: v for k, v in resp.headers.items()
-            if k.lower() not in excluded
+            if k.lower() not in HOP_BY_HOP_HEADERS
         }
-        return Response(
-            content=resp.content,
+
+        async def relay():
+            # Runs until the upstream body ends or Starlette cancels it on
+            # client disconnect; either way the upstream stream is released
+            try:
+                async for chunk in resp.aiter_raw():
+                    yield chunk
+            finally:
+                await resp.aclose()
+
+        return StreamingResponse(
+            relay(),
             status_code=resp.status_code,
             headers=resp_headers,
+            background=BackgroundTask(resp.aclose),
         )
 
-    @api.post("/api/bill-analysis-request")
-    async def bill_analysis_request(payload: BillAnalysisRequest, request: Request):
-        if "@" not in payload.requester_email or "." not in payload.requester_email.split("@")[-1]:
-            raise HTTPException(status_code=400, detail="Please enter a valid email address.")
+    # Household calculator cache — identical households (e.g. a bill's default
+    # household) are computed once upstream and then served from memory/disk.
+    # Every HOUSEHOLD_CACHE_PRUNE_EVERY writes the disk cache drops expired
+    # entries, then the oldest ones beyond HOUSEHOLD_CACHE_DISK_MAX files
+    POLICYENGINE_API = "https://api.policyengine.org"
+    HOUSEHOLD_CACHE_SIZE = int(os.environ.get("HOUSEHOLD_CACHE_SIZE", "512"))
+    HOUSEHOLD_CACHE_TTL = int(os.environ.get("HOUSEHOLD_CACHE_TTL", str(24 * 3600)))
+    HOUSEHOLD_CACHE_DIR = os.environ.get("HOUSEHOLD_CACHE_DIR", "/tmp/household-cache")
+    HOUSEHOLD_CACHE_DISK_MAX = int(os.environ.get("HOUSEHOLD_CACHE_DISK_MAX", "5000"))
+    HOUSEHOLD_CACHE_PRUNE_EVERY = max(1, int(os.environ.get("HOUSEHOLD_CACHE_PRUNE_EVERY", "100")))
+    household_memory = OrderedDict()  # key -> (cached_at, body bytes)
+    household_disk_writes = 0
+    household_inflight = {}  # key -> asyncio.Task for the upstream call
+
+    def household_cache_key(payload: dict) -> str:
+        canonical = json.dumps(
+            {"household": payload.get("household"), "policy": payload.get("policy") or {}},
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def household_cache_get(key: str):
+        """Return (body, source) from memory or disk, or (None, None)."""
+        entry = household_memory.get(key)
+        if entry and time.time() - entry[0] < HOUSEHOLD_CACHE_TTL:
+            household_memory.move_to_end(key)
+            return entry[1], "HIT"
+
+        path = os.path.join(HOUSEHOLD_CACHE_DIR, f"{key}.json")
+        try:
+            cached_at = os.path.getmtime(path)
+            if time.time() - cached_at < HOUSEHOLD_CACHE_TTL:
+                with open(path, "rb") as f:
+                    body = f.read()
+                household_cache_put(key, body, cached_at, persist=False)
+                return body, "HIT-DISK"
+        except OSError:
+            pass
+        return None, None
+
+    def prune_household_disk():
+        """Delete expired and leftover temp files, then the oldest beyond the cap."""
+        now = time.time()
+        live = []
+        try:
+            with os.scandir(HOUSEHOLD_CACHE_DIR) as it:
+                for entry in it:
+                    try:
+                        age = now - entry.stat().st_mtime
+                        if entry.name.endswith(".json"):
+                            if age >= HOUSEHOLD_CACHE_TTL:
+                                os.remove(entry.path)
+                            else:
+                                live.append((-age, entry.path))
+                        elif entry.name.endswith(".tmp") and age >= 60:
+                            # Left by a write that died; in-flight ones are younger
+                            os.remove(entry.path)
+                    except OSError:
+                        pass
+        except OSError:
+            return
+        if len(live) > HOUSEHOLD_CACHE_DISK_MAX:
+            live.sort()
+            for _, path in live[: len(live) - HOUSEHOLD_CACHE_DISK_MAX]:
+                with contextlib.suppress(OSError):
+                    os.remove(path)
+
+    def household_cache_put(key: str, body: bytes, cached_at: float | None = None, persist: bool = True):
+        nonlocal household_disk_writes
+        household_memory[key] = (cached_at or time.time(), body)
+        household_memory.move_to_end(key)
+        while len(household_memory) > HOUSEHOLD_CACHE_SIZE:
+            household_memory.popitem(last=False)
+
+        if persist:
+            try:
+                os.makedirs(HOUSEHOLD_CACHE_DIR, exist_ok=True)
+                tmp_path = os.path.join(HOUSEHOLD_CACHE_DIR, f".{key}.{os.getpid()}.tmp")
+                with open(tmp_path, "wb") as f:
+                    f.write(body)
+                os.replace(tmp_path, os.path.join(HOUSEHOLD_CACHE_DIR, f"{key}.json"))
+            except OSError:
+                return
+            household_disk_writes += 1
+            if household_disk_writes % HOUSEHOLD_CACHE_PRUNE_EVERY == 0:
+                prune_household_disk()
+
+    async def fetch_household(key: str, payload: dict):
+        response = await http_client.post(
+            f"{POLICYENGINE_API}/us/calculate",
+            json=payload,
+            timeout=httpx.Timeout(120.0, connect=10.0),
+        )
+        if response.status_code == 200:
+            household_cache_put(key, response.content)
+        return response.status_code, response.content
+
+    @api.post("/api/household")
+    async def household(request: Request):
+        """Cached proxy for the PolicyEngine household calculator."""
+        try:
+            payload = await request.json()
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Request body must be JSON.")
+        if not isinstance(payload, dict) or not isinstance(payload.get("household"), dict):
+            raise HTTPException(status_code=400, detail="Request must include a household object.")
+
+        key = household_cache_key(payload)
+        body, source = household_cache_get(key)
+        if body is not None:
+            return Response(content=body, media_type="application/json", headers={"X-Cache": source})
+
+        # Coalesce concurrent identical requests onto one upstream call
+        task = household_inflight.get(key)
+        source = "COALESCED" if task else "MISS"
+        if task is None:
+            task = asyncio.ensure_future(fetch_household(key, payload))
+            household_inflight[key] = task
+            task.add_done_callback(lambda _: household_inflight.pop(key, None))
+
+        try:
+            # shield: a disconnecting client must not cancel the shared call
+            status_code, body = await asyncio.shield(task)
+        except httpx.HTTPError as exc:
+            raise HTTPException(status_code=502, detail=f"Household API unavailable: {exc}") from exc
+
+        return Response(
+            content=body,
+            status_code=status_code,
+            media_type="application/json",
+            headers={"X-Cache": source},
+        )
+
+    # Read-through cache of the tracker's Supabase data, pre-shaped for the
+    # frontend. /api/bundle is what the map and state panels need (research
+    # rows plus impact summaries); /api/state/{ST} carries the full impact
+    # detail for one state's bills. Payloads are rebuilt only when a cheap
+    # probe of (id, computed_at, status) rows shows the data changed.
+    DATA_SUPABASE_URL = os.environ.get("SUPABASE_URL", "https://ffgngqlgfsvqartilful.supabase.co")
+    DATA_SUPABASE_KEY = os.environ.get("SUPABASE_ANON_KEY", SUPABASE_ANON_KEY)
+    DATA_CACHE_TTL = float(os.environ.get("DATA_CACHE_TTL", "60"))
+    # Heavy per-bill fields left out of the bundle; served by /api/state/{ST}
+    IMPACT_DETAIL_FIELDS = ("district_impacts", "decile_impact", "provisions")
+    RESEARCH_INTERNAL_FIELDS = ("legiscan_bill_id", "created_at", "updated_at")
+    data_cache = {"fingerprint": None, "checked_at": 0.0, "bundle": None, "states": {}}
+    data_lock = asyncio.Lock()
+
+    async def supabase_select(table: str, select: str) -> list:
+        response = await http_client.get(
+            f"{DATA_SUPABASE_URL}/rest/v1/{table}",
+            params={"select": select},
+            headers={"apikey": DATA_SUPABASE_KEY, "Authorization": f"Bearer {DATA_SUPABASE_KEY}"},
+            timeout=httpx.Timeout(20.0, connect=5.0),
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def parse_json_field(value, default):
+        # model_notes is a text column and provisions sometimes arrive as strings
+        if isinstance(value, str):
+            try:
+                value = json.loads(value)
+            except ValueError:
+                return default
+        return value if value is not None else default
+
+    def memory_entry(body: bytes, content_type: str, cache_control: str) -> dict:
+        """static_response() entry for a generated body, with gzip/br variants."""
+        import gzip
+
+        etag = hashlib.sha256(body).hexdigest()[:32]
+        encodings = {"gzip": {"body": gzip.compress(body, compresslevel=6, mtime=0), "etag": f'"{etag}-gzip"'}}
+        if importlib.util.find_spec("brotli"):
+            import brotli
+
+            encodings["br"] = {"body": brotli.compress(body, quality=5), "etag": f'"{etag}-br"'}
+        return {
+            "body": body,
+            "content_type": content_type,
+            "etag": f'"{etag}"',
+            "encodings": encodings,
+            "cache_control": cache_control,
+        }
+
+    def json_entry(payload) -> dict:
+        # Always revalidate: a publish must show up on the next load
+        body = json.dumps(payload, separators=(",", ":")).encode()
+        return memory_entry(body, "application/json", "public, no-cache")
+
+    def build_data_payloads(research: list, impacts: list):
+        research = [
+            {k: v for k, v in row.items() if k not in RESEARCH_INTERNAL_FIELDS}
+            for row in sorted(research, key=lambda r: r["id"])
+        ]
+        state_of = {row["id"]: row.get("state") for row in research}
+
+        summaries, details = [], {}
+        for row in sorted(impacts, key=lambda r: r["id"]):
+            full = {
+                **row,
+                "model_notes": parse_json_field(row.get("model_notes"), {}),
+                "provisions": parse_json_field(row.get("provisions"), []),
+            }
+            summary = {k: v for k, v in full.items() if k not in IMPACT_DETAIL_FIELDS}
+            summary["model_notes"] = {
+                k: v for k, v in full["model_notes"].items() if k != "impacts_by_year"
+            }
+            summaries.append(summary)
+            state = (state_of.get(row["id"]) or "").upper()
+            details.setdefault(state, []).append(full)
+
+        computed_at = max((row.get("computed_at") or "" for row in impacts), default="") or None
+        bundle = json_entry({"research": research, "impacts": summaries, "computed_at": computed_at})
+        states = {
+            state: json_entry({"state": state, "impacts": rows, "computed_at": computed_at})
+            for state, rows in details.items()
+        }
+        return bundle, states
+
+    async def refresh_data():
+        """Re-probe Supabase at most every DATA_CACHE_TTL; rebuild on change."""
+        async with data_lock:
+            if data_cache["bundle"] is not None and time.time() - data_cache["checked_at"] < DATA_CACHE_TTL:
+                return
+            try:
+                probe_research, probe_impacts = await asyncio.gather(
+                    supabase_select("research", "id,state,status,updated_at"),
+                    supabase_select("reform_impacts", "id,computed_at"),
+                )
+                fingerprint = hashlib.sha256(
+                    json.dumps([probe_research, probe_impacts], sort_keys=True).encode()
+                ).hexdigest()
+                if fingerprint != data_cache["fingerprint"]:
+                    research, impacts = await asyncio.gather(
+                        supabase_select("research", "*"),
+                        supabase_select("reform_impacts", "*"),
+                    )
+                    data_cache["bundle"], data_cache["states"] = build_data_payloads(research, impacts)
+                    data_cache["fingerprint"] = fingerprint
+            except (httpx.HTTPError, ValueError) as exc:
+                if data_cache["bundle"] is None:
+                    raise HTTPException(status_code=502, detail=f"Supabase unavailable: {exc}") from exc
+                # Keep serving the last good payloads; retry after the next TTL
+                print(f"Data refresh failed, serving cached payloads: {exc}")
+            data_cache["checked_at"] = time.time()
+
+    @api.get("/api/bundle")
+    async def data_bundle(request: Request):
+        """Research list and impact summaries for the initial page load."""
+        await refresh_data()
+        return static_response(data_cache["bundle"], request)
+
+    @api.get("/api/state/{state}")
+    async def data_state(state: str, request: Request):
+        """Full impact detail (districts, deciles, provisions) for one state."""
+        if len(state) != 2 or not state.isalpha():
+            raise HTTPException(status_code=404, detail="Unknown state.")
+        await refresh_data()
+        state = state.upper()
+        entry = data_cache["states"].get(state)
+        if entry is None:
+            entry = data_cache["states"][state] = json_entry(
+                {"state": state, "impacts": [], "computed_at": None}
+            )
+        return static_response(entry, request)
+
+    # Live route table — bills published after the image was built become
+    # routable within ROUTE_REFRESH_INTERVAL seconds (or at once through the
+    # signed webhook) instead of waiting for the next prerender + deploy.
+    # Until then they get a minimal generated page (title, description,
+    # canonical link) built from the SPA shell.
+    ROUTE_REFRESH_INTERVAL = float(os.environ.get("ROUTE_REFRESH_INTERVAL", "300"))
+    ROUTE_WEBHOOK_SECRET = os.environ.get("ROUTE_WEBHOOK_SECRET")
+    SITE_BASE_URL = "https://www.policyengine.org/us/state-legislative-tracker"
+    route_lock = asyncio.Lock()
+    route_stats = {"refreshed_at": None, "added": 0, "errors": 0}
+    lazy_pages = {}  # route key -> static_response() entry
+
+    async def refresh_routes() -> list:
+        """Poll Supabase for routable bills and swap in the new route table.
+
+        Returns the route keys that were not routable before.
+        """
+        async with route_lock:
+            try:
+                bills = await supabase_select("research", "id,state,type,status,title,description")
+            except (httpx.HTTPError, ValueError) as exc:
+                route_stats["errors"] += 1
+                print(f"Route refresh failed: {exc}")
+                return []
+
+            # Same filter as scripts/prerender.mjs
+            live = {}
+            for bill in bills:
+                state = (bill.get("state") or "").upper()
+                if bill.get("type") != "bill" or bill.get("status") == "in_review" or not state:
+                    continue
+                live[f"{state}/{bill['id']}"] = {**bill, "state": state}
+
+            # Baked routes stay valid: their prerendered pages are in the image
+            valid = baked_routes | live.keys() | {key.split("/")[0] for key in live}
+            added = sorted(valid - route_table["valid"])
+            route_table.update(valid=frozenset(valid), bills=live)
+            # Re-render lazily so edited titles/descriptions show up
+            lazy_pages.clear()
+            route_stats["refreshed_at"] = time.time()
+            route_stats["added"] += len(added)
+            if added:
+                print(f"Route table: {len(added)} new route(s): {', '.join(added[:10])}")
+            return added
+
+    async def route_refresher():
+        # First poll right away: the image may be hours older than the container
+        while True:
+            try:
+                await refresh_routes()
+            except Exception as exc:
+                # e.g. a malformed row; keep polling rather than freeze the table
+                route_stats["errors"] += 1
+                print(f"Route refresh failed: {exc!r}")
+            await asyncio.sleep(ROUTE_REFRESH_INTERVAL)
+
+    route_refresher_task = None
+
+    async def start_route_refresher():
+        nonlocal route_refresher_task
+        route_refresher_task = asyncio.create_task(route_refresher())
+
+    async def stop_route_refresher():
+        if route_refresher_task:
+            route_refresher_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await route_refresher_task
+
+    if ROUTE_REFRESH_INTERVAL > 0:
+        startup_hooks.append(start_route_refresher)
+        shutdown_hooks.append(stop_route_refresher)
+
+    def spa_shell() -> str:
+        if static_files is not None and "index.html" in static_files:
+            return bytes(static_files["index.html"]["body"]).decode()
+        with open(f"{dist_path}/index.html") as f:
+            return f.read()
+
+    def lazy_page(route_key: str):
+        """Minimal page for a bill published since the last prerender."""
+        import html
+        import re
+
+        bill = route_table["bills"].get(route_key)
+        if bill is None:
+            return None
+        entry = lazy_pages.get(route_key)
+        if entry is not None:
+            return entry
+
+        state = bill["state"]
+        title = f"{state}: {bill.get('title') or bill['id']} | PolicyEngine"
+        description = bill.get("description") or f"PolicyEngine analysis of {state} {bill.get('title') or bill['id']}"
+        canonical = f"{SITE_BASE_URL}/{route_key}"
+
+        page = spa_shell()
+        # Drop the homepage's prerendered crawler content before adding ours
+        page = re.sub(r"\s*<noscript>.*?</noscript>", "", page, flags=re.S)
+        page = re.sub(r'\s*<link rel="canonical"[^>]*>', "", page)
+        page = re.sub(r"<title>[^<]*</title>", lambda _: f"<title>{html.escape(title)}</title>", page, count=1)
+        page = re.sub(
+            r'<meta name="description" content="[^"]*"\s*/?>',
+            lambda _: f'<meta name="description" content="{html.escape(description)}" />',
+            page,
+            count=1,
+        )
+        page = page.replace("</head>", f'    <link rel="canonical" href="{html.escape(canonical)}" />\n  </head>', 1)
+        page = page.replace(
+            '<div id="root"></div>',
+            f'<div id="root"></div>\n    <noscript><h1>{html.escape(title)}</h1><p>{html.escape(description)}</p>'
+            f'<p><a href="{html.escape(canonical)}">View full analysis on PolicyEngine</a></p></noscript>',
+            1,
+        )
+
+        content_type = "text/html; charset=utf-8"
+        entry = lazy_pages[route_key] = memory_entry(
+            page.encode(), content_type, cache_control_for(f"{route_key}/index.html", content_type)
+        )
+        return entry
+
+    @api.post("/api/routes/refresh")
+    async def routes_refresh(request: Request):
+        """Webhook (e.g. a Supabase database webhook on research) to refresh routes now.
+
+        Signed with X-Signature: sha256=<hex HMAC-SHA256 of the raw body>
+        using ROUTE_WEBHOOK_SECRET.
+        """
+        import hmac
+
+        if not ROUTE_WEBHOOK_SECRET:
+            raise HTTPException(status_code=404, detail="Not Found")
+        body = await request.body()
+        expected = "sha256=" + hmac.new(ROUTE_WEBHOOK_SECRET.encode(), body, hashlib.sha256).hexdigest()
+        if not hmac.compare_digest(expected, request.headers.get("x-signature", "")):
+            raise HTTPException(status_code=401, detail="Invalid signature.")
+
+        added = await refresh_routes()
+        return {"added": added, "routes": len(route_table["valid"])}
+
+    @api.get("/api/routes/stats")
+    async def routes_stats(request: Request):
+        require_metrics_token(request)
+        return {
+            "routes": len(route_table["valid"]),
+            "baked": len(baked_routes),
+            "lazy_pages": len(lazy_pages),
+            "refresh_interval": ROUTE_REFRESH_INTERVAL,
+            **route_stats,
+        }
+
+    # Double-submit and abuse protection for bill requests. Token buckets
+    # (per client IP, then per email) shed floods before any Supabase or
+    # Resend work; identical (state, bill, email) requests within
+    # BILL_REQUEST_DEDUP_WINDOW seconds get the original result, and
+    # concurrent duplicates share one submission. BILL_REQUEST_DEDUP_SUPABASE=1
+    # also checks the table, so duplicates are caught across containers.
+    BILL_REQUEST_RATE_PER_MIN = float(os.environ.get("BILL_REQUEST_RATE_PER_MIN", "6"))
+    BILL_REQUEST_BURST = float(os.environ.get("BILL_REQUEST_BURST", "5"))
+    BILL_REQUEST_DEDUP_WINDOW = float(os.environ.get("BILL_REQUEST_DEDUP_WINDOW", "600"))
+    BILL_REQUEST_DEDUP_SUPABASE = os.environ.get("BILL_REQUEST_DEDUP_SUPABASE", "0") == "1"
+    RATE_BUCKETS_MAX = 10000
+    rate_buckets = OrderedDict()  # key -> (tokens, updated_at)
+    recent_bill_requests = OrderedDict()  # dedup key -> (completed_at, result)
+    pending_bill_requests = {}  # dedup key -> asyncio.Task for the submission
+
+    def take_token(key: str) -> float:
+        """Spend a token from key's bucket; 0, or seconds until one refills."""
+        now = time.monotonic()
+        tokens, updated = rate_buckets.pop(key, (BILL_REQUEST_BURST, now))
+        tokens = min(BILL_REQUEST_BURST, tokens + (now - updated) * BILL_REQUEST_RATE_PER_MIN / 60)
+        wait = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            wait = (1 - tokens) * 60 / BILL_REQUEST_RATE_PER_MIN
+        # Re-inserted at the end, so the least recently seen clients are evicted first
+        rate_buckets[key] = (tokens, now)
+        while len(rate_buckets) > RATE_BUCKETS_MAX:
+            rate_buckets.popitem(last=False)
+        return wait
+
+    def throttle(key: str):
+        wait = take_token(key)
+        if wait:
+            raise HTTPException(
+                status_code=429,
+                detail="Too many requests. Please try again shortly.",
+                headers={"Retry-After": str(int(wait) + 1)},
+            )
+
+    def bill_request_key(payload: BillAnalysisRequest) -> str:
+        canonical = "|".join([
+            payload.state.strip().upper(),
+            "".join(payload.bill_number.split()).upper(),
+            payload.normalized_email,
+        ])
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    async def find_recent_request(payload: BillAnalysisRequest) -> bool:
+        """Whether Supabase already has this request inside the dedup window."""
+        supabase_url = os.environ.get("SUPABASE_URL")
+        supabase_key = os.environ.get("SUPABASE_KEY")
+        if not supabase_url or not supabase_key:
+            return False
+        since = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(seconds=BILL_REQUEST_DEDUP_WINDOW)
+        response = await http_client.get(
+            f"{supabase_url}/rest/v1/bill_analysis_requests",
+            headers={"apikey": supabase_key, "Authorization": f"Bearer {supabase_key}"},
+            params={
+                "select": "id",
+                "state": f"eq.{payload.state}",
+                "bill_number": f"eq.{payload.bill_number}",
+                "requester_email": f"eq.{payload.normalized_email}",
+                "created_at": f"gte.{since.isoformat()}",
+                "limit": "1",
+            },
+        )
+        response.raise_for_status()
+        return bool(response.json())
+
+    async def submit_bill_request(payload: BillAnalysisRequest, job: dict) -> dict:
+        if BILL_REQUEST_DEDUP_SUPABASE:
+            try:
+                if await find_recent_request(payload):
+                    return {"stored": True, "notification_sent": False, "duplicate": True}
+            except (httpx.HTTPError, ValueError):
+                pass  # Fall through: a lookup failure must not block the request
 
         result = {
             "stored": False,
             "notification_sent": False,
         }
 
-        try:
-            result["stored"] = await store_request(payload, request)
-        except Exception as exc:
-            raise HTTPException(status_code=500, detail=f"Could not store request: {exc}") from exc
+        if BILL_REQUEST_ASYNC_STORE:
+            enqueue_bill_job({**job, "kind": "store"})
+            result["store_queued"] = True
+        else:
+            try:
+                result["stored"] = await store_request(payload, job["origin"], job["user_agent"])
+            except Exception as exc:
+                raise HTTPException(status_code=500, detail=f"Could not store request: {exc}") from exc
+
+        # Delivered by the background workers (spooled if the queue is full)
+        enqueue_bill_job({**job, "kind": "notify"})
+        result["notification_queued"] = True
+        return result
+
+    @api.post("/api/bill-analysis-request")
+    async def bill_analysis_request(request: Request):
+        from fastapi.exceptions import RequestValidationError
+        from pydantic import ValidationError
+
+        # Checked before the body is even read
+        throttle(f"ip:{client_ip(request)}")
 
         try:
-            result["notification_sent"] = send_notification_email(payload)
-        except Exception:
-            result["notification_sent"] = False
+            payload = BillAnalysisRequest.model_validate_json(await request.body())
+        except ValidationError as exc:
+            raise RequestValidationError([{**error, "loc": ("body", *error["loc"])} for error in exc.errors()]) from exc
+        if "@" not in payload.requester_email or "." not in payload.requester_email.split("@")[-1]:
+            raise HTTPException(status_code=400, detail="Please enter a valid email address.")
 
-        return result
+        key = bill_request_key(payload)
+        recent = recent_bill_requests.get(key)
+        if recent and time.monotonic() - recent[0] < BILL_REQUEST_DEDUP_WINDOW:
+            return {**recent[1], "duplicate": True}
+
+        # Coalesce concurrent duplicates onto the first submission
+        task = pending_bill_requests.get(key)
+        duplicate = task is not None
+        if task is None:
+            # Only new submissions count against the email's allowance, so a
+            # double-submit gets its duplicate result rather than a 429
+            throttle(f"email:{payload.normalized_email}")
+            job = {
+                "payload": payload.model_dump(),
+                "origin": str(request.base_url).rstrip("/"),
+                "user_agent": request.headers.get("user-agent"),
+                "attempts": 0,
+            }
+            task = asyncio.ensure_future(submit_bill_request(payload, job))
+            pending_bill_requests[key] = task
+
+            def finished(done):
+                pending_bill_requests.pop(key, None)
+                if not done.cancelled() and done.exception() is None:
+                    recent_bill_requests.pop(key, None)
+                    recent_bill_requests[key] = (time.monotonic(), done.result())
+                    while recent_bill_requests and (
+                        time.monotonic() - next(iter(recent_bill_requests.values()))[0] > BILL_REQUEST_DEDUP_WINDOW
+                    ):
+                        recent_bill_requests.popitem(last=False)
+
+            task.add_done_callback(finished)
+
+        # shield: a disconnecting client must not cancel the shared submission
+        result = await asyncio.shield(task)
+        return {**result, "duplicate": True} if duplicate else result
+
+    def serve_from_manifest(full_path: str, request: Request):
+        """serve_spa lookups against the in-memory manifest (no filesystem calls)."""
+        key = full_path.strip("/")
+        entry = static_files.get(key) if key else None
+        if entry is None:
+            # Pre-rendered directory page (e.g. /GA or /GA/ga-sb168), or the homepage
+            entry = static_files.get(f"{key}/index.html" if key else "index.html")
+        if entry is None:
+            parts = key.split("/")
+            route_key = parts[0].upper() if len(parts) == 1 else f"{parts[0].upper()}/{parts[1]}"
+            if route_key in route_table["valid"]:
+                entry = lazy_page(route_key) or static_files.get("index.html")
+        if entry is None:
+            return Response(status_code=404, content="Not Found")
+        return static_response(entry, request)
+
+    def file_response(file_path: str):
+        """FileResponse with the same Cache-Control policy as the manifest path."""
+        import mimetypes
+
+        rel_path = os.path.relpath(file_path, dist_path).replace(os.sep, "/")
+        content_type = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+        return FileResponse(file_path, headers={"Cache-Control": cache_control_for(rel_path, content_type)})
 
     @api.get("/{full_path:path}")
-    async def serve_spa(full_path: str):
+    async def serve_spa(full_path: str, request: Request):
         """Serve the SPA with proper 404s for invalid routes."""
+        if static_files is not None:
+            return serve_from_manifest(full_path, request)
+
         file_path = f"{dist_path}/{full_path}"
 
         # If it's a file that exists, serve it
         if os.path.isfile(file_path):
-            return FileResponse(file_path)
+            return file_response(file_path)
 
         # Check for pre-rendered directory page (e.g. /GA or /GA/ga-sb168)
         index_path = f"{file_path}/index.html"
         if os.path.isfile(index_path):
-            return FileResponse(index_path)
+            return file_response(index_path)
 
         # Root path — serve homepage
         if not full_path:
-            return FileResponse(f"{dist_path}/index.html")
+            return file_response(f"{dist_path}/index.html")
 
         # Check if route is valid (known state or state/bill-id)
         # Normalize: strip trailing slash, uppercase first segment for state match
@@ -239,10 +1534,26 @@ def web():
         parts = normalized.split("/")
         route_key = parts[0].upper() if len(parts) == 1 else f"{parts[0].upper()}/{parts[1]}"
 
-        if route_key in valid_routes:
-            return FileResponse(f"{dist_path}/index.html")
+        if route_key in route_table["valid"]:
+            entry = lazy_page(route_key)
+            if entry is not None:
+                return static_response(entry, request)
+            return file_response(f"{dist_path}/index.html")
 
         # Invalid route — return 404
         return Response(status_code=404, content="Not Found")
 
+    shutdown_hooks.append(close_http_clients)
     return api
+
+
+@app.function(
+    image=image,
+    allow_concurrent_inputs=100,
+    secrets=[modal.Secret.from_name(RUNTIME_SECRET_NAME)],
+    volumes={BILL_SPOOL_MOUNT: BILL_SPOOL_VOLUME},
+)
+@modal.asgi_app(label="state-legislative-tracker")
+def web():
+    """Serve static files with FastAPI."""
+    return create_app(spool_volume=BILL_SPOOL_VOLUME)
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark static serving in modal_app.py: in-memory manifest vs FileResponse.
+
+Builds the app twice from the same dist/ (create_app with static_manifest on
+and off, the same switch as STATIC_MANIFEST=0 in production), then drives
+identical request mixes through it with a fixed number of concurrent
+clients — by default 100, matching allow_concurrent_inputs on the Modal
+function — and reports requests/sec and latency percentiles.
+
+Requests go through httpx's in-process ASGI transport, so the numbers
+measure the app's own serving path (no network or Modal overhead).
+
+Usage:
+    npm run build && python scripts/bench_static.py
+    python scripts/bench_static.py --dist dist --requests 20000 --concurrency 100
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+def request_mix(dist_path: str) -> list[str]:
+    """URL paths to cycle through: homepage, hashed assets and SPA routes."""
+    paths = ["/"]
+    assets = sorted(Path(dist_path, "_tracker").glob("*")) if Path(dist_path, "_tracker").exists() else []
+    paths += [f"/_tracker/{a.name}" for a in assets[:6]]
+
+    routes_file = Path(dist_path, "_valid_routes.json")
+    if routes_file.exists():
+        routes = sorted(json.loads(routes_file.read_text()))
+        paths += [f"/{r}" for r in routes[:10]]
+    paths.append("/no-such-page/at-all")
+    return paths
+
+
+async def run_load(app, paths: list[str], total: int, concurrency: int) -> dict:
+    import httpx
+
+    latencies = []
+    counter = iter(range(total))
+
+    async def client_loop(client):
+        for i in counter:
+            path = paths[i % len(paths)]
+            start = time.perf_counter()
+            response = await client.get(path)
+            await response.aread()
+            latencies.append(time.perf_counter() - start)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Warm up (first hits populate OS caches for the FileResponse path)
+        for path in paths:
+            await client.get(path)
+        start = time.perf_counter()
+        await asyncio.gather(*(client_loop(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    ms = np.array(latencies) * 1000
+    return {
+        "requests": total,
+        "seconds": elapsed,
+        "rps": total / elapsed,
+        "p50_ms": float(np.percentile(ms, 50)),
+        "p95_ms": float(np.percentile(ms, 95)),
+        "p99_ms": float(np.percentile(ms, 99)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark modal_app static serving (manifest vs FileResponse)",
+    )
+    parser.add_argument("--dist", default="dist", help="Built SPA directory (default: dist)")
+    parser.add_argument("--requests", type=int, default=10000, help="Requests per mode")
+    parser.add_argument("--concurrency", type=int, default=100, help="Concurrent clients")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.dist):
+        print(f"Error: {args.dist} not found. Run `npm run build` first.")
+        return 1
+
+    from modal_app import create_app
+
+    paths = request_mix(args.dist)
+    print(f"Static serving benchmark: {args.requests} requests x {args.concurrency} concurrent")
+    print(f"  Paths: {len(paths)} ({', '.join(paths[:4])}, ...)")
+    print(f"\n  {'Mode':12} {'req/s':>10} {'p50 (ms)':>10} {'p95 (ms)':>10} {'p99 (ms)':>10}")
+
+    results = {}
+    for mode, manifest in (("fileresponse", False), ("manifest", True)):
+        app = create_app(dist_path=args.dist, static_manifest=manifest)
+        results[mode] = asyncio.run(run_load(app, paths, args.requests, args.concurrency))
+        r = results[mode]
+        print(f"  {mode:12} {r['rps']:10.0f} {r['p50_ms']:10.2f} {r['p95_ms']:10.2f} {r['p99_ms']:10.2f}")
+
+    speedup = results["manifest"]["rps"] / results["fileresponse"]["rps"]
+    print(f"\n  Manifest throughput: {speedup:.2f}x FileResponse")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
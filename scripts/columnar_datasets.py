@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Convert state .h5 datasets into a memory-mapped columnar layout.
+
+Microsimulation(dataset=<path>.h5) reads every array in the file up front.
+After a one-time conversion each variable/period lives in its own .npy file,
+and the simulation receives read-only memory maps instead: pages are only
+faulted in for the columns a reform actually reads.
+
+Layout (one directory per state):
+    <root>/<STATE>/manifest.json
+    <root>/<STATE>/<variable>/<period>.npy
+
+compute_impacts.py picks the columnar store up automatically when one exists
+for the state and is still in sync with the cached .h5 (same size and mtime).
+
+Usage:
+    python scripts/columnar_datasets.py --convert GA,NY
+    python scripts/columnar_datasets.py --convert all
+    python scripts/columnar_datasets.py --benchmark GA
+    python scripts/columnar_datasets.py --benchmark GA --variables household_weight,state_income_tax
+"""
+
+import argparse
+import json
+import os
+import re
+import resource
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Root directory for converted datasets (override with COLUMNAR_DATASET_DIR)
+COLUMNAR_DATASET_DIR = Path(
+    os.environ.get(
+        "COLUMNAR_DATASET_DIR",
+        Path.home() / ".cache" / "policyengine-columnar",
+    )
+)
+
+# Bump when the on-disk layout changes so stale stores are re-converted
+FORMAT_VERSION = 1
+
+# Period keys of a TIME_PERIOD_ARRAYS dataset ("2024", "2024-01", "2024-01-01")
+PERIOD_PATTERN = re.compile(r"^\d{4}(-\d{2}){0,2}$")
+
+
+# =============================================================================
+# CONVERSION
+# =============================================================================
+
+def _state_dir(state: str, root: Path | None = None) -> Path:
+    return Path(root or COLUMNAR_DATASET_DIR) / state.upper()
+
+
+def _to_storable(array: np.ndarray) -> np.ndarray:
+    """Coerce an h5 array into something np.load can memory-map."""
+    if array.dtype == object:
+        # Variable-length strings can't be memory-mapped; store fixed-width bytes
+        return np.array(
+            [v.encode() if isinstance(v, str) else bytes(v) for v in array],
+            dtype="S",
+        )
+    return array
+
+
+def _check_layout(f, h5_path: Path):
+    """Raise ValueError unless every variable is a group of period arrays.
+
+    The columnar store is served as a TIME_PERIOD_ARRAYS dataset, so flat
+    (ARRAYS) files with variables at the root, or groups keyed by anything
+    other than a period, can't be converted faithfully.
+    """
+    import h5py
+
+    problems = []
+    for variable in f.keys():
+        node = f[variable]
+        if not isinstance(node, h5py.Group):
+            problems.append(f"{variable} (array at the root)")
+            continue
+        bad = [key for key in node.keys() if not PERIOD_PATTERN.match(key)]
+        if bad or not node.keys():
+            problems.append(f"{variable} (keys: {', '.join(bad) or 'none'})")
+    if problems:
+        shown = "; ".join(problems[:5]) + (f"; +{len(problems) - 5} more" if len(problems) > 5 else "")
+        raise ValueError(
+            f"{h5_path}: not a TIME_PERIOD_ARRAYS dataset (variable/period groups); "
+            f"unrecognised variables: {shown}"
+        )
+
+
+def convert_dataset(h5_path: str, state: str, root: Path | None = None) -> Path:
+    """Write one state's .h5 into the columnar layout. Returns the state dir.
+
+    Raises ValueError, before anything is written, if the file isn't laid
+    out as variable/period groups.
+    """
+    import h5py
+
+    from compute_impacts import get_installed_version
+
+    h5_path = Path(h5_path)
+    target = _state_dir(state, root)
+    staging = target.with_name(f".{target.name}.tmp")
+
+    variables = {}
+    with h5py.File(h5_path, "r") as f:
+        _check_layout(f, h5_path)
+
+        if staging.exists():
+            shutil.rmtree(staging)
+        staging.mkdir(parents=True)
+
+        for variable in f.keys():
+            node = f[variable]
+            items = [(period, node[period][()]) for period in node.keys()]
+
+            variables[variable] = {}
+            (staging / variable).mkdir()
+            for period, array in items:
+                array = _to_storable(np.asarray(array))
+                rel = f"{variable}/{period}.npy"
+                np.save(staging / rel, array, allow_pickle=False)
+                variables[variable][period] = {
+                    "file": rel,
+                    "dtype": array.dtype.str,
+                    "shape": list(array.shape),
+                }
+
+    periods = sorted({p for v in variables.values() for p in v})
+    stat = h5_path.stat()
+    manifest = {
+        "format_version": FORMAT_VERSION,
+        "state": state.upper(),
+        "source": str(h5_path),
+        "source_size": stat.st_size,
+        "source_mtime": stat.st_mtime,
+        "policyengine_us_data_version": get_installed_version("policyengine-us-data"),
+        "time_period": int(periods[0]) if periods and periods[0].isdigit() else None,
+        "variables": variables,
+    }
+    (staging / "manifest.json").write_text(json.dumps(manifest, indent=2))
+
+    # Swap into place so readers never see a half-written store
+    if target.exists():
+        shutil.rmtree(target)
+    staging.rename(target)
+    return target
+
+
+def load_manifest(state: str, root: Path | None = None) -> dict | None:
+    manifest_path = _state_dir(state, root) / "manifest.json"
+    if not manifest_path.exists():
+        return None
+    return json.loads(manifest_path.read_text())
+
+
+def is_fresh(manifest: dict | None, h5_path: str) -> bool:
+    """True if the columnar store was converted from this exact .h5 file."""
+    if not manifest or manifest.get("format_version") != FORMAT_VERSION:
+        return False
+    stat = Path(h5_path).stat()
+    return (
+        manifest.get("source_size") == stat.st_size
+        and manifest.get("source_mtime") == stat.st_mtime
+    )
+
+
+# =============================================================================
+# LOADING
+# =============================================================================
+
+def load_columnar_arrays(state: str, root: Path | None = None) -> dict:
+    """Return {variable: {period: memmap}} for a converted state."""
+    state_dir = _state_dir(state, root)
+    manifest = load_manifest(state, root)
+    data = {}
+    for variable, periods in manifest["variables"].items():
+        data[variable] = {
+            period: np.load(state_dir / entry["file"], mmap_mode="r")
+            for period, entry in periods.items()
+        }
+    return data
+
+
+def columnar_dataset_class(state: str, root: Path | None = None):
+    """Build a policyengine-core Dataset class backed by the columnar store.
+
+    Pass the returned class as Microsimulation(dataset=...). Arrays handed to
+    the simulation are read-only memory maps, so unread columns never leave
+    disk.
+    """
+    from policyengine_core.data import Dataset
+
+    state_upper = state.upper()
+    manifest = load_manifest(state, root)
+    manifest_path = _state_dir(state, root) / "manifest.json"
+
+    class ColumnarStateDataset(Dataset):
+        name = f"{state.lower()}_columnar"
+        label = f"{state_upper} (columnar)"
+        data_format = Dataset.TIME_PERIOD_ARRAYS
+        time_period = manifest.get("time_period")
+        file_path = manifest_path
+
+        def load_dataset(self):
+            return load_columnar_arrays(state, root)
+
+    return ColumnarStateDataset
+
+
+def get_columnar_dataset(state: str, h5_path: str):
+    """Columnar Dataset class for the state, or None if not converted/stale."""
+    if not is_fresh(load_manifest(state), h5_path):
+        return None
+    return columnar_dataset_class(state)
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+def _evict_from_page_cache(paths: list[Path]):
+    """Ask the kernel to drop cached pages so each run starts cold."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+
+
+def _benchmark_child(fmt: str, state: str, variables: list[str]):
+    """Runs in a fresh interpreter: load once, calculate, report JSON."""
+    from policyengine_us import Microsimulation
+
+    from compute_impacts import get_state_dataset
+
+    h5_path = get_state_dataset(state)
+    dataset = columnar_dataset_class(state) if fmt == "columnar" else h5_path
+    year = load_manifest(state).get("time_period") or 2026
+
+    start = time.perf_counter()
+    sim = Microsimulation(dataset=dataset)
+    load_seconds = time.perf_counter() - start
+    for variable in variables:
+        sim.calculate(variable, year)
+    total_seconds = time.perf_counter() - start
+
+    print(json.dumps({
+        "format": fmt,
+        "load_seconds": load_seconds,
+        "total_seconds": total_seconds,
+        # ru_maxrss is KiB on Linux
+        "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }))
+
+
+def run_benchmark(state: str, variables: list[str], repeat: int):
+    from compute_impacts import get_state_dataset
+
+    h5_path = get_state_dataset(state)
+    if not is_fresh(load_manifest(state), h5_path):
+        print(f"  Converting {state.upper()} first...")
+        convert_dataset(h5_path, state)
+
+    state_dir = _state_dir(state)
+    files = {
+        "h5": [Path(h5_path)],
+        "columnar": list(state_dir.rglob("*.npy")),
+    }
+
+    results = {"h5": [], "columnar": []}
+    for _ in range(repeat):
+        for fmt in ("h5", "columnar"):
+            _evict_from_page_cache(files[fmt])
+            proc = subprocess.run(
+                [sys.executable, __file__, "--_bench-child", fmt, state,
+                 "--variables", ",".join(variables)],
+                capture_output=True,
+                text=True,
+            )
+            if proc.returncode != 0:
+                print(proc.stderr)
+                raise RuntimeError(f"Benchmark child failed for {fmt}")
+            results[fmt].append(json.loads(proc.stdout.strip().splitlines()[-1]))
+
+    print(f"\n  Benchmark: {state.upper()} ({repeat} cold runs each)")
+    print(f"  Variables: {', '.join(variables)}")
+    print(f"  {'Format':10} {'Load (s)':>10} {'Total (s)':>10} {'Max RSS (MB)':>14}")
+    for fmt, runs in results.items():
+        load = float(np.median([r["load_seconds"] for r in runs]))
+        total = float(np.median([r["total_seconds"] for r in runs]))
+        rss = float(np.median([r["max_rss_mb"] for r in runs]))
+        print(f"  {fmt:10} {load:10.2f} {total:10.2f} {rss:14.0f}")
+    return results
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Convert state datasets to a memory-mapped columnar layout",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+    python scripts/columnar_datasets.py --convert GA,NY
+    python scripts/columnar_datasets.py --convert all
+    python scripts/columnar_datasets.py --benchmark GA --repeat 5
+        """,
+    )
+    parser.add_argument("--convert", help="Comma-separated state codes, or 'all'")
+    parser.add_argument("--benchmark", help="State code to benchmark (.h5 vs columnar)")
+    parser.add_argument(
+        "--variables",
+        default="household_weight,employment_income,age",
+        help="Variables to calculate after loading (benchmark only)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Benchmark runs per format")
+    parser.add_argument("--_bench-child", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    variables = [v for v in args.variables.split(",") if v]
+
+    if args._bench_child:
+        fmt, state = args._bench_child
+        _benchmark_child(fmt, state, variables)
+        return 0
+
+    if not args.convert and not args.benchmark:
+        parser.print_help()
+        return 1
+
+    from compute_impacts import STATE_FIPS, get_state_dataset
+
+    if args.convert:
+        states = list(STATE_FIPS) if args.convert == "all" else args.convert.split(",")
+        print(f"Converting {len(states)} state dataset(s) into {COLUMNAR_DATASET_DIR}")
+        for state in states:
+            h5_path = get_state_dataset(state)
+            if is_fresh(load_manifest(state), h5_path):
+                print(f"  {state.upper()}: up to date")
+                continue
+            start = time.perf_counter()
+            try:
+                target = convert_dataset(h5_path, state)
+            except ValueError as e:
+                print(f"  {state.upper()}: skipped, {e}")
+                continue
+            print(f"  {state.upper()}: converted in {time.perf_counter() - start:.1f}s -> {target}")
+
+    if args.benchmark:
+        run_benchmark(args.benchmark, variables, args.repeat)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
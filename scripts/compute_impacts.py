@@ -14,6 +14,7 @@ Usage:
     python scripts/compute_impacts.py --reform-id sc-h4216
     python scripts/compute_impacts.py --list
     python scripts/compute_impacts.py --force --reform-id ut-sb60
+    python scripts/compute_impacts.py --aggregate-only
 """
 
 import argparse
@@ -41,6 +42,7 @@ from db_schema import (
     format_decile_impact,
     format_district_impact,
 )
+from result_cubes import find_result_cube, load_result_cube, save_result_cube
 
 # =============================================================================
 # CONFIGURATION
@@ -98,14 +100,21 @@ def get_supabase_client():
     return create_client(url, key)
 
 
-def load_reforms_from_db(supabase, reform_id=None):
-    """Load reform configs from database."""
+def load_reforms_from_db(supabase, reform_id=None, reform_ids=None, include_provisions=False):
+    """Load reform configs from database.
+
+    With include_provisions, each reform also carries its parsed provisions
+    list, fetched in the same query.
+    """
+    impact_columns = "reform_params, computed, provisions" if include_provisions else "reform_params, computed"
     query = supabase.table("research").select(
-        "id, state, title, description, url, reform_impacts(reform_params, computed)"
+        f"id, state, title, description, url, reform_impacts({impact_columns})"
     ).in_("type", ["bill", "blog"])
 
     if reform_id:
         query = query.eq("id", reform_id)
+    elif reform_ids:
+        query = query.in_("id", list(reform_ids))
 
     result = query.execute()
 
@@ -132,6 +141,12 @@ def load_reforms_from_db(supabase, reform_id=None):
             "computed": impact_data.get("computed", False),
         })
 
+        if include_provisions:
+            provisions = impact_data.get("provisions") or []
+            if isinstance(provisions, str):
+                provisions = json.loads(provisions)
+            reforms[-1]["provisions"] = provisions
+
     return reforms
 
 
@@ -161,6 +176,22 @@ def get_state_dataset(state: str) -> str:
     return dataset_path
 
 
+def get_simulation_dataset(state: str):
+    """Dataset argument for Microsimulation.
+
+    Prefers the memory-mapped columnar store written by columnar_datasets.py
+    when it is in sync with the cached .h5; otherwise returns the .h5 path.
+    """
+    from columnar_datasets import get_columnar_dataset
+
+    dataset_path = get_state_dataset(state)
+    columnar = get_columnar_dataset(state, dataset_path)
+    if columnar is not None:
+        print(f"    Using columnar dataset for {state.upper()}")
+        return columnar
+    return dataset_path
+
+
 def get_builtin_reform(reform_name: str):
     """Get a built-in reform class from policyengine-us by name."""
     # Map of supported built-in reforms
@@ -278,19 +309,25 @@ def create_reform_class(reform_params: dict):
     return DynamicReform
 
 
-def run_simulations(state: str, reform_params: dict, year: int = 2026):
+def run_simulations(state: str, reform_params: dict, year: int = 2026, baseline=None):
     """
     Run baseline and reform microsimulations.
 
+    Pass an existing baseline Microsimulation for the same state to reuse it
+    (its calculated variables stay cached across reforms).
+
     Returns tuple of (baseline, reformed) Microsimulation objects.
     """
     from policyengine_us import Microsimulation
 
-    state_dataset = get_state_dataset(state)
+    state_dataset = get_simulation_dataset(state)
     ReformClass = create_reform_class(reform_params)
 
-    print("    Running baseline simulation...")
-    baseline = Microsimulation(dataset=state_dataset)
+    if baseline is None:
+        print("    Running baseline simulation...")
+        baseline = Microsimulation(dataset=state_dataset)
+    else:
+        print("    Reusing baseline simulation...")
 
     print("    Running reform simulation...")
     reformed = Microsimulation(reform=ReformClass, dataset=state_dataset)
@@ -608,6 +645,50 @@ def compute_district_impacts(baseline, reformed, state: str, year: int = 2026) -
     return district_impacts
 
 
+def compute_all_impacts(baseline, reformed, state: str, year: int = 2026) -> dict:
+    """
+    Compute every impact stored in reform_impacts from one simulation pair.
+
+    Returns the impacts dict in the shape write_to_supabase() expects
+    (camelCase keys, districtImpacts only when district data exists).
+    """
+    print("  [2/6] Computing budgetary impact...")
+    budgetary_impact = compute_budgetary_impact(baseline, reformed, state, year)
+    print(f"        Revenue change: ${budgetary_impact['stateRevenueImpact']:,.0f}")
+
+    print("  [3/6] Computing poverty impact...")
+    poverty_impact = compute_poverty_impact(baseline, reformed, state, year)
+    print(f"        Baseline: {poverty_impact['baselineRate']:.2%} -> Reform: {poverty_impact['reformRate']:.2%}")
+
+    print("  [4/6] Computing child poverty impact...")
+    child_poverty_impact = compute_poverty_impact(baseline, reformed, state, year, child_only=True)
+
+    print("  [5/6] Computing winners/losers...")
+    winners_losers = compute_winners_losers(baseline, reformed, state, year)
+    gain_total = winners_losers['gainMore5Pct'] + winners_losers['gainLess5Pct']
+    lose_total = winners_losers['loseLess5Pct'] + winners_losers['loseMore5Pct']
+    print(f"        Winners: {gain_total:.1%} | No change: {winners_losers['noChange']:.1%} | Losers: {lose_total:.1%}")
+
+    print("  [6/6] Computing decile and district impacts...")
+    decile_impact = compute_decile_impact(baseline, reformed, state, year)
+    district_impacts = compute_district_impacts(baseline, reformed, state, year)
+
+    # Assemble results
+    impacts = {
+        "computed": True,
+        "computedAt": datetime.now(timezone.utc).isoformat(),
+        "budgetaryImpact": budgetary_impact,
+        "povertyImpact": poverty_impact,
+        "childPovertyImpact": child_poverty_impact,
+        "winnersLosers": winners_losers,
+        "decileImpact": decile_impact,
+    }
+    if district_impacts:
+        impacts["districtImpacts"] = district_impacts
+
+    return impacts
+
+
 # =============================================================================
 # DATABASE WRITE
 # =============================================================================
@@ -621,6 +702,14 @@ def get_installed_version(package_name: str) -> str:
         return "unknown"
 
 
+def get_model_versions() -> dict:
+    """Installed model and dataset versions, as stored with computed impacts."""
+    return {
+        "policyengine_us": get_installed_version("policyengine-us"),
+        "policyengine_us_data": get_installed_version("policyengine-us-data"),
+    }
+
+
 def get_effective_year_from_params(reform_params: dict) -> int:
     """Extract the earliest effective year from reform params."""
     earliest_year = 2100
@@ -644,14 +733,14 @@ def get_effective_year_from_params(reform_params: dict) -> int:
     return earliest_year if earliest_year < 2100 else 2026
 
 
-def _resolve_pe_us_version(supabase, reform_id: str, reform_params: dict) -> str:
+def _resolve_pe_us_version(supabase, reform_id: str, reform_params: dict, current_version: str | None = None) -> str:
     """Determine the policyengine-us version to store.
 
     On re-runs (--force) where reform_params haven't changed, preserve the
     existing version to avoid spuriously bumping it. The stored version acts
     as "minimum API version needed", not "version last computed with".
     """
-    current_version = get_installed_version("policyengine-us")
+    current_version = current_version or get_installed_version("policyengine-us")
 
     existing = supabase.table("reform_impacts").select(
         "policyengine_us_version, reform_params"
@@ -667,13 +756,17 @@ def _resolve_pe_us_version(supabase, reform_id: str, reform_params: dict) -> str
     return current_version
 
 
-def write_to_supabase(supabase, reform_id: str, impacts: dict, reform_params: dict, analysis_year: int, multi_year: bool = False):
+def write_to_supabase(supabase, reform_id: str, impacts: dict, reform_params: dict, analysis_year: int, multi_year: bool = False, versions: dict | None = None):
     """Write impacts to Supabase reform_impacts table.
 
     If multi_year=True, stores impacts in model_notes.impacts_by_year[year] instead of
     overwriting the main impact fields. This allows storing multiple years of impacts.
+
+    versions overrides the installed package versions (used by --aggregate-only,
+    where impacts come from a result cube computed under another version).
     """
-    pe_us_version = _resolve_pe_us_version(supabase, reform_id, reform_params)
+    versions = versions or get_model_versions()
+    pe_us_version = _resolve_pe_us_version(supabase, reform_id, reform_params, versions["policyengine_us"])
 
     if multi_year:
         import json
@@ -730,7 +823,7 @@ def write_to_supabase(supabase, reform_id: str, impacts: dict, reform_params: di
             "model_notes": model_notes,
             "policyengine_us_version": pe_us_version,
             "dataset_name": "policyengine-us-data",
-            "dataset_version": get_installed_version("policyengine-us-data"),
+            "dataset_version": versions["policyengine_us_data"],
         }
     else:
         model_notes = {
@@ -751,7 +844,7 @@ def write_to_supabase(supabase, reform_id: str, impacts: dict, reform_params: di
             "model_notes": model_notes,
             "policyengine_us_version": pe_us_version,
             "dataset_name": "policyengine-us-data",
-            "dataset_version": get_installed_version("policyengine-us-data"),
+            "dataset_version": versions["policyengine_us_data"],
         }
 
     result = supabase.table("reform_impacts").upsert(record).execute()
@@ -797,6 +890,9 @@ Examples:
 
     # Force recomputation
     python scripts/compute_impacts.py --force --reform-id ut-sb60
+
+    # Recompute metrics from saved result cubes (no simulation)
+    python scripts/compute_impacts.py --aggregate-only
         """
     )
     parser.add_argument(
@@ -825,6 +921,16 @@ Examples:
         action="store_true",
         help="Store impacts in impacts_by_year structure (for multi-year analysis)"
     )
+    parser.add_argument(
+        "--aggregate-only",
+        action="store_true",
+        help="Recompute metrics from saved result cubes instead of simulating"
+    )
+    parser.add_argument(
+        "--no-cube",
+        action="store_true",
+        help="Don't save the per-household result cube after simulating"
+    )
     args = parser.parse_args()
 
     # Require Supabase
@@ -869,8 +975,9 @@ Examples:
         print(f"ID: {reform_id} | State: {state.upper()}")
         print(f"{'-' * 60}")
 
-        # Skip if already computed (unless forced)
-        if not args.force and reform["computed"]:
+        # Skip if already computed (unless forced). Aggregate-only runs exist
+        # to refresh already-computed reforms, so they never skip.
+        if not args.force and not args.aggregate_only and reform["computed"]:
             print("  Already computed (use --force to recompute)")
             results[reform_id] = "skipped"
             continue
@@ -883,48 +990,35 @@ Examples:
                 sim_year = get_effective_year_from_params(reform["reform"])
             print(f"  Analysis year: {sim_year}")
 
-            # Run simulations
-            print("  [1/6] Running microsimulations...")
-            baseline, reformed = run_simulations(state, reform["reform"], sim_year)
+            versions = get_model_versions()
+
+            if args.aggregate_only:
+                print("  [1/6] Loading result cube...")
+                cube_path = find_result_cube(reform_id, state, sim_year, reform["reform"], versions)
+                if not cube_path:
+                    print("  No result cube found (run without --aggregate-only first)")
+                    results[reform_id] = "skipped (no cube)"
+                    continue
+                baseline, reformed, cube_meta = load_result_cube(cube_path)
+                versions = cube_meta["versions"]
+                print(f"        {cube_path} (policyengine-us {versions['policyengine_us']})")
+            else:
+                # Run simulations
+                print("  [1/6] Running microsimulations...")
+                baseline, reformed = run_simulations(state, reform["reform"], sim_year)
 
             # Compute all impacts
-            print("  [2/6] Computing budgetary impact...")
-            budgetary_impact = compute_budgetary_impact(baseline, reformed, state, sim_year)
-            print(f"        Revenue change: ${budgetary_impact['stateRevenueImpact']:,.0f}")
-
-            print("  [3/6] Computing poverty impact...")
-            poverty_impact = compute_poverty_impact(baseline, reformed, state, sim_year)
-            print(f"        Baseline: {poverty_impact['baselineRate']:.2%} -> Reform: {poverty_impact['reformRate']:.2%}")
-
-            print("  [4/6] Computing child poverty impact...")
-            child_poverty_impact = compute_poverty_impact(baseline, reformed, state, sim_year, child_only=True)
-
-            print("  [5/6] Computing winners/losers...")
-            winners_losers = compute_winners_losers(baseline, reformed, state, sim_year)
-            gain_total = winners_losers['gainMore5Pct'] + winners_losers['gainLess5Pct']
-            lose_total = winners_losers['loseLess5Pct'] + winners_losers['loseMore5Pct']
-            print(f"        Winners: {gain_total:.1%} | No change: {winners_losers['noChange']:.1%} | Losers: {lose_total:.1%}")
-
-            print("  [6/6] Computing decile and district impacts...")
-            decile_impact = compute_decile_impact(baseline, reformed, state, sim_year)
-            district_impacts = compute_district_impacts(baseline, reformed, state, sim_year)
-
-            # Assemble results
-            impacts = {
-                "computed": True,
-                "computedAt": datetime.now(timezone.utc).isoformat(),
-                "budgetaryImpact": budgetary_impact,
-                "povertyImpact": poverty_impact,
-                "childPovertyImpact": child_poverty_impact,
-                "winnersLosers": winners_losers,
-                "decileImpact": decile_impact,
-            }
-            if district_impacts:
-                impacts["districtImpacts"] = district_impacts
+            impacts = compute_all_impacts(baseline, reformed, state, sim_year)
+
+            if not args.aggregate_only and not args.no_cube:
+                cube_path = save_result_cube(
+                    reform_id, state, sim_year, reform["reform"], baseline, reformed, versions
+                )
+                print(f"  Result cube saved: {cube_path}")
 
             # Write to database
             print("  Writing to Supabase...")
-            write_to_supabase(supabase, reform_id, impacts, reform["reform"], sim_year, args.multi_year)
+            write_to_supabase(supabase, reform_id, impacts, reform["reform"], sim_year, args.multi_year, versions)
 
             # Set status to in_review (skip if already published to avoid taking bills offline)
             current_status = supabase.table("research").select("status").eq("id", reform_id).execute().data
@@ -0,0 +1,456 @@
+#!/usr/bin/env python3
+"""
+Drift sweep: recompute every published reform under the installed
+policyengine-us and diff the results against stored reform_impacts.
+
+Nothing is written to Supabase. Use this after bumping policyengine-us to
+see which published estimates moved, and by how much.
+
+Scheduling:
+- Reforms are grouped by state so each worker builds one baseline
+  Microsimulation per state and reuses it for every reform in that state
+- States are dispatched most-expensive first (largest datasets, most reforms)
+  so the slowest work never lands at the tail of the job
+
+Usage:
+    python scripts/drift_sweep.py
+    python scripts/drift_sweep.py --workers 4 --report drift.md
+    python scripts/drift_sweep.py --states GA,NY --budget-rtol 0.005
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Load environment variables from .env.local
+from dotenv import load_dotenv
+
+_script_dir = Path(__file__).parent
+_env_path = _script_dir.parent / ".env.local"
+if _env_path.exists():
+    load_dotenv(_env_path)
+
+from compute_impacts import (
+    STATE_DISTRICTS,
+    compute_all_impacts,
+    get_effective_year_from_params,
+    get_installed_version,
+    get_supabase_client,
+    run_simulations,
+)
+
+# Default tolerances. A metric drifts when |new - stored| exceeds its tolerance;
+# the drift score is that difference divided by the tolerance. Drift that has
+# no finite score (a district appearing or disappearing) gets score None and a
+# "reason", so the JSON report stays strict JSON.
+DEFAULT_TOLERANCES = {
+    "budget_rtol": 0.01,        # 1% of stored revenue impact...
+    "budget_atol": 100_000,     # ...but never tighter than $100K
+    "poverty_atol": 0.0005,     # 0.05 percentage points of poverty rate change
+    "decile_atol": 10.0,        # $10 average change per household in a decile
+    "district_atol": 10.0,      # $10 average benefit per household in a district
+}
+
+
+# =============================================================================
+# LOAD PUBLISHED REFORMS
+# =============================================================================
+
+def load_published_reforms(supabase, states: list[str] | None = None) -> list[dict]:
+    """Load published reforms together with their stored impacts."""
+    query = supabase.table("research").select(
+        "id, state, title, reform_impacts(reform_params, budgetary_impact, "
+        "poverty_impact, child_poverty_impact, decile_impact, district_impacts, "
+        "model_notes, policyengine_us_version)"
+    ).in_("type", ["bill", "blog"]).eq("status", "published")
+
+    if states:
+        query = query.in_("state", [s.upper() for s in states])
+
+    result = query.execute()
+
+    reforms = []
+    for r in result.data:
+        impact_data = r.get("reform_impacts")
+        if isinstance(impact_data, list):
+            impact_data = impact_data[0] if impact_data else {}
+        if not impact_data or not impact_data.get("reform_params"):
+            continue
+
+        model_notes = impact_data.get("model_notes") or {}
+        if isinstance(model_notes, str):
+            try:
+                model_notes = json.loads(model_notes)
+            except json.JSONDecodeError:
+                model_notes = {}
+
+        # Stored top-level impacts correspond to model_notes.analysis_year
+        year = model_notes.get("analysis_year") or get_effective_year_from_params(
+            impact_data["reform_params"]
+        )
+
+        reforms.append({
+            "id": r["id"],
+            "state": r["state"].lower(),
+            "label": r["title"],
+            "reform": impact_data["reform_params"],
+            "year": int(year),
+            "stored_version": impact_data.get("policyengine_us_version"),
+            "stored": {
+                "budgetaryImpact": impact_data.get("budgetary_impact"),
+                "povertyImpact": impact_data.get("poverty_impact"),
+                "childPovertyImpact": impact_data.get("child_poverty_impact"),
+                "decileImpact": impact_data.get("decile_impact"),
+                "districtImpacts": impact_data.get("district_impacts"),
+            },
+        })
+
+    return reforms
+
+
+# =============================================================================
+# SCHEDULING
+# =============================================================================
+
+def schedule_states(reforms: list[dict]) -> list[tuple[str, list[dict]]]:
+    """Group reforms by state, most expensive state first.
+
+    Cost is approximated as dataset size x simulations needed. Congressional
+    district count is used as the dataset-size proxy (it tracks population,
+    and so the number of records in the state .h5), and each state needs one
+    baseline plus one reform simulation per reform.
+    """
+    by_state: dict[str, list[dict]] = {}
+    for reform in reforms:
+        by_state.setdefault(reform["state"], []).append(reform)
+
+    def cost(item):
+        state, state_reforms = item
+        size = max(STATE_DISTRICTS.get(state.upper(), 1), 1)
+        return size * (1 + len(state_reforms))
+
+    return sorted(by_state.items(), key=cost, reverse=True)
+
+
+# =============================================================================
+# WORKER
+# =============================================================================
+
+def sweep_state(state: str, reforms: list[dict], verbose: bool = False) -> list[dict]:
+    """Recompute every reform in one state, sharing a single baseline.
+
+    Runs in a worker process. Returns plain dicts (picklable) with either
+    recomputed impacts or an error message per reform.
+    """
+    results = []
+    baseline = None
+    log = sys.stdout if verbose else io.StringIO()
+
+    for reform in reforms:
+        try:
+            with contextlib.redirect_stdout(log):
+                baseline, reformed = run_simulations(
+                    state, reform["reform"], reform["year"], baseline=baseline
+                )
+                impacts = compute_all_impacts(baseline, reformed, state, reform["year"])
+            results.append({"id": reform["id"], "impacts": impacts})
+        except Exception as e:
+            results.append({
+                "id": reform["id"],
+                "error": f"{e}",
+                "traceback": traceback.format_exc(),
+            })
+
+    return results
+
+
+# =============================================================================
+# DIFF
+# =============================================================================
+
+def _metric(metric, stored, new, tolerance):
+    delta = new - stored
+    entry = {
+        "metric": metric,
+        "stored": stored,
+        "new": new,
+        "delta": delta,
+        "tolerance": tolerance,
+    }
+    if tolerance > 0:
+        entry["score"] = abs(delta) / tolerance
+    elif delta:
+        entry.update(score=None, reason="changed with zero tolerance")
+    else:
+        entry["score"] = 0.0
+    entry["drifted"] = entry["score"] is None or entry["score"] > 1
+    return entry
+
+
+def _severity(score) -> float:
+    """Sort key for a drift score: unscored (structural) drift ranks above any number."""
+    return float("inf") if score is None else score
+
+
+def diff_impacts(stored: dict, new: dict, tol: dict) -> list[dict]:
+    """Compare stored and recomputed impacts, one entry per compared metric."""
+    diffs = []
+
+    # Budgetary
+    old_budget = (stored.get("budgetaryImpact") or {}).get("stateRevenueImpact")
+    new_budget = (new.get("budgetaryImpact") or {}).get("stateRevenueImpact")
+    if old_budget is not None and new_budget is not None:
+        tolerance = max(tol["budget_atol"], tol["budget_rtol"] * abs(old_budget))
+        diffs.append(_metric("budget", float(old_budget), float(new_budget), tolerance))
+
+    # Poverty (change in rate, reform minus baseline)
+    for key, label in [("povertyImpact", "poverty"), ("childPovertyImpact", "child_poverty")]:
+        old_change = (stored.get(key) or {}).get("change")
+        new_change = (new.get(key) or {}).get("change")
+        if old_change is not None and new_change is not None:
+            diffs.append(_metric(label, float(old_change), float(new_change), tol["poverty_atol"]))
+
+    # Decile average change
+    old_avg = (stored.get("decileImpact") or {}).get("average") or {}
+    new_avg = (new.get("decileImpact") or {}).get("average") or {}
+    for decile in sorted(set(old_avg) & set(new_avg), key=int):
+        diffs.append(_metric(
+            f"decile_{decile}", float(old_avg[decile]), float(new_avg[decile]), tol["decile_atol"]
+        ))
+
+    # District average benefit
+    old_districts = stored.get("districtImpacts") or {}
+    new_districts = new.get("districtImpacts") or {}
+    for district_id in sorted(set(old_districts) | set(new_districts)):
+        old_d = old_districts.get(district_id)
+        new_d = new_districts.get(district_id)
+        if old_d is None or new_d is None:
+            # A district appearing or disappearing always counts as drift
+            diffs.append({
+                "metric": f"district_{district_id}",
+                "stored": None if old_d is None else old_d.get("avgBenefit"),
+                "new": None if new_d is None else new_d.get("avgBenefit"),
+                "delta": None,
+                "tolerance": tol["district_atol"],
+                "score": None,
+                "reason": "district added" if old_d is None else "district removed",
+                "drifted": True,
+            })
+            continue
+        diffs.append(_metric(
+            f"district_{district_id}",
+            float(old_d.get("avgBenefit", 0)),
+            float(new_d.get("avgBenefit", 0)),
+            tol["district_atol"],
+        ))
+
+    return diffs
+
+
+# =============================================================================
+# REPORT
+# =============================================================================
+
+def _fmt_score(worst: dict) -> str:
+    if worst["score"] is None:
+        return worst["reason"]
+    return f"{worst['score']:.2f}"
+
+
+def _fmt(value):
+    if value is None:
+        return "—"
+    if abs(value) >= 1000:
+        return f"{value:,.0f}"
+    return f"{value:.4g}"
+
+
+def build_report(entries: list[dict], pe_us_version: str) -> dict:
+    """Rank reforms by drift score (errors first, then largest drift)."""
+    def rank(entry):
+        if entry.get("error"):
+            return (0, 0)
+        return (1, -_severity(entry["max_score"]))
+
+    ranked = sorted(entries, key=rank)
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "policyengine_us_version": pe_us_version,
+        "reforms": ranked,
+        "drifted": sum(1 for e in ranked if not e.get("error") and e["drifted_metrics"]),
+        "errors": sum(1 for e in ranked if e.get("error")),
+    }
+
+
+def format_markdown(report: dict) -> str:
+    lines = [
+        f"## Drift report — policyengine-us {report['policyengine_us_version']}",
+        "",
+        f"{report['drifted']} drifted, {report['errors']} failed, "
+        f"{len(report['reforms'])} checked.",
+        "",
+        "| Reform | Stored version | Max score | Worst metric | Stored | New |",
+        "|--------|----------------|-----------|--------------|--------|-----|",
+    ]
+    for entry in report["reforms"]:
+        if entry.get("error"):
+            lines.append(f"| {entry['id']} | {entry.get('stored_version') or '—'} | error | {entry['error']} | | |")
+            continue
+        worst = entry["worst"]
+        if worst is None:
+            lines.append(f"| {entry['id']} | {entry.get('stored_version') or '—'} | 0 | — | | |")
+            continue
+        lines.append(
+            f"| {entry['id']} | {entry.get('stored_version') or '—'} | {_fmt_score(worst)} "
+            f"| {worst['metric']} | {_fmt(worst['stored'])} | {_fmt(worst['new'])} |"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def print_report(report: dict):
+    print(f"\n{'=' * 60}")
+    print(f"Drift Report (policyengine-us {report['policyengine_us_version']})")
+    print(f"{'=' * 60}")
+    for entry in report["reforms"]:
+        if entry.get("error"):
+            print(f"  {entry['id']:30} ERROR  {entry['error']}")
+            continue
+        worst = entry["worst"]
+        flag = "DRIFT" if entry["drifted_metrics"] else "ok"
+        detail = ""
+        if worst is not None:
+            detail = f"{worst['metric']}: {_fmt(worst['stored'])} -> {_fmt(worst['new'])}"
+        score = "—" if worst is None else _fmt_score(worst)
+        print(f"  {entry['id']:30} {flag:5}  score {score:>8}  {detail}")
+    print(f"\n  Drifted: {report['drifted']} | Errors: {report['errors']} | Checked: {len(report['reforms'])}")
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Recompute published reforms and report drift against stored impacts",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+    # Full catalog, default tolerances
+    python scripts/drift_sweep.py
+
+    # Write a ranked markdown (or .json) report for CI artifacts
+    python scripts/drift_sweep.py --workers 4 --report drift.md
+
+    # Only some states, tighter budget tolerance
+    python scripts/drift_sweep.py --states GA,NY --budget-rtol 0.005
+        """,
+    )
+    parser.add_argument("--states", help="Comma-separated state codes (default: all)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=max(1, (os.cpu_count() or 2) // 2),
+        help="Parallel worker processes (each holds one state's microsimulations)",
+    )
+    parser.add_argument("--report", help="Write the ranked report to this .md or .json path")
+    parser.add_argument("--verbose", action="store_true", help="Show per-reform simulation output")
+    for key, default in DEFAULT_TOLERANCES.items():
+        parser.add_argument(
+            f"--{key.replace('_', '-')}",
+            type=float,
+            default=default,
+            help=f"Tolerance (default: {default})",
+        )
+    args = parser.parse_args()
+
+    supabase = get_supabase_client()
+    if not supabase:
+        print("Error: SUPABASE_URL and SUPABASE_KEY environment variables required")
+        print("Run: source .env")
+        return 1
+
+    states = args.states.split(",") if args.states else None
+    reforms = load_published_reforms(supabase, states)
+    if not reforms:
+        print("No published reforms with reform_params found")
+        return 1
+
+    pe_us_version = get_installed_version("policyengine-us")
+    tolerances = {key: getattr(args, key) for key in DEFAULT_TOLERANCES}
+    schedule = schedule_states(reforms)
+
+    print("=" * 60)
+    print(f"Drift Sweep (policyengine-us {pe_us_version})")
+    print("=" * 60)
+    print(f"  Reforms: {len(reforms)} across {len(schedule)} states")
+    print(f"  Workers: {args.workers}")
+    print(f"  Order:   {', '.join(state.upper() for state, _ in schedule)}")
+
+    reforms_by_id = {r["id"]: r for r in reforms}
+    entries = []
+
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = {
+            pool.submit(sweep_state, state, state_reforms, args.verbose): state
+            for state, state_reforms in schedule
+        }
+        for future in as_completed(futures):
+            state = futures[future]
+            try:
+                state_results = future.result()
+            except Exception as e:
+                # Worker crashed (e.g. out of memory) — mark every reform in the state
+                state_results = [
+                    {"id": r["id"], "error": f"worker failed: {e}"}
+                    for state_, state_reforms in schedule if state_ == state
+                    for r in state_reforms
+                ]
+
+            for result in state_results:
+                reform = reforms_by_id[result["id"]]
+                entry = {
+                    "id": reform["id"],
+                    "state": reform["state"].upper(),
+                    "year": reform["year"],
+                    "stored_version": reform["stored_version"],
+                }
+                if "error" in result:
+                    entry["error"] = result["error"]
+                    if args.verbose and result.get("traceback"):
+                        print(result["traceback"])
+                else:
+                    diffs = diff_impacts(reform["stored"], result["impacts"], tolerances)
+                    worst = max(diffs, key=lambda d: _severity(d["score"]), default=None)
+                    entry["max_score"] = worst["score"] if worst else 0.0
+                    entry["worst"] = worst
+                    entry["drifted_metrics"] = [d for d in diffs if d["drifted"]]
+                entries.append(entry)
+
+            print(f"  Finished {state.upper()} ({len(state_results)} reform(s))")
+
+    report = build_report(entries, pe_us_version)
+    print_report(report)
+
+    if args.report:
+        report_path = Path(args.report)
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        if report_path.suffix == ".json":
+            report_path.write_text(json.dumps(report, indent=2, default=str, allow_nan=False))
+        else:
+            report_path.write_text(format_markdown(report))
+        print(f"\n  Report written: {report_path}")
+
+    if report["drifted"] or report["errors"]:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
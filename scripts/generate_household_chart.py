@@ -10,13 +10,19 @@ Usage:
     python scripts/generate_household_chart.py --reform-id ct-hb5134 --upload-to-pr 119
     python scripts/generate_household_chart.py --reform-id va-hb979 --earnings-max 2000000
     python scripts/generate_household_chart.py --reform-id ga-sb168 --output charts/ga-sb168.png
+    python scripts/generate_household_chart.py --reform-id ct-hb5134 --sweep uniform
+    python scripts/generate_household_chart.py --reform-id ct-hb5134 --archetypes all
+    python scripts/generate_household_chart.py --all --workers 8
+    python scripts/generate_household_chart.py --reform-id ct-hb5134 --second-axis children --grid 80x5
 """
 
 import argparse
+import contextlib
 import copy
-import json
+import io
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 import numpy as np
@@ -36,10 +42,61 @@ from compute_impacts import (
     get_supabase_client,
     load_reforms_from_db,
 )
+from household_baseline_cache import lookup_baseline, store_baseline
+from svg_chart import render_sweep_svg, save_svg
 
-# Number of data points across the earnings sweep
+# Number of data points across the earnings sweep (uniform grid, and the
+# budget for the adaptive sweep)
 NUM_POINTS = 200
 
+# Adaptive sweep: initial uniform grid, dollar error budget for linear
+# interpolation between points, and the narrowest interval worth splitting
+ADAPTIVE_COARSE_POINTS = 33
+ADAPTIVE_TOLERANCE = 5.0
+ADAPTIVE_MIN_SPACING = 10.0
+ADAPTIVE_MAX_ROUNDS = 8
+
+# Minimum change in slope (dollars of benefit per dollar earned) that counts
+# as a kink
+KINK_SLOPE_TOLERANCE = 0.001
+
+# Marginal rates (--mtr): earnings offset for the paired method, smallest
+# drop in net income counted as a cliff, and the plotted rate range
+MTR_OFFSET = 1.0
+CLIFF_MIN_DROP = 1.0
+MTR_DISPLAY_RANGE = (-0.5, 1.5)
+
+# 2-D sweeps (--second-axis): default grid as earnings points x second points
+GRID_2D = "60x25"
+
+# Second sweep dimensions. Axis-based dimensions add a second PE axis to the
+# situation; "children" packs one household per child count instead, since
+# household structure can't be an axis.
+SECOND_AXES = {
+    "spouse_earnings": {
+        "label": "Spouse Employment Income",
+        "variable": "employment_income",
+        "person": "spouse",
+        "tickformat": "$,.0f",
+    },
+    "age": {
+        "label": "Head of Household Age",
+        "variable": "age",
+        "person": "head",
+        "min": 18,
+        "max": 85,
+        "tickformat": ",.0f",
+    },
+    "children": {
+        "label": "Number of Children",
+        "max": 4,
+        "tickformat": ",.0f",
+    },
+}
+
+# Ages assigned to the 1st, 2nd, ... child in a "children" sweep
+CHILD_AGES = [5, 12, 8, 15, 3, 10]
+
 
 # =============================================================================
 # HOUSEHOLD ARCHETYPE SELECTION
@@ -168,31 +225,74 @@ def classify_reform(reform_params: dict, provisions: list | None = None) -> dict
     }
 
 
+# Household archetypes for multi-archetype sweeps (--archetypes). Earnings
+# range and thresholds come from classify_reform so every curve shares a grid.
+ARCHETYPES = {
+    "single": {
+        "archetype": "Single, no children",
+        "adults": [40],
+        "children": [],
+        "is_married": False,
+    },
+    "single_parent": {
+        "archetype": "Single parent, 2 children",
+        "adults": [35],
+        "children": [5, 12],
+        "is_married": False,
+    },
+    "married": {
+        "archetype": "Married, no children",
+        "adults": [40, 38],
+        "children": [],
+        "is_married": True,
+    },
+    "married_children": {
+        "archetype": "Married, 2 children",
+        "adults": [40, 38],
+        "children": [5, 12],
+        "is_married": True,
+    },
+}
+
+# Line colors for overlaid archetypes (PE teal first)
+ARCHETYPE_COLORS = ["#2C7A7B", "#DD6B20", "#805AD5", "#3182CE", "#D53F8C"]
+
+
+def archetype_configs(names: list[str], base_config: dict) -> list[dict]:
+    """Configs for the named archetypes, sharing base_config's sweep range."""
+    configs = []
+    for name in names:
+        if name not in ARCHETYPES:
+            raise ValueError(f"Unknown archetype '{name}'. Choose from: {', '.join(ARCHETYPES)}")
+        configs.append({
+            **copy.deepcopy(ARCHETYPES[name]),
+            "earnings_max": base_config["earnings_max"],
+            "thresholds": base_config["thresholds"],
+        })
+    return configs
+
+
 # =============================================================================
 # SITUATION BUILDING
 # =============================================================================
 
-def build_situation(config: dict, state: str, year: int) -> dict:
-    """Build a PE Simulation situation dict with an earnings axis.
+def _add_household(situation: dict, config: dict, state: str, year: int, prefix: str = "") -> tuple[list[str], str]:
+    """Add one household (and its entity groups) to a situation in place.
 
-    Creates the household with all required entity groups and uses the
-    PE `axes` parameter to sweep employment_income from $0 to earnings_max.
+    prefix keeps member and group names unique when several households are
+    packed into the same situation. Returns (member_names, head_name).
     """
-    state_upper = state.upper()
-    earnings_max = config["earnings_max"]
-    num_people = len(config["adults"]) + len(config["children"])
-
-    # Members — all get age set, employment_income defaults to 0
-    members = {}
+    members = situation["people"]
     member_names = []
 
+    # Members — all get age set, employment_income defaults to 0
     for i, age in enumerate(config["adults"]):
-        name = f"adult_{i + 1}" if len(config["adults"]) > 1 else "adult"
+        name = f"{prefix}adult_{i + 1}" if len(config["adults"]) > 1 else f"{prefix}adult"
         members[name] = {"age": {year: age}}
         member_names.append(name)
 
     for i, age in enumerate(config["children"]):
-        name = f"child_{i + 1}"
+        name = f"{prefix}child_{i + 1}"
         members[name] = {"age": {year: age}}
         member_names.append(name)
 
@@ -206,7 +306,7 @@ def build_situation(config: dict, state: str, year: int) -> dict:
     tax_unit_members.extend(dependents)
 
     # Marital units
-    marital_units = {}
+    marital_units = situation["marital_units"]
     if spouse:
         marital_units[f"{head}_{spouse}_mu"] = {"members": [head, spouse]}
     else:
@@ -214,57 +314,110 @@ def build_situation(config: dict, state: str, year: int) -> dict:
     for dep in dependents:
         marital_units[f"{dep}_mu"] = {"members": [dep]}
 
+    situation["families"][f"{prefix}family"] = {"members": member_names}
+    situation["tax_units"][f"{prefix}tax_unit"] = {"members": tax_unit_members}
+    situation["spm_units"][f"{prefix}spm_unit"] = {"members": member_names}
+    situation["households"][f"{prefix}household"] = {
+        "members": member_names,
+        "state_name": {year: state.upper()},
+    }
+    return member_names, head
+
+
+def build_multi_situation(configs: list[dict], state: str, year: int, num_points: int = NUM_POINTS) -> dict:
+    """Pack several household archetypes into one situation with an earnings axis.
+
+    Each household gets its own parallel axis on its head's employment_income
+    (the axis `index` is the head's position among all people), so one
+    Simulation sweeps every archetype at once. Household-level outputs come
+    back copy-major: entry copy * len(configs) + k is archetype k.
+    """
     situation = {
-        "people": members,
-        "families": {"family": {"members": member_names}},
-        "marital_units": marital_units,
-        "tax_units": {"tax_unit": {"members": tax_unit_members}},
-        "spm_units": {"spm_unit": {"members": member_names}},
-        "households": {
-            "household": {
-                "members": member_names,
-                "state_name": {year: state_upper},
-            },
-        },
-        "axes": [[{
+        "people": {},
+        "families": {},
+        "marital_units": {},
+        "tax_units": {},
+        "spm_units": {},
+        "households": {},
+    }
+
+    parallel_axes = []
+    for k, config in enumerate(configs):
+        prefix = f"h{k + 1}_" if len(configs) > 1 else ""
+        _, head = _add_household(situation, config, state, year, prefix)
+        parallel_axes.append({
             "name": "employment_income",
             "min": 0,
-            "max": earnings_max,
-            "count": NUM_POINTS,
+            "max": config["earnings_max"],
+            "count": num_points,
+            "index": list(situation["people"]).index(head),
             "period": year,
-        }]],
-    }
-
-    # Store num_people so run_simulations can extract earnings correctly
-    config["_num_people"] = num_people
+        })
+        # Store num_people so run_simulations can extract earnings correctly
+        config["_num_people"] = len(config["adults"]) + len(config["children"])
 
+    situation["axes"] = [parallel_axes]
     return situation
 
 
+def build_situation(config: dict, state: str, year: int, num_points: int = NUM_POINTS) -> dict:
+    """Build a PE Simulation situation dict with an earnings axis.
+
+    Creates the household with all required entity groups and uses the
+    PE `axes` parameter to sweep employment_income from $0 to earnings_max
+    over num_points copies of the household.
+    """
+    return build_multi_situation([config], state, year, num_points)
+
+
 # =============================================================================
 # SIMULATION
 # =============================================================================
 
-def run_simulations(situation: dict, reform_params: dict, year: int, num_people: int):
+def run_simulations(
+    situation: dict,
+    reform_params: dict,
+    year: int,
+    num_people: int,
+    state: str | None = None,
+    config: dict | None = None,
+    baseline_cache: bool = True,
+):
     """Run baseline and reform Simulations, return (earnings, baseline_net, reform_net, benefit).
 
     Uses PE-US Simulation (not Microsimulation) with axes for the earnings sweep.
     The axes create NUM_POINTS copies of the household. Person-level arrays have
     NUM_POINTS * num_people entries; household-level arrays have NUM_POINTS entries.
+
+    When state and config are given, the baseline is read from (and saved
+    to) the household baseline cache, so a hit only runs the reform.
     """
     from policyengine_us import Simulation
 
     # reform_params is already a deepcopy from the caller
     ReformClass = create_reform_class(reform_params)
 
-    print("  Running baseline simulation...")
-    baseline_sim = Simulation(situation=situation)
-    baseline_net = np.array(baseline_sim.calculate("household_net_income", year))
-
-    # Extract earnings from person-level array: axes vary the first person,
-    # so every num_people-th entry starting at 0 is the adult's income.
-    all_earnings = np.array(baseline_sim.calculate("employment_income", year))
-    earnings = all_earnings[::num_people]  # pick the adult (first person) from each copy
+    use_cache = baseline_cache and state is not None and config is not None
+    baseline_net = None
+    if use_cache:
+        axis = situation["axes"][0][0]
+        grid = np.linspace(axis["min"], axis["max"], axis["count"])
+        cached = lookup_baseline(state, year, config, grid)
+        if not np.isnan(cached).any():
+            print("  Baseline: cache hit")
+            earnings, baseline_net = grid, cached
+
+    if baseline_net is None:
+        print("  Running baseline simulation...")
+        baseline_sim = Simulation(situation=situation)
+        baseline_net = np.array(baseline_sim.calculate("household_net_income", year))
+
+        # Extract earnings from person-level array: axes vary the first person,
+        # so every num_people-th entry starting at 0 is the adult's income.
+        all_earnings = np.array(baseline_sim.calculate("employment_income", year))
+        earnings = all_earnings[::num_people]  # pick the adult (first person) from each copy
+        if use_cache:
+            store_baseline(state, year, config, earnings, baseline_net)
 
     print("  Running reform simulation...")
     reform_sim = Simulation(situation=situation, reform=ReformClass)
@@ -275,32 +428,507 @@ def run_simulations(situation: dict, reform_params: dict, year: int, num_people:
     return earnings, baseline_net, reform_net, benefit
 
 
+def _person_earnings(situation: dict, points: np.ndarray) -> np.ndarray:
+    """Person-level employment_income putting `points` on every household head."""
+    people_per_copy = len(situation["people"])
+    person_earnings = np.zeros(len(points) * people_per_copy)
+    for axis in situation["axes"][0]:
+        person_earnings[axis["index"]::people_per_copy] = points
+    return person_earnings
+
+
+def _household_matrix(sim, year: int, num_points: int, num_households: int) -> np.ndarray:
+    values = np.array(sim.calculate("household_net_income", year))
+    # Copy-major layout: reshape to (points, households), then transpose
+    return values.reshape(num_points, num_households).T
+
+
+def _simulate_baseline(configs: list[dict], state: str, year: int, points: np.ndarray, baseline_cache: bool = True) -> np.ndarray:
+    """Baseline net income shaped (len(configs), len(points)).
+
+    Cached points are read back; only the archetypes and points that miss
+    are packed into a baseline Simulation, and the results are cached.
+    """
+    from policyengine_us import Simulation
+
+    baseline_net = np.full((len(configs), len(points)), np.nan)
+    if baseline_cache:
+        for k, config in enumerate(configs):
+            baseline_net[k] = lookup_baseline(state, year, config, points)
+
+    missing = np.isnan(baseline_net)
+    if not missing.any():
+        print(f"  Baseline: cache hit ({len(points)} points)")
+        return baseline_net
+
+    rows = np.where(missing.any(axis=1))[0]
+    cols = np.where(missing.any(axis=0))[0]
+    miss_configs = [copy.deepcopy(configs[k]) for k in rows]
+    miss_points = points[cols]
+    if baseline_cache and missing.sum() < missing.size:
+        print(f"  Baseline: {missing.size - missing.sum()} cached, simulating {len(miss_points)} points")
+
+    situation = build_multi_situation(miss_configs, state, year, num_points=len(miss_points))
+    sim = Simulation(situation=situation)
+    sim.set_input("employment_income", year, _person_earnings(situation, miss_points))
+    simulated = _household_matrix(sim, year, len(miss_points), len(miss_configs))
+
+    for row, k in enumerate(rows):
+        baseline_net[k, cols] = simulated[row]
+        if baseline_cache:
+            store_baseline(state, year, configs[k], miss_points, simulated[row])
+    return baseline_net
+
+
+def _simulate_points(
+    configs: list[dict],
+    state: str,
+    year: int,
+    ReformClass,
+    points: np.ndarray,
+    baseline_cache: bool = True,
+):
+    """Run baseline and reform at arbitrary earnings points in one batch each.
+
+    All archetypes in `configs` are packed into the same situation. Axes
+    only produce evenly spaced values, so the situation is built with one
+    copy per point and employment_income is then overwritten with the
+    requested (possibly non-uniform) points on each household head. The
+    baseline goes through the household baseline cache.
+
+    Returns (baseline_net, reform_net), each shaped (len(configs), len(points)).
+    """
+    from policyengine_us import Simulation
+
+    points = np.asarray(points, dtype=float)
+    baseline_net = _simulate_baseline(configs, state, year, points, baseline_cache)
+
+    situation = build_multi_situation(configs, state, year, num_points=len(points))
+    reform_sim = Simulation(situation=situation, reform=ReformClass)
+    reform_sim.set_input("employment_income", year, _person_earnings(situation, points))
+    reform_net = _household_matrix(reform_sim, year, len(points), len(configs))
+
+    return baseline_net, reform_net
+
+
+def _refinement_points(x: np.ndarray, y: np.ndarray, tolerance: float, min_spacing: float) -> list[tuple[float, float]]:
+    """Midpoints worth simulating next, as (error, earnings) pairs.
+
+    For each interior point, measure how far it sits from the straight line
+    through its neighbours. Where that exceeds the error budget the curve
+    bends (or jumps) nearby, so both adjacent intervals get split.
+    """
+    candidates = {}
+    for i in range(1, len(x) - 1):
+        span = x[i + 1] - x[i - 1]
+        interpolated = y[i - 1] + (y[i + 1] - y[i - 1]) * (x[i] - x[i - 1]) / span
+        error = abs(y[i] - interpolated)
+        if error <= tolerance:
+            continue
+        for lo, hi in ((x[i - 1], x[i]), (x[i], x[i + 1])):
+            if hi - lo > 2 * min_spacing:
+                mid = round((lo + hi) / 2, 2)
+                candidates[mid] = max(candidates.get(mid, 0), error)
+    return sorted(((err, mid) for mid, err in candidates.items()), reverse=True)
+
+
+def find_kinks(earnings: np.ndarray, benefit: np.ndarray, slope_tolerance: float = KINK_SLOPE_TOLERANCE) -> list[dict]:
+    """Locate slope changes in a piecewise-linear benefit curve.
+
+    Where a kink falls strictly between two grid points, the segment holding
+    it is a blend of the two slopes; the kink is placed at the intersection
+    of the lines through the neighbouring segments, which is exact for
+    piecewise-linear schedules.
+    """
+    if len(earnings) < 3:
+        return []
+
+    slopes = np.diff(benefit) / np.diff(earnings)
+    kinks = []
+    i = 1
+    while i < len(slopes):
+        s_left = slopes[i - 1]
+        if abs(slopes[i] - s_left) <= slope_tolerance:
+            i += 1
+            continue
+
+        # Segment i may be a transition between two linear pieces
+        j = i
+        if (
+            i + 1 < len(slopes)
+            and abs(slopes[i + 1] - slopes[i]) > slope_tolerance
+            and abs(slopes[i + 1] - s_left) > slope_tolerance
+        ):
+            j = i + 1
+        s_right = slopes[j]
+        x_left, y_left = earnings[i], benefit[i]
+        x_right, y_right = earnings[j], benefit[j]
+
+        if abs(s_right - s_left) > slope_tolerance:
+            x_kink = (y_right - y_left + s_left * x_left - s_right * x_right) / (s_left - s_right)
+            x_kink = float(np.clip(x_kink, x_left, x_right))
+            kinks.append({
+                "earnings": x_kink,
+                "benefit": float(y_left + s_left * (x_kink - x_left)),
+                "slope_before": float(s_left),
+                "slope_after": float(s_right),
+            })
+        i = j + 1
+
+    return kinks
+
+
+def adaptive_sweep(
+    configs: list[dict],
+    state: str,
+    year: int,
+    reform_params: dict,
+    coarse_points: int = ADAPTIVE_COARSE_POINTS,
+    tolerance: float = ADAPTIVE_TOLERANCE,
+    max_points: int = NUM_POINTS,
+    min_spacing: float = ADAPTIVE_MIN_SPACING,
+    baseline_cache: bool = True,
+):
+    """Adaptive earnings sweep: coarse grid, then refine where the curve bends.
+
+    Starts from a coarse uniform grid plus the reform's known thresholds
+    (and points just either side of them), then repeatedly simulates the
+    midpoints of intervals whose linear interpolation error exceeds
+    `tolerance` dollars, until the error budget is met, `max_points` is
+    reached or intervals shrink below `min_spacing`. With several
+    archetypes the grid is shared: a point is added if any archetype needs it.
+
+    Returns (earnings, baseline_net, reform_net, benefit); earnings is a
+    sorted, non-uniform grid and the rest are shaped (len(configs), points).
+    """
+    # reform_params is already a deepcopy from the caller
+    ReformClass = create_reform_class(reform_params)
+    earnings_max = max(config["earnings_max"] for config in configs)
+
+    seed = list(np.linspace(0, earnings_max, coarse_points))
+    thresholds = {t for config in configs for t in config.get("thresholds", [])}
+    for thresh in thresholds:
+        for x in (thresh - min_spacing, thresh, thresh + min_spacing):
+            if 0 < x < earnings_max:
+                seed.append(x)
+    pending = np.unique(np.round(seed, 2))
+
+    evaluated: dict[float, tuple[np.ndarray, np.ndarray]] = {}
+    for round_num in range(1, ADAPTIVE_MAX_ROUNDS + 1):
+        budget = max_points - len(evaluated)
+        pending = pending[:budget]
+        if len(pending) == 0:
+            break
+
+        print(f"  Round {round_num}: simulating {len(pending)} points x {len(configs)} household(s)...")
+        baseline_net, reform_net = _simulate_points(
+            configs, state, year, ReformClass, pending, baseline_cache=baseline_cache
+        )
+        for i, x in enumerate(pending):
+            evaluated[float(x)] = (baseline_net[:, i], reform_net[:, i])
+
+        x = np.array(sorted(evaluated))
+        candidates = {}
+        for k in range(len(configs)):
+            benefit = np.array([evaluated[v][1][k] - evaluated[v][0][k] for v in x])
+            for err, mid in _refinement_points(x, benefit, tolerance, min_spacing):
+                candidates[mid] = max(candidates.get(mid, 0), err)
+        ranked = sorted(candidates.items(), key=lambda item: item[1], reverse=True)
+        pending = np.array([mid for mid, _ in ranked if mid not in evaluated])
+
+    earnings = np.array(sorted(evaluated))
+    baseline_net = np.column_stack([evaluated[v][0] for v in earnings])
+    reform_net = np.column_stack([evaluated[v][1] for v in earnings])
+    print(f"  Simulated {len(earnings)} points x {len(configs)} household(s) (uniform grid: {max_points})")
+    return earnings, baseline_net, reform_net, reform_net - baseline_net
+
+
+# =============================================================================
+# MARGINAL RATES AND CLIFFS
+# =============================================================================
+
+def marginal_rates(earnings: np.ndarray, net_income: np.ndarray) -> np.ndarray:
+    """Effective marginal rate 1 - d(net)/d(earnings) at each grid point.
+
+    Net income may be shaped (points,) or (households, points); np.gradient
+    uses second-order differences that account for non-uniform spacing.
+    """
+    return 1 - np.gradient(net_income, earnings, axis=-1)
+
+
+def marginal_rates_offset(
+    configs: list[dict],
+    state: str,
+    year: int,
+    reform_params: dict,
+    earnings: np.ndarray,
+    baseline_net: np.ndarray,
+    reform_net: np.ndarray,
+    offset: float = MTR_OFFSET,
+    baseline_cache: bool = True,
+):
+    """Effective marginal rates from a paired earnings + offset run.
+
+    Every grid point is re-simulated at earnings + offset in a single batch,
+    giving exact one-dollar rates that don't smear kinks and cliffs across
+    neighbouring grid points. Returns (baseline_mtr, reform_mtr), shaped
+    like baseline_net.
+    """
+    # reform_params is already a deepcopy from the caller
+    ReformClass = create_reform_class(reform_params)
+    print(f"  MTR: simulating {len(earnings)} points at +${offset:,.0f}...")
+    baseline_up, reform_up = _simulate_points(
+        configs, state, year, ReformClass, earnings + offset, baseline_cache=baseline_cache
+    )
+    baseline_up = baseline_up.reshape(np.shape(baseline_net))
+    reform_up = reform_up.reshape(np.shape(reform_net))
+    return 1 - (baseline_up - baseline_net) / offset, 1 - (reform_up - reform_net) / offset
+
+
+def find_cliffs(earnings: np.ndarray, net_income: np.ndarray, min_drop: float = CLIFF_MIN_DROP) -> list[dict]:
+    """Earnings ranges over which net income falls as earnings rise.
+
+    Consecutive falling segments merge into one cliff; each reports where
+    it starts and ends and the total drop in net income.
+    """
+    falling = np.diff(net_income) < 0
+    if not falling.any():
+        return []
+
+    # Run boundaries of consecutive falling segments
+    edges = np.diff(np.concatenate(([0], falling.astype(int), [0])))
+    starts = np.where(edges == 1)[0]
+    ends = np.where(edges == -1)[0]
+
+    cliffs = []
+    for start, end in zip(starts, ends):
+        drop = float(net_income[start] - net_income[end])
+        if drop >= min_drop:
+            cliffs.append({
+                "earnings_start": float(earnings[start]),
+                "earnings_end": float(earnings[end]),
+                "drop": drop,
+            })
+    return cliffs
+
+
+def mtr_analysis(
+    earnings: np.ndarray,
+    baseline_net: np.ndarray,
+    reform_net: np.ndarray,
+    baseline_mtr: np.ndarray | None = None,
+    reform_mtr: np.ndarray | None = None,
+) -> dict:
+    """Baseline/reform marginal rates and cliffs for one household curve."""
+    if baseline_mtr is None:
+        baseline_mtr = marginal_rates(earnings, baseline_net)
+    if reform_mtr is None:
+        reform_mtr = marginal_rates(earnings, reform_net)
+    return {
+        "baseline": baseline_mtr,
+        "reform": reform_mtr,
+        "cliffs": {
+            "baseline": find_cliffs(earnings, baseline_net),
+            "reform": find_cliffs(earnings, reform_net),
+        },
+    }
+
+
+def print_mtr_summary(mtr: dict):
+    cliffs = mtr["cliffs"]
+    print(f"\n  Marginal rates:")
+    print(f"    Avg MTR:      baseline {np.mean(mtr['baseline']):.1%}, reform {np.mean(mtr['reform']):.1%}")
+    print(f"    Cliffs:       baseline {len(cliffs['baseline'])}, reform {len(cliffs['reform'])}")
+    for cliff in cliffs["reform"]:
+        print(
+            f"      reform: -${cliff['drop']:,.0f} between "
+            f"${cliff['earnings_start']:,.0f} and ${cliff['earnings_end']:,.0f}"
+        )
+
+
+# =============================================================================
+# 2-D SWEEP
+# =============================================================================
+
+def _second_axis_config(config: dict, dimension: str) -> dict:
+    """Adapt the household so the second dimension applies to it."""
+    config = copy.deepcopy(config)
+    if dimension == "spouse_earnings" and not (config["is_married"] and len(config["adults"]) > 1):
+        config["adults"] = [config["adults"][0], 38]
+        config["is_married"] = True
+        kids = len(config["children"])
+        config["archetype"] = f"Married, {kids} children" if kids else "Married, no children"
+    return config
+
+
+def sweep_2d(
+    config: dict,
+    state: str,
+    year: int,
+    reform_params: dict,
+    dimension: str,
+    num_points: int,
+    num_second: int,
+):
+    """Sweep earnings against a second dimension in one Simulation per side.
+
+    Spouse earnings and age become a second PE axis, so the situation holds
+    num_points * num_second household copies. Child counts are swept by
+    packing one household per count (0..max) into the situation, each with
+    its own parallel earnings axis.
+
+    Returns (config, earnings, second_values, baseline_net, reform_net,
+    benefit); the matrices are shaped (len(second_values), len(earnings)).
+    """
+    from policyengine_us import Simulation
+
+    spec = SECOND_AXES[dimension]
+    # reform_params is already a deepcopy from the caller
+    ReformClass = create_reform_class(reform_params)
+    config = _second_axis_config(config, dimension)
+    earnings = np.linspace(0, config["earnings_max"], num_points)
+
+    if dimension == "children":
+        max_children = spec["max"]
+        second_values = np.arange(max_children + 1, dtype=float)
+        configs = []
+        for n in range(max_children + 1):
+            configs.append({
+                **copy.deepcopy(config),
+                "children": [CHILD_AGES[i % len(CHILD_AGES)] for i in range(n)],
+            })
+        situation = build_multi_situation(configs, state, year, num_points)
+        shape = (num_points, len(configs))
+    else:
+        situation = build_situation(config, state, year, num_points)
+        people = list(situation["people"])
+        index = 1 if spec["person"] == "spouse" else 0
+        low = spec.get("min", 0)
+        high = spec.get("max", config["earnings_max"])
+        second_values = np.linspace(low, high, num_second)
+        situation["axes"].append([{
+            "name": spec["variable"],
+            "min": low,
+            "max": high,
+            "count": num_second,
+            "index": index if index < len(people) else 0,
+            "period": year,
+        }])
+        # Axes expand as a meshgrid: the first axis varies fastest
+        shape = (num_second, num_points)
+
+    def household_grid(sim):
+        values = np.array(sim.calculate("household_net_income", year)).reshape(shape)
+        # Packed households come back copy-major: (points, households)
+        return values.T if dimension == "children" else values
+
+    cells = len(second_values) * num_points
+    print(f"  Running baseline simulation ({cells:,} households)...")
+    baseline_net = household_grid(Simulation(situation=situation))
+    print(f"  Running reform simulation ({cells:,} households)...")
+    reform_net = household_grid(Simulation(situation=situation, reform=ReformClass))
+
+    return config, earnings, second_values, baseline_net, reform_net, reform_net - baseline_net
+
+
+def summarize_grid(earnings: np.ndarray, second_values: np.ndarray, benefit: np.ndarray) -> dict:
+    """Headline numbers for a 2-D sweep (argmax/argmin cells and coverage)."""
+    max_row, max_col = np.unravel_index(np.argmax(benefit), benefit.shape)
+    min_row, min_col = np.unravel_index(np.argmin(benefit), benefit.shape)
+    return {
+        "max_benefit": float(benefit[max_row, max_col]),
+        "max_earnings": float(earnings[max_col]),
+        "max_second": float(second_values[max_row]),
+        "min_benefit": float(benefit[min_row, min_col]),
+        "min_earnings": float(earnings[min_col]),
+        "min_second": float(second_values[min_row]),
+        "share_gaining": float(np.mean(benefit > 0.50)),
+        "share_losing": float(np.mean(benefit < -0.50)),
+    }
+
+
+def print_grid_summary(summary: dict, dimension: str):
+    label = SECOND_AXES[dimension]["label"]
+    print("\n  Summary (2-D):")
+    print(
+        f"    Max benefit:  ${summary['max_benefit']:,.0f} at ${summary['max_earnings']:,.0f} earnings, "
+        f"{label.lower()} {summary['max_second']:,.0f}"
+    )
+    print(
+        f"    Min benefit:  ${summary['min_benefit']:,.0f} at ${summary['min_earnings']:,.0f} earnings, "
+        f"{label.lower()} {summary['min_second']:,.0f}"
+    )
+    print(f"    Grid cells gaining: {summary['share_gaining']:.0%} | losing: {summary['share_losing']:.0%}")
+
+
+def export_grid(result: dict, output_path: str) -> tuple[str, str]:
+    """Write the 2-D sweep as long-format CSV and as NPZ next to the chart."""
+    import csv
+
+    output = Path(output_path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    grid = result["grid"]
+    dimension = grid["dimension"]
+
+    csv_path = output.with_suffix(".csv")
+    with open(csv_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["employment_income", dimension, "baseline_net_income", "reform_net_income", "benefit"])
+        for i, second in enumerate(grid["second_values"]):
+            for j, earned in enumerate(result["earnings"]):
+                writer.writerow([
+                    round(float(earned), 2),
+                    round(float(second), 2),
+                    round(float(grid["baseline_net"][i, j]), 2),
+                    round(float(grid["reform_net"][i, j]), 2),
+                    round(float(grid["benefit"][i, j]), 2),
+                ])
+
+    npz_path = output.with_suffix(".npz")
+    np.savez_compressed(
+        npz_path,
+        employment_income=result["earnings"],
+        second_values=grid["second_values"],
+        baseline_net_income=grid["baseline_net"],
+        reform_net_income=grid["reform_net"],
+        benefit=grid["benefit"],
+        dimension=np.array(dimension),
+    )
+    print(f"  Grid exported: {csv_path}, {npz_path}")
+    return str(csv_path), str(npz_path)
+
+
 # =============================================================================
 # CHART GENERATION
 # =============================================================================
 
-def generate_chart(
+def build_chart(
     earnings: np.ndarray,
     benefit: np.ndarray,
     config: dict,
     metadata: dict,
-    output_path: str,
-) -> str:
-    """Generate a plotly chart of net benefit by earnings.
-
-    Saves both a PNG (for PR comments) and an interactive HTML.
-    Returns the path to the saved PNG.
+    kinks: list | None = None,
+    mtr: dict | None = None,
+):
+    """Build the plotly figure of net benefit by earnings.
+
+    Earnings may be a non-uniform grid (adaptive sweep); detected kinks are
+    marked on the benefit line. With `mtr` (from mtr_analysis) a second
+    panel shows baseline and reform marginal rates and cliffs.
     """
     import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
 
     # PE brand teal
     teal = "#2C7A7B"
 
-    state_upper = metadata.get("state", "").upper()
-    bill_title = metadata.get("title", metadata.get("id", ""))
     subtitle = f"{config['archetype']} | Year {metadata.get('year', '')}"
 
-    fig = go.Figure()
+    if mtr is None:
+        fig = go.Figure()
+    else:
+        # Traces added without row/col land in the top (benefit) panel
+        fig = make_subplots(rows=2, cols=1, shared_xaxes=True, row_heights=[0.6, 0.4], vertical_spacing=0.06)
 
     # Positive benefit fill (green)
     benefit_pos = np.where(benefit >= 0, benefit, 0)
@@ -334,6 +962,17 @@ def generate_chart(
         hovertemplate="Earnings: $%{x:,.0f}<br>Benefit: $%{y:,.0f}<extra></extra>",
     ))
 
+    # Kink markers
+    if kinks:
+        fig.add_trace(go.Scatter(
+            x=[k["earnings"] for k in kinks],
+            y=[k["benefit"] for k in kinks],
+            mode="markers",
+            marker=dict(color=teal, size=7, symbol="diamond-open", line=dict(width=1.5)),
+            name="Kink",
+            hovertemplate="Kink at $%{x:,.0f}<extra></extra>",
+        ))
+
     # Threshold lines
     for thresh in config.get("thresholds", []):
         if thresh <= earnings[-1]:
@@ -351,6 +990,111 @@ def generate_chart(
     # Zero line
     fig.add_hline(y=0, line_color="gray", line_width=0.8)
 
+    _apply_layout(fig, metadata, subtitle)
+    if mtr is not None:
+        _add_mtr_panel(fig, earnings, mtr, teal)
+    return fig
+
+
+def _add_mtr_panel(fig, earnings: np.ndarray, mtr: dict, color: str):
+    """Bottom panel: baseline vs reform marginal rates, cliffs marked."""
+    import plotly.graph_objects as go
+
+    low, high = MTR_DISPLAY_RANGE
+    for name, values, line in (
+        ("Baseline MTR", mtr["baseline"], dict(color="gray", width=1.5, dash="dot")),
+        ("Reform MTR", mtr["reform"], dict(color=color, width=2)),
+    ):
+        fig.add_trace(go.Scatter(
+            x=earnings, y=np.clip(values, low, high),
+            customdata=values,
+            mode="lines",
+            line=line,
+            name=name,
+            hovertemplate=f"{name}<br>Earnings: $%{{x:,.0f}}<br>Rate: %{{customdata:.1%}}<extra></extra>",
+        ), row=2, col=1)
+
+    cliffs = mtr["cliffs"]["reform"]
+    if cliffs:
+        fig.add_trace(go.Scatter(
+            x=[c["earnings_start"] for c in cliffs],
+            y=[high] * len(cliffs),
+            customdata=[c["drop"] for c in cliffs],
+            mode="markers",
+            marker=dict(color="#E53E3E", size=8, symbol="triangle-down"),
+            name="Cliff",
+            hovertemplate="Cliff at $%{x:,.0f}<br>Net income drop: $%{customdata:,.0f}<extra></extra>",
+        ), row=2, col=1)
+
+    fig.update_xaxes(title=None, row=1, col=1)
+    fig.update_xaxes(title="Employment Income", tickformat="$,.0f", gridcolor="rgba(0,0,0,0.06)", row=2, col=1)
+    fig.update_yaxes(
+        title="Marginal Rate", tickformat=".0%", range=[low, high],
+        gridcolor="rgba(0,0,0,0.06)", row=2, col=1,
+    )
+    fig.update_layout(height=750, showlegend=True, legend=dict(orientation="h", yanchor="bottom", y=1.0, x=0))
+
+
+def build_heatmap_chart(
+    earnings: np.ndarray,
+    second_values: np.ndarray,
+    benefit: np.ndarray,
+    dimension: str,
+    config: dict,
+    metadata: dict,
+):
+    """Benefit heatmap over earnings x a second dimension, with contours.
+
+    Contour lines trace equal-benefit levels (the zero contour is the
+    break-even boundary); reform thresholds are drawn as dashed lines on
+    each dollar axis they apply to.
+    """
+    import plotly.graph_objects as go
+
+    spec = SECOND_AXES[dimension]
+    bound = float(np.max(np.abs(benefit))) or 1.0
+
+    fig = go.Figure()
+    fig.add_trace(go.Heatmap(
+        x=earnings, y=second_values, z=benefit,
+        colorscale=[[0, "#E53E3E"], [0.5, "#FFFFFF"], [1, "#38A169"]],
+        zmin=-bound, zmax=bound, zmid=0,
+        colorbar=dict(title="Net benefit", tickformat="$,.0f"),
+        hovertemplate=(
+            "Earnings: $%{x:,.0f}<br>" + spec["label"] + ": %{y:,.0f}"
+            "<br>Benefit: $%{z:,.0f}<extra></extra>"
+        ),
+    ))
+    fig.add_trace(go.Contour(
+        x=earnings, y=second_values, z=benefit,
+        contours=dict(coloring="none", showlabels=True, labelfont=dict(size=9, color="#4A5568")),
+        line=dict(color="#4A5568", width=1),
+        ncontours=10,
+        showscale=False,
+        hoverinfo="skip",
+    ))
+
+    for thresh in config.get("thresholds", []):
+        if thresh <= earnings[-1]:
+            fig.add_vline(x=thresh, line_dash="dash", line_color="gray", opacity=0.7)
+        if dimension == "spouse_earnings" and thresh <= second_values[-1]:
+            fig.add_hline(y=thresh, line_dash="dash", line_color="gray", opacity=0.7)
+
+    subtitle = f"{config['archetype']} | {spec['label']} | Year {metadata.get('year', '')}"
+    _apply_layout(fig, metadata, subtitle)
+    fig.update_layout(
+        yaxis=dict(title=spec["label"], tickformat=spec["tickformat"], gridcolor="rgba(0,0,0,0)"),
+        xaxis=dict(gridcolor="rgba(0,0,0,0)"),
+        height=600,
+    )
+    return fig
+
+
+def _apply_layout(fig, metadata: dict, subtitle: str, showlegend: bool = False):
+    """Shared title, axes and branding for household sweep charts."""
+    state_upper = metadata.get("state", "").upper()
+    bill_title = metadata.get("title", metadata.get("id", ""))
+
     fig.update_layout(
         title=dict(
             text=(
@@ -385,33 +1129,112 @@ def generate_chart(
                 font=dict(size=11, color="gray"),
             )
         ],
-        showlegend=False,
+        showlegend=showlegend,
     )
 
-    # Ensure output directory exists
-    output = Path(output_path)
-    output.parent.mkdir(parents=True, exist_ok=True)
 
-    # Save PNG
-    fig.write_image(str(output), scale=2)
-    print(f"  Chart saved: {output}")
+@contextlib.contextmanager
+def chart_renderer():
+    """Keep a single Kaleido browser alive for every PNG written in the block.
+
+    Kaleido >= 1.0 otherwise launches Chromium for each write_image call;
+    older Kaleido already reuses one subprocess, so this is a no-op there.
+    """
+    try:
+        import kaleido
+    except ImportError:
+        yield
+        return
+
+    start = getattr(kaleido, "start_sync_server", None)
+    if start is None:
+        yield
+        return
+
+    start(silence_warnings=True)
+    try:
+        yield
+    finally:
+        kaleido.stop_sync_server(silence_warnings=True)
 
-    # Save interactive HTML alongside
-    html_path = output.with_suffix(".html")
-    fig.write_html(str(html_path), include_plotlyjs="cdn")
-    print(f"  Interactive chart: {html_path}")
 
-    return str(output)
+def save_figures(figures: list[tuple]) -> list[str]:
+    """Write PNG and HTML for many (fig, output_path) pairs in one renderer.
+
+    Uses plotly.io.write_images (plotly >= 6.1) to export every PNG in a
+    single Kaleido call; falls back to one write_image per figure.
+    Returns the PNG paths.
+    """
+    import plotly.io as pio
+
+    outputs = [Path(path) for _, path in figures]
+    for output in outputs:
+        output.parent.mkdir(parents=True, exist_ok=True)
+
+    with chart_renderer():
+        write_images = getattr(pio, "write_images", None)
+        if write_images is not None:
+            write_images(
+                [fig for fig, _ in figures],
+                [str(output) for output in outputs],
+                scale=2,
+            )
+        else:
+            for (fig, _), output in zip(figures, outputs):
+                fig.write_image(str(output), scale=2)
+
+    for (fig, _), output in zip(figures, outputs):
+        fig.write_html(str(output.with_suffix(".html")), include_plotlyjs="cdn")
+        print(f"  Chart saved: {output} (+ .html)")
+
+    return [str(output) for output in outputs]
+
+
+def build_multi_chart(
+    earnings: np.ndarray,
+    benefits: dict,
+    config: dict,
+    metadata: dict,
+):
+    """Overlay the net benefit curves of several household archetypes.
+
+    benefits maps archetype label -> benefit array on the shared earnings grid.
+    """
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    for color, (label, benefit) in zip(ARCHETYPE_COLORS, benefits.items()):
+        fig.add_trace(go.Scatter(
+            x=earnings, y=benefit,
+            mode="lines",
+            line=dict(color=color, width=2.5),
+            name=label,
+            hovertemplate=f"{label}<br>Earnings: $%{{x:,.0f}}<br>Benefit: $%{{y:,.0f}}<extra></extra>",
+        ))
+
+    for thresh in config.get("thresholds", []):
+        if thresh <= earnings[-1]:
+            fig.add_vline(x=thresh, line_dash="dash", line_color="gray", opacity=0.6)
+
+    fig.add_hline(y=0, line_color="gray", line_width=0.8)
+
+    subtitle = f"{len(benefits)} households | Year {metadata.get('year', '')}"
+    _apply_layout(fig, metadata, subtitle, showlegend=True)
+    fig.update_layout(legend=dict(orientation="h", yanchor="bottom", y=1.0, x=0))
+    return fig
 
 
 # =============================================================================
 # SUMMARY STATS
 # =============================================================================
 
-def print_summary_stats(earnings: np.ndarray, benefit: np.ndarray) -> dict:
-    """Print summary statistics and return them as a dict for PR comments."""
+def summarize_benefit(earnings: np.ndarray, benefit: np.ndarray, kinks: list | None = None) -> dict:
+    """Summary statistics for one benefit curve (empty dict if no data).
+
+    Works on non-uniform grids: the average benefit is the trapezoid-rule
+    mean over the earnings range rather than a plain mean of the points.
+    """
     if len(earnings) == 0 or len(benefit) == 0:
-        print("\n  Summary: No data from simulation sweep")
         return {}
 
     max_benefit = float(np.max(benefit))
@@ -422,28 +1245,80 @@ def print_summary_stats(earnings: np.ndarray, benefit: np.ndarray) -> dict:
     summary = {
         "max_benefit": max_benefit,
         "max_earnings": float(earnings[max_idx]),
+        "min_benefit": min_benefit,
+        "min_earnings": float(earnings[min_idx]),
         "max_loss": min_benefit if min_benefit < 0 else 0,
         "loss_earnings": float(earnings[min_idx]) if min_benefit < 0 else 0,
     }
 
-    print(f"\n  Summary:")
-    print(f"    Max benefit:  ${max_benefit:,.0f} at ${earnings[max_idx]:,.0f} earnings")
-    if min_benefit < 0:
-        print(f"    Max loss:     ${min_benefit:,.0f} at ${earnings[min_idx]:,.0f} earnings")
-    else:
-        print(f"    Min benefit:  ${min_benefit:,.0f} at ${earnings[min_idx]:,.0f} earnings")
+    if len(earnings) > 1 and earnings[-1] > earnings[0]:
+        area = np.sum((benefit[1:] + benefit[:-1]) / 2 * np.diff(earnings))
+        summary["avg_benefit"] = float(area / (earnings[-1] - earnings[0]))
 
     nonzero = np.where(np.abs(benefit) > 0.50)[0]
     if len(nonzero) > 0:
         summary["range_start"] = float(earnings[nonzero[0]])
         summary["range_end"] = float(earnings[nonzero[-1]])
+
+    if kinks:
+        summary["kinks"] = [k["earnings"] for k in kinks]
+
+    return summary
+
+
+def print_summary_stats(earnings: np.ndarray, benefit: np.ndarray, kinks: list | None = None) -> dict:
+    """Print summary statistics and return them as a dict for PR comments."""
+    summary = summarize_benefit(earnings, benefit, kinks)
+    if not summary:
+        print("\n  Summary: No data from simulation sweep")
+        return {}
+
+    print(f"\n  Summary:")
+    print(f"    Max benefit:  ${summary['max_benefit']:,.0f} at ${summary['max_earnings']:,.0f} earnings")
+    if summary["min_benefit"] < 0:
+        print(f"    Max loss:     ${summary['min_benefit']:,.0f} at ${summary['min_earnings']:,.0f} earnings")
+    else:
+        print(f"    Min benefit:  ${summary['min_benefit']:,.0f} at ${summary['min_earnings']:,.0f} earnings")
+
+    if "avg_benefit" in summary:
+        print(f"    Avg benefit:  ${summary['avg_benefit']:,.0f} across the earnings range")
+
+    if "range_start" in summary:
         print(f"    Benefit range: ${summary['range_start']:,.0f} – ${summary['range_end']:,.0f}")
     else:
         print("    No meaningful benefit detected")
 
+    if summary.get("kinks"):
+        print(f"    Kinks:        {', '.join(f'${k:,.0f}' for k in summary['kinks'])}")
+
     return summary
 
 
+def print_archetype_table(earnings: np.ndarray, benefits: dict, kinks: dict | None = None) -> dict:
+    """Print a per-archetype summary table; returns {label: summary}."""
+    summaries = {
+        label: summarize_benefit(earnings, benefit, (kinks or {}).get(label))
+        for label, benefit in benefits.items()
+    }
+
+    width = max(len(label) for label in summaries)
+    print("\n  Summary by household:")
+    print(f"    {'Household':{width}}  {'Max benefit':>12}  {'Max loss':>10}  {'Avg':>8}  {'Benefit range':>21}")
+    for label, summary in summaries.items():
+        if not summary:
+            print(f"    {label:{width}}  no data")
+            continue
+        affected = (
+            f"${summary['range_start']:,.0f}–${summary['range_end']:,.0f}"
+            if "range_start" in summary else "none"
+        )
+        max_benefit = f"${summary['max_benefit']:,.0f}"
+        max_loss = f"${summary['max_loss']:,.0f}"
+        avg = f"${summary.get('avg_benefit', 0):,.0f}"
+        print(f"    {label:{width}}  {max_benefit:>12}  {max_loss:>10}  {avg:>8}  {affected:>21}")
+    return summaries
+
+
 # =============================================================================
 # PR UPLOAD
 # =============================================================================
@@ -488,6 +1363,26 @@ def upload_to_pr(chart_path: str, pr_number: int, metadata: dict, summary: dict
             comment_body += f"- Max loss: **${summary['max_loss']:,.0f}** at ${summary['loss_earnings']:,.0f} earnings\n"
         if summary.get("range_start") is not None:
             comment_body += f"- Affected earnings range: ${summary['range_start']:,.0f} – ${summary['range_end']:,.0f}\n"
+        if summary.get("kinks"):
+            comment_body += f"- Kinks at: {', '.join(f'${k:,.0f}' for k in summary['kinks'])}\n"
+        if summary.get("cliffs"):
+            cliffs = summary["cliffs"]
+            comment_body += f"- Cliffs (net income falls as earnings rise): baseline {cliffs['baseline']}, reform {cliffs['reform']}"
+            if cliffs.get("reform_locations"):
+                comment_body += f" (reform at {', '.join(f'${x:,.0f}' for x in cliffs['reform_locations'])})"
+            comment_body += "\n"
+        if summary.get("archetypes"):
+            comment_body += "| Household | Max benefit | Max loss | Affected earnings range |\n"
+            comment_body += "|-----------|-------------|----------|-------------------------|\n"
+            for label, row in summary["archetypes"].items():
+                affected = (
+                    f"${row['range_start']:,.0f} – ${row['range_end']:,.0f}"
+                    if row.get("range_start") is not None else "—"
+                )
+                comment_body += (
+                    f"| {label} | ${row.get('max_benefit', 0):,.0f} "
+                    f"| ${row.get('max_loss', 0):,.0f} | {affected} |\n"
+                )
 
     comment_body += (
         f"\n> Drag and drop `{chart_path.resolve()}` below to embed the chart.\n\n"
@@ -522,6 +1417,269 @@ def _get_repo_name() -> str | None:
     return None
 
 
+# =============================================================================
+# SWEEP + RENDER
+# =============================================================================
+
+def sweep_reform(reform: dict, options: dict) -> dict:
+    """Classify, simulate and summarize one reform; no rendering.
+
+    options carries the CLI settings (year, earnings_max, sweep, tolerance,
+    archetypes). The returned dict holds plain arrays so it can cross a
+    process boundary, and is turned into a figure by build_result_figure().
+    """
+    reform_id = reform["id"]
+    state = reform["state"]
+    reform_params = reform["reform"]
+    provisions = reform.get("provisions") or []
+
+    print("=" * 60)
+    print(f"Household Earnings Sweep: {reform['label']}")
+    print(f"ID: {reform_id} | State: {state.upper()}")
+    print("=" * 60)
+
+    # Determine year
+    sim_year = options.get("year") or get_effective_year_from_params(reform_params)
+    print(f"  Year: {sim_year}")
+
+    # Classify reform → pick household archetype
+    config = classify_reform(reform_params, provisions)
+    if options.get("earnings_max"):
+        config["earnings_max"] = options["earnings_max"]
+    print(f"  Archetype: {config['archetype']}")
+    print(f"  Earnings sweep: $0 – ${config['earnings_max']:,.0f}")
+    if config["thresholds"]:
+        print(f"  Thresholds: {', '.join(f'${t:,.0f}' for t in config['thresholds'])}")
+
+    metadata = {
+        "id": reform_id,
+        "state": state,
+        "title": reform["label"],
+        "year": sim_year,
+        "archetype": config["archetype"],
+    }
+    result = {"reform_id": reform_id, "config": config, "metadata": metadata}
+    sweep = options.get("sweep", "adaptive")
+    tolerance = options.get("tolerance", ADAPTIVE_TOLERANCE)
+    baseline_cache = options.get("baseline_cache", True)
+
+    if options.get("second_axis"):
+        dimension = options["second_axis"]
+        num_points, num_second = (int(n) for n in options.get("grid", GRID_2D).lower().split("x"))
+        print(f"  Second axis: {SECOND_AXES[dimension]['label']}")
+        config, earnings, second_values, baseline_net, reform_net, benefit = sweep_2d(
+            config, state, sim_year, copy.deepcopy(reform_params), dimension, num_points, num_second
+        )
+        metadata["archetype"] = config["archetype"]
+        summary = summarize_grid(earnings, second_values, benefit)
+        print_grid_summary(summary, dimension)
+        result.update({
+            "config": config,
+            "earnings": earnings,
+            "grid": {
+                "dimension": dimension,
+                "second_values": second_values,
+                "baseline_net": baseline_net,
+                "reform_net": reform_net,
+                "benefit": benefit,
+            },
+            "summary": summary,
+        })
+        return result
+
+    if options.get("archetypes"):
+        # Several archetypes packed into one baseline and one reform run per batch
+        names = list(ARCHETYPES) if options["archetypes"] == "all" else options["archetypes"].split(",")
+        configs = archetype_configs(names, config)
+        labels = [c["archetype"] for c in configs]
+        print(f"  Households: {', '.join(labels)}")
+
+        if sweep == "adaptive":
+            earnings, baseline_vals, reform_vals, benefits = adaptive_sweep(
+                configs, state, sim_year, copy.deepcopy(reform_params),
+                tolerance=tolerance, baseline_cache=baseline_cache,
+            )
+        else:
+            earnings = np.linspace(0, config["earnings_max"], NUM_POINTS)
+            ReformClass = create_reform_class(copy.deepcopy(reform_params))
+            baseline_vals, reform_vals = _simulate_points(
+                configs, state, sim_year, ReformClass, earnings, baseline_cache=baseline_cache
+            )
+            benefits = reform_vals - baseline_vals
+
+        benefit_by_label = dict(zip(labels, benefits))
+        kinks_by_label = {label: find_kinks(earnings, b) for label, b in benefit_by_label.items()}
+        metadata["archetype"] = ", ".join(labels)
+        result.update({
+            "earnings": earnings,
+            "benefits": benefit_by_label,
+            "summary": {"archetypes": print_archetype_table(earnings, benefit_by_label, kinks_by_label)},
+        })
+        return result
+
+    if sweep == "adaptive":
+        earnings, baseline_vals, reform_vals, benefit = adaptive_sweep(
+            [config], state, sim_year, copy.deepcopy(reform_params),
+            tolerance=tolerance, baseline_cache=baseline_cache,
+        )
+        baseline_vals, reform_vals, benefit = baseline_vals[0], reform_vals[0], benefit[0]
+    else:
+        # Build situation
+        situation = build_situation(config, state, sim_year)
+
+        # Run simulations
+        num_people = config.get("_num_people", len(config["adults"]) + len(config["children"]))
+        earnings, baseline_vals, reform_vals, benefit = run_simulations(
+            situation, copy.deepcopy(reform_params), sim_year, num_people,
+            state=state, config=config, baseline_cache=baseline_cache,
+        )
+    kinks = find_kinks(earnings, benefit)
+
+    result.update({
+        "earnings": earnings,
+        "benefit": benefit,
+        "kinks": kinks,
+        "summary": print_summary_stats(earnings, benefit, kinks),
+    })
+
+    if options.get("mtr"):
+        if options.get("mtr_method") == "offset":
+            baseline_mtr, reform_mtr = marginal_rates_offset(
+                [config], state, sim_year, copy.deepcopy(reform_params),
+                earnings, baseline_vals, reform_vals, baseline_cache=baseline_cache,
+            )
+            mtr = mtr_analysis(earnings, baseline_vals, reform_vals, baseline_mtr, reform_mtr)
+        else:
+            mtr = mtr_analysis(earnings, baseline_vals, reform_vals)
+        print_mtr_summary(mtr)
+        result["mtr"] = mtr
+        result["summary"]["cliffs"] = {
+            "baseline": len(mtr["cliffs"]["baseline"]),
+            "reform": len(mtr["cliffs"]["reform"]),
+            "reform_locations": [c["earnings_start"] for c in mtr["cliffs"]["reform"]],
+        }
+    return result
+
+
+def build_result_figure(result: dict):
+    """Plotly figure for a sweep_reform() result."""
+    if "grid" in result:
+        grid = result["grid"]
+        return build_heatmap_chart(
+            result["earnings"], grid["second_values"], grid["benefit"],
+            grid["dimension"], result["config"], result["metadata"],
+        )
+    if "benefits" in result:
+        return build_multi_chart(result["earnings"], result["benefits"], result["config"], result["metadata"])
+    return build_chart(
+        result["earnings"], result["benefit"], result["config"], result["metadata"], result["kinks"],
+        mtr=result.get("mtr"),
+    )
+
+
+def _svg_result(result: dict) -> str:
+    """Render a 1-D sweep result with the static SVG renderer."""
+    metadata = result["metadata"]
+    title = f"{metadata.get('state', '').upper()} {metadata.get('title', metadata.get('id', ''))} Impact by Earnings"
+    if "benefits" in result:
+        series = [
+            {"label": label, "values": benefit, "color": color}
+            for color, (label, benefit) in zip(ARCHETYPE_COLORS, result["benefits"].items())
+        ]
+        subtitle = f"{len(series)} households | Year {metadata.get('year', '')}"
+        return render_sweep_svg(
+            result["earnings"], series, title, subtitle, result["config"].get("thresholds"), fills=False
+        )
+    series = [{"label": "Net benefit", "values": result["benefit"], "color": "#2C7A7B"}]
+    subtitle = f"{result['config']['archetype']} | Year {metadata.get('year', '')}"
+    return render_sweep_svg(
+        result["earnings"], series, title, subtitle, result["config"].get("thresholds"), result.get("kinks")
+    )
+
+
+def render_results(items: list[tuple[dict, str]], renderer: str = "plotly", html: bool = True) -> list[str]:
+    """Write charts for (result, output_path) pairs; returns the chart paths.
+
+    renderer="svg" draws 1-D sweeps with svg_chart (no browser; PNG via
+    cairosvg when installed) and only touches plotly when html is set.
+    Heatmaps and MTR panels always go through plotly.
+    """
+    paths = [None] * len(items)
+    plotly_items = []
+    for i, (result, path) in enumerate(items):
+        if renderer == "svg" and "grid" not in result and "mtr" not in result:
+            paths[i] = save_svg(_svg_result(result), path)
+            if html:
+                html_path = Path(path).with_suffix(".html")
+                build_result_figure(result).write_html(str(html_path), include_plotlyjs="cdn")
+                print(f"  Interactive chart: {html_path}")
+        else:
+            plotly_items.append(i)
+
+    if plotly_items:
+        saved = save_figures([(build_result_figure(items[i][0]), items[i][1]) for i in plotly_items])
+        for i, chart_path in zip(plotly_items, saved):
+            paths[i] = chart_path
+
+    for result, path in items:
+        if "grid" in result:
+            export_grid(result, path)
+    return paths
+
+
+def _sweep_worker(reform: dict, options: dict) -> tuple[dict | None, str, str | None]:
+    """Process-pool entry point: returns (result, captured output, error)."""
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            result = sweep_reform(reform, options)
+        return result, buffer.getvalue(), None
+    except Exception as e:
+        return None, buffer.getvalue(), f"{type(e).__name__}: {e}"
+
+
+def run_batch(
+    reforms: list[dict],
+    options: dict,
+    output_dir: str,
+    workers: int | None,
+    renderer: str = "plotly",
+    html: bool = True,
+) -> int:
+    """Sweep many reforms in parallel, then render every chart in one renderer.
+
+    Simulations fan out across worker processes; figures are built and
+    exported in this process so Kaleido/Chromium starts once for the batch.
+    """
+    results = []
+    failures = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(_sweep_worker, reform, options): reform["id"] for reform in reforms}
+        for done, future in enumerate(as_completed(futures), start=1):
+            reform_id = futures[future]
+            result, log, error = future.result()
+            print(log, end="")
+            if error:
+                print(f"  [{done}/{len(reforms)}] {reform_id}: FAILED ({error})")
+                failures.append(reform_id)
+            else:
+                print(f"  [{done}/{len(reforms)}] {reform_id}: swept")
+                results.append(result)
+
+    if results:
+        print(f"\nRendering {len(results)} chart(s)...")
+        results.sort(key=lambda r: r["reform_id"])
+        render_results(
+            [(result, str(Path(output_dir) / f"{result['reform_id']}.png")) for result in results],
+            renderer, html,
+        )
+
+    print(f"\n  Done: {len(results)} chart(s), {len(failures)} failed")
+    if failures:
+        print(f"  Failed: {', '.join(failures)}")
+    return 1 if failures else 0
+
+
 # =============================================================================
 # MAIN
 # =============================================================================
@@ -535,14 +1693,30 @@ Examples:
     python scripts/generate_household_chart.py --reform-id ct-hb5134
     python scripts/generate_household_chart.py --reform-id ct-hb5134 --upload-to-pr 119
     python scripts/generate_household_chart.py --reform-id va-hb979 --earnings-max 2000000
+    python scripts/generate_household_chart.py --reform-id ct-hb5134 --archetypes single,married_children
+    python scripts/generate_household_chart.py --all --workers 8
+    python scripts/generate_household_chart.py --ids ct-hb5134,va-hb979 --output-dir charts/review
+    python scripts/generate_household_chart.py --reform-id ct-hb5134 --second-axis spouse_earnings
+    python scripts/generate_household_chart.py --reform-id ct-hb5134 --mtr --mtr-method offset
+    python scripts/generate_household_chart.py --all --renderer svg
         """,
     )
-    parser.add_argument(
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument(
         "--reform-id",
         type=str,
-        required=True,
         help="Reform ID (e.g., 'ct-hb5134')",
     )
+    target.add_argument(
+        "--ids",
+        type=str,
+        help="Comma-separated reform IDs to chart in one batch",
+    )
+    target.add_argument(
+        "--all",
+        action="store_true",
+        help="Chart every reform with reform_params",
+    )
     parser.add_argument(
         "--earnings-max",
         type=float,
@@ -555,6 +1729,18 @@ Examples:
         default=None,
         help="Output PNG path (default: charts/<reform-id>.png)",
     )
+    parser.add_argument(
+        "--output-dir",
+        type=str,
+        default="charts",
+        help="Output directory for --ids/--all (default: charts/)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for --ids/--all (default: CPU count)",
+    )
     parser.add_argument(
         "--upload-to-pr",
         type=int,
@@ -567,8 +1753,73 @@ Examples:
         default=None,
         help="Simulation year (auto-detects from reform params if not specified)",
     )
+    parser.add_argument(
+        "--sweep",
+        choices=["adaptive", "uniform"],
+        default="adaptive",
+        help="Earnings grid: adaptive refinement around kinks (default) or a fixed uniform grid",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=ADAPTIVE_TOLERANCE,
+        help=f"Adaptive sweep error budget in dollars (default: {ADAPTIVE_TOLERANCE})",
+    )
+    parser.add_argument(
+        "--archetypes",
+        type=str,
+        default=None,
+        help=f"Comma-separated households to sweep together ({', '.join(ARCHETYPES)}) or 'all'",
+    )
+    parser.add_argument(
+        "--no-baseline-cache",
+        action="store_true",
+        help="Always re-simulate the baseline instead of using the on-disk cache",
+    )
+    parser.add_argument(
+        "--second-axis",
+        choices=list(SECOND_AXES),
+        default=None,
+        help="Sweep a second dimension and render a benefit heatmap (exports CSV/NPZ)",
+    )
+    parser.add_argument(
+        "--grid",
+        type=str,
+        default=GRID_2D,
+        help=f"2-D grid size as EARNINGSxSECOND points (default: {GRID_2D}; 'children' uses 0..{SECOND_AXES['children']['max']})",
+    )
+    parser.add_argument(
+        "--mtr",
+        action="store_true",
+        help="Add a marginal rate / cliff panel and cliff counts to the summary",
+    )
+    parser.add_argument(
+        "--mtr-method",
+        choices=["gradient", "offset"],
+        default="gradient",
+        help=f"Marginal rates from finite differences of the sweep (default) or a paired +${MTR_OFFSET:,.0f} run",
+    )
+    parser.add_argument(
+        "--renderer",
+        choices=["plotly", "svg"],
+        default="plotly",
+        help="Static chart renderer: plotly/Kaleido (default) or the browser-free SVG renderer",
+    )
+    parser.add_argument(
+        "--html",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Also write interactive HTML (default: on for plotly, off for svg)",
+    )
     args = parser.parse_args()
 
+    if args.mtr and (args.second_axis or args.archetypes):
+        parser.error("--mtr applies to single-household earnings sweeps only")
+    if args.second_axis and args.archetypes:
+        parser.error("--second-axis and --archetypes can't be combined")
+    if args.upload_to_pr and not args.reform_id:
+        parser.error("--upload-to-pr requires --reform-id")
+
     # Connect to Supabase
     supabase = get_supabase_client()
     if not supabase:
@@ -576,82 +1827,49 @@ Examples:
         print("Run: source .env")
         return 1
 
-    # Load reform data
-    reforms = load_reforms_from_db(supabase, args.reform_id)
-    if not reforms:
-        print(f"Error: Reform '{args.reform_id}' not found or has no reform_params")
-        return 1
-
-    reform = reforms[0]
-    reform_id = reform["id"]
-    state = reform["state"]
-    reform_params = reform["reform"]
-
-    print("=" * 60)
-    print(f"Household Earnings Sweep: {reform['label']}")
-    print(f"ID: {reform_id} | State: {state.upper()}")
-    print("=" * 60)
-
-    # Fetch provisions separately (load_reforms_from_db doesn't include them)
-    provisions = []
-    try:
-        prov_result = (
-            supabase.table("reform_impacts")
-            .select("provisions")
-            .eq("id", reform_id)
-            .execute()
-        )
-        if prov_result.data and prov_result.data[0].get("provisions"):
-            provisions = prov_result.data[0]["provisions"]
-            if isinstance(provisions, str):
-                provisions = json.loads(provisions)
-    except Exception as e:
-        print(f"  Warning: Could not fetch provisions: {e}")
-
-    # Determine year
-    sim_year = args.year or get_effective_year_from_params(reform_params)
-    print(f"  Year: {sim_year}")
-
-    # Classify reform → pick household archetype
-    config = classify_reform(reform_params, provisions)
-    if args.earnings_max:
-        config["earnings_max"] = args.earnings_max
-    print(f"  Archetype: {config['archetype']}")
-    print(f"  Earnings sweep: $0 – ${config['earnings_max']:,.0f}")
-    if config["thresholds"]:
-        print(f"  Thresholds: {', '.join(f'${t:,.0f}' for t in config['thresholds'])}")
-
-    # Build situation
-    situation = build_situation(config, state, sim_year)
-
-    # Run simulations
-    num_people = config.get("_num_people", len(config["adults"]) + len(config["children"]))
-    earnings, baseline_vals, reform_vals, benefit = run_simulations(
-        situation, copy.deepcopy(reform_params), sim_year, num_people
-    )
-
-    # Summary stats
-    summary = print_summary_stats(earnings, benefit)
+    options = {
+        "year": args.year,
+        "earnings_max": args.earnings_max,
+        "sweep": args.sweep,
+        "tolerance": args.tolerance,
+        "archetypes": args.archetypes,
+        "baseline_cache": not args.no_baseline_cache,
+        "mtr": args.mtr,
+        "mtr_method": args.mtr_method,
+        "second_axis": args.second_axis,
+        "grid": args.grid,
+    }
 
-    # Determine output path
-    if args.output:
-        output_path = args.output
+    # Load reform data (with provisions) in a single query
+    if args.reform_id:
+        reforms = load_reforms_from_db(supabase, args.reform_id, include_provisions=True)
+        if not reforms:
+            print(f"Error: Reform '{args.reform_id}' not found or has no reform_params")
+            return 1
     else:
-        output_path = f"charts/{reform_id}.png"
+        ids = [i.strip() for i in args.ids.split(",") if i.strip()] if args.ids else None
+        reforms = load_reforms_from_db(supabase, reform_ids=ids, include_provisions=True)
+        if ids:
+            missing = sorted(set(ids) - {r["id"] for r in reforms})
+            if missing:
+                print(f"  Warning: not found or no reform_params: {', '.join(missing)}")
+        if not reforms:
+            print("Error: No reforms to chart")
+            return 1
+        print(f"Charting {len(reforms)} reform(s) into {args.output_dir}/")
+        html = args.html if args.html is not None else args.renderer == "plotly"
+        return run_batch(reforms, options, args.output_dir, args.workers, args.renderer, html)
+
+    result = sweep_reform(reforms[0], options)
 
     # Generate chart
-    metadata = {
-        "id": reform_id,
-        "state": state,
-        "title": reform["label"],
-        "year": sim_year,
-        "archetype": config["archetype"],
-    }
-    chart_path = generate_chart(earnings, benefit, config, metadata, output_path)
+    output_path = args.output or f"charts/{result['reform_id']}.png"
+    html = args.html if args.html is not None else args.renderer == "plotly"
+    chart_path = render_results([(result, output_path)], args.renderer, html)[0]
 
     # Upload to PR if requested
     if args.upload_to_pr:
-        upload_to_pr(chart_path, args.upload_to_pr, metadata, summary)
+        upload_to_pr(chart_path, args.upload_to_pr, result["metadata"], result["summary"])
 
     print("\n  Done!")
     return 0
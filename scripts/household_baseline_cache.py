@@ -0,0 +1,90 @@
+"""
+On-disk cache of baseline household sweeps for generate_household_chart.py.
+
+The baseline side of a household earnings sweep depends only on the state,
+year, household composition and earnings points, never on the reform. This
+module stores baseline household_net_income per earnings point so repeated
+charts (review cycles, several bills in one state) only simulate the reform.
+
+Entries are keyed by state, year, household (adult ages, child ages, filing
+status) and the installed policyengine-us version; within an entry values
+are looked up point by point, so uniform and adaptive grids share hits.
+
+Layout:
+    <BASELINE_CACHE_DIR>/<key>.npz   (arrays: earnings, net_income)
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+# Cache directory (override with HOUSEHOLD_BASELINE_CACHE_DIR)
+BASELINE_CACHE_DIR = Path(
+    os.environ.get(
+        "HOUSEHOLD_BASELINE_CACHE_DIR",
+        Path.home() / ".cache" / "policyengine-household-baselines",
+    )
+)
+
+# Earnings points are matched after rounding to cents
+POINT_DECIMALS = 2
+
+
+def household_key(state: str, year: int, config: dict) -> str:
+    """Cache key for one household archetype under the installed model."""
+    from compute_impacts import get_installed_version
+
+    payload = {
+        "state": state.upper(),
+        "year": int(year),
+        "adults": list(config["adults"]),
+        "children": list(config["children"]),
+        "is_married": bool(config["is_married"]),
+        "policyengine_us": get_installed_version("policyengine-us"),
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+
+
+def _entry_path(key: str) -> Path:
+    return BASELINE_CACHE_DIR / f"{key}.npz"
+
+
+def _read_entry(key: str) -> dict[float, float]:
+    path = _entry_path(key)
+    if not path.exists():
+        return {}
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            return dict(zip(data["earnings"].tolist(), data["net_income"].tolist()))
+    except (OSError, ValueError, KeyError):
+        # Corrupt or partially written entry: treat as a miss
+        return {}
+
+
+def lookup_baseline(state: str, year: int, config: dict, points: np.ndarray) -> np.ndarray:
+    """Cached baseline net income at each point; NaN where not cached."""
+    entry = _read_entry(household_key(state, year, config))
+    rounded = np.round(np.asarray(points, dtype=float), POINT_DECIMALS)
+    return np.array([entry.get(float(x), np.nan) for x in rounded])
+
+
+def store_baseline(state: str, year: int, config: dict, points: np.ndarray, net_income: np.ndarray):
+    """Merge newly simulated baseline points into the household's entry."""
+    key = household_key(state, year, config)
+    entry = _read_entry(key)
+    rounded = np.round(np.asarray(points, dtype=float), POINT_DECIMALS)
+    entry.update(zip(rounded.tolist(), np.asarray(net_income, dtype=float).tolist()))
+
+    earnings = np.array(sorted(entry))
+    values = np.array([entry[x] for x in earnings])
+
+    BASELINE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path = _entry_path(key)
+    # Per-process temp name so parallel batch workers never share a file
+    tmp_path = path.with_name(f".{key}.{os.getpid()}.tmp.npz")
+    np.savez(tmp_path, earnings=earnings, net_income=values)
+    tmp_path.replace(path)
@@ -0,0 +1,495 @@
+#!/usr/bin/env python3
+"""
+Load-test modal_app.py end to end with stub upstreams.
+
+Builds the same FastAPI app web() serves (create_app) against a generated
+fixture dist/, with every upstream stubbed in-process: PostHog, Supabase
+and the PolicyEngine API through an httpx transport with configurable
+latency, Resend through a fake `resend` module. It then drives a weighted
+mix of traffic — hashed assets, prerendered pages, SPA fallback routes,
+404s, the PostHog ingest proxy, the data bundle and bill analysis
+requests — through httpx's in-process ASGI transport and/or a real uvicorn
+server on localhost, and reports requests/sec and p50/p95/p99 latency
+overall and per kind of request.
+
+Save a run with --save and compare later runs against it with --compare,
+so every server-side change can be checked against a baseline.
+
+Usage:
+    python scripts/loadtest.py
+    python scripts/loadtest.py --transport uvicorn --requests 20000 --concurrency 100
+    python scripts/loadtest.py --save baseline.json
+    python scripts/loadtest.py --compare baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import sys
+import tempfile
+import time
+import types
+from collections import Counter, defaultdict
+from pathlib import Path
+
+import httpx
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+# Relative weights of each kind of request in the generated traffic
+TRAFFIC_MIX = {
+    "asset": 35,
+    "prerendered": 20,
+    "spa_fallback": 10,
+    "not_found": 10,
+    "ingest": 15,
+    "bundle": 5,
+    "bill_request": 5,
+}
+
+FIXTURE_STATES = ["GA", "UT", "NY", "CA", "TX"]
+FIXTURE_BILLS_PER_STATE = 8
+
+# Upstream hosts the stubs answer for (SUPABASE_URL is pointed here)
+STUB_SUPABASE_URL = "https://supabase.stub"
+
+# The load generator's own client class, saved before install_stubs() patches httpx
+HTTPX_CLIENT = httpx.AsyncClient
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+def fixture_bills() -> list[dict]:
+    return [
+        {
+            "id": f"{state.lower()}-sb{n}",
+            "state": state,
+            "type": "bill",
+            "status": "published",
+            "title": f"SB{n} Income tax changes",
+            "description": f"Fixture bill {n} for {state}",
+        }
+        for state in FIXTURE_STATES
+        for n in range(1, FIXTURE_BILLS_PER_STATE + 1)
+    ]
+
+
+def build_fixture_dist(path: str, precompress: bool = True) -> dict:
+    """Write a dist/ shaped like a real build + prerender; returns its URL paths."""
+    root = Path(path)
+    assets = root / "_tracker"
+    assets.mkdir(parents=True, exist_ok=True)
+
+    rng = random.Random(0)
+    words = ["policy", "engine", "state", "bill", "tax", "credit", "return", "const", "function"]
+    js = "\n".join(f"const v{i} = '{' '.join(rng.choices(words, k=12))}';" for i in range(6000))
+    (assets / "index-Bx7kQ2fa.js").write_text(js)
+    (assets / "index-Cq81mZ0d.css").write_text("\n".join(f".c{i} {{ margin: {i % 7}px; }}" for i in range(3000)))
+    (assets / "logo-D9s2kLx1.svg").write_text('<svg xmlns="http://www.w3.org/2000/svg"><rect width="10" height="10"/></svg>')
+
+    shell = (
+        "<!doctype html><html><head><title>State Legislative Tracker</title>"
+        '<meta name="description" content="Tracker" />'
+        '<script type="module" src="/_tracker/index-Bx7kQ2fa.js"></script>'
+        '<link rel="stylesheet" href="/_tracker/index-Cq81mZ0d.css">'
+        "</head><body><div id=\"root\"></div></body></html>"
+    )
+    (root / "index.html").write_text(shell.replace("</body>", "<noscript>" + "<p>home</p>" * 200 + "</noscript></body>"))
+
+    bills = fixture_bills()
+    routes = {"sitemap.xml", "robots.txt"}
+    prerendered = []
+    for bill in bills:
+        state = bill["state"]
+        routes.update({state, f"{state}/{bill['id']}"})
+        # Prerender half the bills; the rest are SPA fallback routes
+        if int(bill["id"].rsplit("sb", 1)[1]) % 2:
+            page = root / state / bill["id"] / "index.html"
+            page.parent.mkdir(parents=True, exist_ok=True)
+            page.write_text(shell.replace("</body>", f"<noscript>{bill['title'] * 40}</noscript></body>"))
+            prerendered.append(f"/{state}/{bill['id']}")
+    for state in FIXTURE_STATES:
+        (root / state / "index.html").write_text(shell)
+        prerendered.append(f"/{state}")
+
+    (root / "_valid_routes.json").write_text(json.dumps(sorted(routes)))
+    (root / "robots.txt").write_text("User-agent: *\nAllow: /\n")
+    (root / "sitemap.xml").write_text("<urlset>" + "<url><loc>x</loc></url>" * 100 + "</urlset>")
+
+    if precompress:
+        from precompress_dist import precompress as write_variants
+
+        write_variants(path)
+
+    return {
+        "asset": [f"/_tracker/{p.name}" for p in sorted(assets.iterdir()) if p.suffix not in (".br", ".gz")],
+        "prerendered": ["/"] + prerendered,
+        "spa_fallback": [f"/{b['state']}/{b['id']}" for b in bills if f"/{b['state']}/{b['id']}" not in prerendered],
+        "not_found": ["/no-such-page", "/GA/not-a-bill/extra", "/favicon-missing.ico", "/wp-login.php"],
+    }
+
+
+# =============================================================================
+# STUB UPSTREAMS
+# =============================================================================
+
+def make_stub_transport(latency_ms: float, calls: Counter):
+    """httpx transport answering PostHog, Supabase and the PolicyEngine API."""
+
+    class StubBody(httpx.AsyncByteStream):
+        """Streamed body, so the proxy's streamed relay path is exercised."""
+
+        def __init__(self, data: bytes):
+            self.data = data
+
+        async def __aiter__(self):
+            yield self.data
+
+    research = fixture_bills()
+    impacts = [
+        {"id": b["id"], "computed": True, "computed_at": "2026-01-01T00:00:00", "budgetary_impact": {"stateRevenueImpact": -1e6},
+         "district_impacts": {str(d): {"avgBenefit": d} for d in range(20)}, "model_notes": "{}", "provisions": []}
+        for b in research
+    ]
+
+    class StubTransport(httpx.AsyncBaseTransport):
+        async def handle_async_request(self, request):
+            async for _ in request.stream:
+                pass
+            host = request.url.host
+            calls[host] += 1
+            if latency_ms:
+                await asyncio.sleep(random.expovariate(1.0 / latency_ms) / 1000)
+
+            if host == "supabase.stub":
+                table = request.url.path.rsplit("/", 1)[-1]
+                if request.method == "POST":
+                    body = b"[]"
+                else:
+                    rows = research if table == "research" else impacts
+                    select = request.url.params.get("select", "*")
+                    if select != "*":
+                        rows = [{k: r.get(k) for k in select.split(",")} for r in rows]
+                    body = json.dumps(rows).encode()
+            elif "posthog" in host:
+                body = b'{"status":1}'
+            else:
+                body = b'{"status":"ok","result":{}}'
+            return httpx.Response(200, headers={"content-type": "application/json"}, stream=StubBody(body))
+
+    return StubTransport()
+
+
+def install_stubs(latency_ms: float) -> Counter:
+    """Route every httpx.AsyncClient and resend call to in-process stubs.
+
+    Must run before modal_app.create_app() builds its clients. Returns the
+    per-host call counter.
+    """
+    calls = Counter()
+    transport = make_stub_transport(latency_ms, calls)
+
+    class StubbedClient(HTTPX_CLIENT):
+        def __init__(self, *args, **kwargs):
+            kwargs.pop("http2", None)
+            kwargs["transport"] = transport
+            super().__init__(*args, **kwargs)
+
+    httpx.AsyncClient = StubbedClient
+
+    def send_email(message):
+        calls["resend"] += 1
+        time.sleep(latency_ms / 1000)
+        return {"id": "stub"}
+
+    sys.modules["resend"] = types.SimpleNamespace(api_key=None, Emails=types.SimpleNamespace(send=send_email))
+
+    os.environ.update({
+        "SUPABASE_URL": STUB_SUPABASE_URL,
+        "SUPABASE_KEY": "stub",
+        "SUPABASE_ANON_KEY": "stub",
+        "RESEND_API_KEY": "stub",
+        "BILL_REQUEST_SPOOL_DIR": tempfile.mkdtemp(prefix="loadtest-spool-"),
+    })
+    # No background polling during a run
+    os.environ.setdefault("ROUTE_REFRESH_INTERVAL", "0")
+    return calls
+
+
+# =============================================================================
+# LOAD GENERATION
+# =============================================================================
+
+def request_plan(paths: dict, total: int, seed: int = 0) -> list[tuple]:
+    """Deterministic list of (kind, method, path, body, headers) to replay."""
+    rng = random.Random(seed)
+    kinds = list(TRAFFIC_MIX)
+    weights = [TRAFFIC_MIX[k] for k in kinds]
+    plan = []
+    for i, kind in enumerate(rng.choices(kinds, weights=weights, k=total)):
+        headers = {"accept-encoding": "gzip, br"}
+        if kind == "ingest":
+            event = {"api_key": "phc_loadtest", "event": "$pageview", "properties": {"distinct_id": f"u{i % 500}"}}
+            plan.append((kind, "POST", "/ingest/e/", json.dumps(event).encode(),
+                         {**headers, "content-type": "application/json"}))
+        elif kind == "bundle":
+            plan.append((kind, "GET", "/api/bundle", None, headers))
+        elif kind == "bill_request":
+            payload = {
+                "state": "GA", "bill_number": f"SB{i % 50}", "title": "Load test",
+                "bill_url": "https://example.org/bill", "requester_email": f"user{i}@example.org",
+            }
+            # Stands in for the hop Modal's proxy appends: one simulated client per address
+            plan.append((kind, "POST", "/api/bill-analysis-request", json.dumps(payload).encode(),
+                         {**headers, "content-type": "application/json", "x-forwarded-for": f"10.0.{i % 250}.{i % 7}"}))
+        else:
+            plan.append((kind, "GET", rng.choice(paths[kind]), None, headers))
+    return plan
+
+
+async def drive(client, plan: list[tuple], concurrency: int) -> dict:
+    latencies = defaultdict(list)
+    statuses = defaultdict(Counter)
+    sizes = Counter()
+    queue = iter(plan)
+
+    async def worker():
+        for kind, method, path, body, headers in queue:
+            start = time.perf_counter()
+            response = await client.request(method, path, content=body, headers=headers)
+            await response.aread()
+            latencies[kind].append(time.perf_counter() - start)
+            statuses[kind][response.status_code] += 1
+            sizes[kind] += response.num_bytes_downloaded
+
+    # Warm up every path once (manifest, caches, connection pool)
+    for kind, method, path, body, headers in {(p[0], p[1], p[2]): p for p in plan}.values():
+        await (await client.request(method, path, content=body, headers=headers)).aread()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return summarize(latencies, statuses, sizes, elapsed)
+
+
+def _percentiles(seconds: list[float]) -> dict:
+    ms = np.array(seconds) * 1000
+    return {
+        "count": len(ms),
+        "p50_ms": float(np.percentile(ms, 50)),
+        "p95_ms": float(np.percentile(ms, 95)),
+        "p99_ms": float(np.percentile(ms, 99)),
+    }
+
+
+def summarize(latencies: dict, statuses: dict, sizes: Counter, elapsed: float) -> dict:
+    everything = [x for values in latencies.values() for x in values]
+    return {
+        "seconds": elapsed,
+        "rps": len(everything) / elapsed,
+        **_percentiles(everything),
+        "kinds": {
+            kind: {
+                **_percentiles(values),
+                "statuses": {str(k): v for k, v in sorted(statuses[kind].items())},
+                "avg_bytes": sizes[kind] / len(values),
+            }
+            for kind, values in sorted(latencies.items())
+        },
+    }
+
+
+async def run_asgi(app, plan: list[tuple], concurrency: int) -> dict:
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with HTTPX_CLIENT(transport=transport, base_url="http://loadtest") as client:
+            return await drive(client, plan, concurrency)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def serve(dist: str, port: int, latency_ms: float):
+    """Child process for --transport uvicorn: the app with stubs, under uvicorn."""
+    import signal
+
+    import uvicorn
+
+    calls = install_stubs(latency_ms)
+    from modal_app import create_app
+
+    server = uvicorn.Server(uvicorn.Config(
+        create_app(dist_path=dist), host="127.0.0.1", port=port, log_level="warning", lifespan="on",
+    ))
+    signal.signal(signal.SIGTERM, lambda *_: setattr(server, "should_exit", True))
+    server.run()
+    print(f"  [uvicorn] upstream calls: {dict(calls)}")
+
+
+class _RawResponse:
+    def __init__(self, status_code: int, num_bytes_downloaded: int):
+        self.status_code = status_code
+        self.num_bytes_downloaded = num_bytes_downloaded
+
+    async def aread(self):
+        pass
+
+
+class KeepAliveClient:
+    """Minimal HTTP/1.1 keep-alive client for the uvicorn run.
+
+    httpx tops out at a few hundred requests/sec per process at this
+    concurrency, which would measure the client instead of the server. This
+    pools raw connections and reads Content-Length or chunked bodies only.
+    """
+
+    def __init__(self, host: str, port: int):
+        self.host, self.port = host, port
+        self.idle = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        for _, writer in self.idle:
+            writer.close()
+        self.idle.clear()
+
+    async def request(self, method: str, path: str, content: bytes | None = None, headers: dict | None = None):
+        reader, writer = self.idle.pop() if self.idle else await asyncio.open_connection(self.host, self.port)
+        body = content or b""
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {self.host}", f"Content-Length: {len(body)}"]
+        lines += [f"{name}: {value}" for name, value in (headers or {}).items()]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode() + body)
+        await writer.drain()
+
+        head = await reader.readuntil(b"\r\n\r\n")
+        status_line, *header_lines = head.decode("latin-1").split("\r\n")
+        fields = {}
+        for line in header_lines:
+            name, _, value = line.partition(":")
+            fields[name.strip().lower()] = value.strip()
+
+        size = 0
+        if "content-length" in fields:
+            size = len(await reader.readexactly(int(fields["content-length"])))
+        elif fields.get("transfer-encoding") == "chunked":
+            while True:
+                chunk_size = int((await reader.readuntil(b"\r\n")).split(b";")[0], 16)
+                size += len(await reader.readexactly(chunk_size + 2)) - 2
+                if chunk_size == 0:
+                    break
+
+        if fields.get("connection") == "close":
+            writer.close()
+        else:
+            self.idle.append((reader, writer))
+        return _RawResponse(int(status_line.split()[1]), size)
+
+
+async def run_uvicorn(dist: str, latency_ms: float, plan: list[tuple], concurrency: int) -> dict:
+    """Drive a uvicorn server in its own process, so client and server don't share a GIL."""
+    port = _free_port()
+    child = await asyncio.create_subprocess_exec(
+        sys.executable, __file__, "--serve", dist, "--port", str(port),
+        "--upstream-latency", str(latency_ms),
+    )
+    try:
+        async with KeepAliveClient("127.0.0.1", port) as client:
+            deadline = time.monotonic() + 30
+            while True:
+                try:
+                    await client.request("GET", "/robots.txt")
+                    break
+                except OSError:
+                    if child.returncode is not None or time.monotonic() > deadline:
+                        raise RuntimeError("uvicorn server failed to start")
+                    await asyncio.sleep(0.1)
+            return await drive(client, plan, concurrency)
+    finally:
+        child.terminate()
+        await child.wait()
+
+
+# =============================================================================
+# REPORTING
+# =============================================================================
+
+def print_report(name: str, result: dict, baseline: dict | None = None):
+    print(f"\n  [{name}] {result['rps']:,.0f} req/s   p50 {result['p50_ms']:.2f} ms   "
+          f"p95 {result['p95_ms']:.2f} ms   p99 {result['p99_ms']:.2f} ms")
+    if baseline:
+        print(f"  vs baseline: {result['rps'] / baseline['rps']:.2f}x req/s, "
+              f"p99 {result['p99_ms'] - baseline['p99_ms']:+.2f} ms")
+    print(f"    {'Kind':14} {'n':>7} {'p50 (ms)':>9} {'p95 (ms)':>9} {'p99 (ms)':>9} {'avg KiB':>8}  statuses")
+    for kind, r in result["kinds"].items():
+        statuses = " ".join(f"{code}x{n}" for code, n in r["statuses"].items())
+        delta = ""
+        if baseline and kind in baseline.get("kinds", {}):
+            delta = f"  (p99 {r['p99_ms'] - baseline['kinds'][kind]['p99_ms']:+.2f})"
+        print(f"    {kind:14} {r['count']:7d} {r['p50_ms']:9.2f} {r['p95_ms']:9.2f} {r['p99_ms']:9.2f} "
+              f"{r['avg_bytes'] / 1024:8.1f}  {statuses}{delta}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test modal_app.py with stub upstreams")
+    parser.add_argument("--transport", choices=["asgi", "uvicorn", "both"], default="both",
+                        help="In-process ASGI transport, real uvicorn, or both (default)")
+    parser.add_argument("--requests", type=int, default=10000, help="Requests per run")
+    parser.add_argument("--concurrency", type=int, default=100,
+                        help="Concurrent clients (default 100, matching allow_concurrent_inputs)")
+    parser.add_argument("--upstream-latency", type=float, default=20.0,
+                        help="Mean stub upstream latency in ms (exponential; default 20)")
+    parser.add_argument("--save", help="Write results JSON here (a baseline for later runs)")
+    parser.add_argument("--compare", help="Baseline JSON from an earlier --save run")
+    # Internal: run the stubbed app under uvicorn (the --transport uvicorn server)
+    parser.add_argument("--serve", metavar="DIST", help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.serve, args.port, args.upstream_latency)
+        return 0
+
+    calls = install_stubs(args.upstream_latency)
+    from modal_app import create_app
+
+    with tempfile.TemporaryDirectory(prefix="loadtest-dist-") as dist:
+        paths = build_fixture_dist(dist)
+
+        plan = request_plan(paths, args.requests)
+        mix = ", ".join(f"{k} {v}" for k, v in TRAFFIC_MIX.items())
+        print(f"Load test: {args.requests} requests x {args.concurrency} concurrent "
+              f"(stub upstream latency ~{args.upstream_latency:.0f} ms)")
+        print(f"  Mix: {mix}")
+
+        baseline = json.loads(Path(args.compare).read_text()) if args.compare else {}
+        results = {}
+        transports = ["asgi", "uvicorn"] if args.transport == "both" else [args.transport]
+        for name in transports:
+            if name == "asgi":
+                results[name] = asyncio.run(run_asgi(create_app(dist_path=dist), plan, args.concurrency))
+                print_report(name, results[name], baseline.get(name))
+                print(f"  [asgi] upstream calls: {dict(calls)}")
+            else:
+                results[name] = asyncio.run(run_uvicorn(dist, args.upstream_latency, plan, args.concurrency))
+                print_report(name, results[name], baseline.get(name))
+
+    if args.save:
+        Path(args.save).write_text(json.dumps(results, indent=2))
+        print(f"\n  Results saved: {args.save}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,296 @@
+"""
+Shared OpenStates API v3 client for openstates_monitor.py and refresh_bill_status.py.
+
+One pooled requests.Session per process, so consecutive calls reuse the
+TCP/TLS connection instead of handshaking every time. Rate-limited (429)
+and transient server or network failures are retried with jittered
+exponential backoff; when the server says how long to wait (Retry-After or
+the X-RateLimit-* headers) that wait is used instead of a guess.
+
+Every request, retries included, first takes a token from RateLimiter: a
+token bucket for the per-minute limit plus a per-day counter, kept in a
+locked state file so concurrent runs of either script share one budget.
+Scripts call check_quota() up front and refuse work the day can't finish.
+
+Usage:
+    from openstates_client import get_client
+
+    client = get_client()
+    bill = client.get("/bills/ocd-bill/...", {"include": "actions"})
+    for page in client.pages("/bills", {"q": "flat tax"}, max_pages=3):
+        print(page.page, page.max_page, len(page.results))
+
+State file:
+    <OPENSTATES_RATE_STATE>  (JSON: tokens, updated, day, used)
+"""
+
+import fcntl
+import json
+import os
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Iterator, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+OPENSTATES_BASE_URL = os.environ.get("OPENSTATES_BASE_URL", "https://v3.openstates.org")
+
+# (connect, read) seconds; search queries with include=actions can be slow
+TIMEOUT = (5, 30)
+
+MAX_RETRIES = 3
+
+# Backoff when the server gives no hint: BACKOFF_BASE * 2**attempt, full jitter
+BACKOFF_BASE = 2.0
+
+# Never sleep longer than this on a single retry, whatever the headers say
+MAX_WAIT = 120.0
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Free tier limits, shared by every script using the same API key
+REQUESTS_PER_MINUTE = int(os.environ.get("OPENSTATES_REQUESTS_PER_MINUTE", "10"))
+REQUESTS_PER_DAY = int(os.environ.get("OPENSTATES_REQUESTS_PER_DAY", "250"))
+
+# Bucket capacity. OpenStates counts a sliding minute, so any burst above 1
+# can briefly exceed REQUESTS_PER_MINUTE (the 429 retry path absorbs that)
+BURST = int(os.environ.get("OPENSTATES_BURST", "1"))
+
+# Limiter state (override with OPENSTATES_RATE_STATE)
+RATE_STATE_PATH = Path(
+    os.environ.get(
+        "OPENSTATES_RATE_STATE",
+        Path.home() / ".cache" / "policyengine-openstates" / "rate_limit.json",
+    )
+)
+
+
+class QuotaExceeded(RuntimeError):
+    """The daily OpenStates quota can't cover the requested work."""
+
+
+@dataclass
+class Page:
+    """One page of a paginated OpenStates listing."""
+
+    results: list[dict]
+    page: int
+    max_page: int
+    total_items: int
+
+    @property
+    def has_more(self) -> bool:
+        return self.page < self.max_page
+
+
+def _header_seconds(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After / reset header (delta, epoch or HTTP date)."""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    else:
+        # Reset headers are sometimes an epoch timestamp rather than a delta
+        if seconds > 1e9:
+            seconds -= time.time()
+    return max(seconds, 0.0)
+
+
+class RateLimiter:
+    """Token bucket (per minute) plus daily counter, shared across processes.
+
+    State lives in a JSON file guarded by flock, so the monitor and the
+    status refresh draw from one budget even when run side by side. The
+    daily count resets at midnight UTC.
+    """
+
+    def __init__(
+        self,
+        path: Path = RATE_STATE_PATH,
+        per_minute: int = REQUESTS_PER_MINUTE,
+        per_day: int = REQUESTS_PER_DAY,
+        burst: int = BURST,
+    ):
+        self.path = Path(path)
+        self.rate = per_minute / 60.0
+        self.per_day = per_day
+        self.capacity = max(burst, 1)
+
+    def _update(self, take: bool) -> tuple[bool, float, int]:
+        """Refill the bucket under the file lock; optionally take one token.
+
+        Returns (token taken, seconds until a token is available, requests
+        left today); a token is only taken with no wait and quota left.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a+") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            f.seek(0)
+            try:
+                state = json.loads(f.read() or "{}")
+            except ValueError:
+                # Corrupt state: start from a full bucket rather than fail
+                state = {}
+
+            now = time.time()
+            today = datetime.now(timezone.utc).date().isoformat()
+            if state.get("day") != today:
+                state["day"], state["used"] = today, 0
+            elapsed = max(now - state.get("updated", now), 0.0)
+            tokens = min(state.get("tokens", self.capacity) + elapsed * self.rate, self.capacity)
+            left = self.per_day - state["used"]
+
+            wait = 0.0 if tokens >= 1 else (1 - tokens) / self.rate
+            taken = take and wait == 0.0 and left > 0
+            if taken:
+                tokens -= 1
+                state["used"] += 1
+                left -= 1
+
+            state["tokens"], state["updated"] = tokens, now
+            f.seek(0)
+            f.truncate()
+            f.write(json.dumps(state))
+        return taken, wait, left
+
+    def remaining_today(self) -> int:
+        return self._update(take=False)[2]
+
+    def check_quota(self, needed: int):
+        """Raise QuotaExceeded unless today's quota covers `needed` requests."""
+        left = self.remaining_today()
+        if needed > left:
+            raise QuotaExceeded(
+                f"OpenStates quota: {needed} request(s) needed, {left} of {self.per_day} left today"
+            )
+
+    def acquire(self):
+        """Block until a request may be sent, then count it."""
+        while True:
+            taken, wait, left = self._update(take=True)
+            if taken:
+                return
+            if left <= 0:
+                raise QuotaExceeded(f"OpenStates daily quota of {self.per_day} requests used up")
+            time.sleep(wait)
+
+
+class OpenStatesClient:
+    """Pooled, retrying OpenStates API v3 client."""
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: str = OPENSTATES_BASE_URL,
+        timeout: tuple[float, float] = TIMEOUT,
+        max_retries: int = MAX_RETRIES,
+        pool_size: int = 4,
+        limiter: Optional[RateLimiter] = None,
+    ):
+        self.api_key = api_key or os.environ.get("OPENSTATES_API_KEY")
+        if not self.api_key:
+            raise ValueError("OPENSTATES_API_KEY environment variable not set")
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.limiter = limiter or RateLimiter()
+        # Latest X-RateLimit-* values seen: limit, remaining, reset (seconds)
+        self.rate_limit: dict[str, float] = {}
+
+        self.session = requests.Session()
+        self.session.headers.update({"X-API-KEY": self.api_key})
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _record_rate_limit(self, response: requests.Response):
+        headers = response.headers
+        for name in ("limit", "remaining"):
+            value = headers.get(f"X-RateLimit-{name.title()}")
+            if value is not None and value.isdigit():
+                self.rate_limit[name] = int(value)
+        reset = _header_seconds(headers.get("X-RateLimit-Reset"))
+        if reset is not None:
+            self.rate_limit["reset"] = reset
+
+    def _retry_wait(self, response: Optional[requests.Response], attempt: int) -> float:
+        """Server-advised wait if there is one, else jittered exponential backoff."""
+        if response is not None:
+            advised = _header_seconds(response.headers.get("Retry-After"))
+            if advised is None and self.rate_limit.get("remaining") == 0:
+                advised = self.rate_limit.get("reset")
+            if advised is not None:
+                # Small jitter so parallel runs don't all retry on the same tick
+                return min(advised + random.uniform(0, 1), MAX_WAIT)
+        return min(random.uniform(0, BACKOFF_BASE * 2 ** attempt), MAX_WAIT)
+
+    def get(self, endpoint: str, params: Optional[dict] = None) -> Optional[dict]:
+        """GET an endpoint and return its JSON; None on 404.
+
+        Raises requests.HTTPError once retries are exhausted, or
+        QuotaExceeded when today's quota is used up.
+        """
+        url = f"{self.base_url}{endpoint}"
+        for attempt in range(self.max_retries + 1):
+            last_try = attempt == self.max_retries
+            self.limiter.acquire()
+            try:
+                response = self.session.get(url, params=params or {}, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if last_try:
+                    raise
+                wait = self._retry_wait(None, attempt)
+                print(f"  OpenStates request failed ({type(e).__name__}), retrying in {wait:.0f}s...")
+                time.sleep(wait)
+                continue
+
+            self._record_rate_limit(response)
+            if response.status_code == 404:
+                return None
+            if response.status_code in RETRY_STATUSES and not last_try:
+                wait = self._retry_wait(response, attempt)
+                reason = "Rate limited" if response.status_code == 429 else f"HTTP {response.status_code}"
+                print(f"  {reason}, waiting {wait:.0f}s...")
+                time.sleep(wait)
+                continue
+
+            response.raise_for_status()
+            return response.json()
+
+    def pages(self, endpoint: str, params: Optional[dict] = None, max_pages: int = 10) -> Iterator[Page]:
+        """Yield pages of a listing endpoint, fetching each one lazily."""
+        params = dict(params or {})
+        for page_number in range(1, max_pages + 1):
+            params["page"] = page_number
+            data = self.get(endpoint, params) or {}
+            pagination = data.get("pagination", {})
+            page = Page(
+                results=data.get("results", []),
+                page=page_number,
+                max_page=pagination.get("max_page", 1),
+                total_items=pagination.get("total_items", 0),
+            )
+            yield page
+            if not page.has_more:
+                return
+
+
+_client: Optional[OpenStatesClient] = None
+
+
+def get_client() -> OpenStatesClient:
+    """Process-wide client, so every caller shares one connection pool."""
+    global _client
+    if _client is None:
+        _client = OpenStatesClient()
+    return _client
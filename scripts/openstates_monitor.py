@@ -25,8 +25,11 @@ Usage:
 Get a free API key at: https://openstates.org/accounts/signup/
 
 Rate limits (free tier): 10 requests/min, 250 requests/day.
-A single-state scan uses ~11 requests (one per query).
-An all-states scan uses ~11 requests (queries search all states by default).
+An all-states scan uses ~11 requests (one per query; queries search all
+states by default), a --states scan one per query per state, plus one per
+extra results page. Requests are paced by the limiter in openstates_client.py,
+which refresh_bill_status.py shares; a scan the day's remaining quota can't
+cover is refused up front.
 """
 
 import os
@@ -34,14 +37,13 @@ import sys
 import json
 import hashlib
 import argparse
-import time
-import requests
 from datetime import datetime
 
+from openstates_client import QuotaExceeded, get_client
+
 # ============== Configuration ==============
 
 OPENSTATES_API_KEY = os.environ.get("OPENSTATES_API_KEY")
-OPENSTATES_BASE_URL = "https://v3.openstates.org"
 
 # Search queries for PolicyEngine-relevant bills
 SEARCH_QUERIES = [
@@ -99,32 +101,6 @@ TARGET_SESSION_YEAR = 2026
 
 # ============== OpenStates API ==============
 
-def openstates_request(endpoint, params=None, max_retries=3):
-    """Make a request to the OpenStates API v3 with retry on rate limit."""
-    if not OPENSTATES_API_KEY:
-        raise ValueError("OPENSTATES_API_KEY environment variable not set")
-
-    headers = {"X-API-KEY": OPENSTATES_API_KEY}
-    url = f"{OPENSTATES_BASE_URL}{endpoint}"
-
-    for attempt in range(max_retries):
-        response = requests.get(url, headers=headers, params=params or {})
-
-        if response.status_code == 429:
-            wait = 15 * (attempt + 1)  # 15s, 30s, 45s
-            print(f"  Rate limited, waiting {wait}s...")
-            time.sleep(wait)
-            continue
-
-        response.raise_for_status()
-        return response.json()
-
-    # Final attempt without retry
-    response = requests.get(url, headers=headers, params=params or {})
-    response.raise_for_status()
-    return response.json()
-
-
 def search_bills_openstates(query, jurisdiction=None, session=None, per_page=20, max_pages=10):
     """
     Search for bills via OpenStates API.
@@ -152,26 +128,16 @@ def search_bills_openstates(query, jurisdiction=None, session=None, per_page=20,
         params["session"] = session
 
     all_results = []
+    page_number = 1
 
-    for page in range(1, max_pages + 1):
-        params["page"] = page
-        try:
-            data = openstates_request("/bills", params)
-            results = data.get("results", [])
-            all_results.extend(results)
-
-            # Check if there are more pages
-            pagination = data.get("pagination", {})
-            total_pages = pagination.get("max_page", 1)
-            if page >= total_pages:
-                break
-
-            # Free tier: 10 requests/min, so ~6s between requests
-            time.sleep(6)
-
-        except Exception as e:
-            print(f"  Warning: Search page {page} failed for '{query}': {e}")
-            break
+    try:
+        for page in get_client().pages("/bills", params, max_pages=max_pages):
+            all_results.extend(page.results)
+            page_number = page.page + 1
+    except QuotaExceeded:
+        raise
+    except Exception as e:
+        print(f"  Warning: Search page {page_number} failed for '{query}': {e}")
 
     return all_results
 
@@ -496,11 +462,11 @@ def run_search_scan(supabase, states, queries, dry_run):
     skipped_irrelevant = 0
     candidate_bills = {}  # dedup_key -> (normalized_bill, matched_query)
 
-    for qi, query in enumerate(queries):
+    for query in queries:
         print(f"Searching: '{query}'")
 
         if states:
-            for si, state_abbr in enumerate(states):
+            for state_abbr in states:
                 jurisdiction = ABBR_TO_STATE.get(state_abbr, state_abbr)
                 results = search_bills_openstates(query, jurisdiction=jurisdiction)
                 print(f"  {state_abbr}: {len(results)} results")
@@ -518,10 +484,6 @@ def run_search_scan(supabase, states, queries, dry_run):
                         continue
 
                     candidate_bills[dedup_key] = (normalized, query)
-
-                # Delay between states within a query
-                if si < len(states) - 1:
-                    time.sleep(6)
         else:
             results = search_bills_openstates(query)
             print(f"  All states: {len(results)} results")
@@ -540,10 +502,6 @@ def run_search_scan(supabase, states, queries, dry_run):
 
                 candidate_bills[dedup_key] = (normalized, query)
 
-        # Delay between queries (free tier: 10 req/min)
-        if qi < len(queries) - 1:
-            time.sleep(6)
-
     new_bills = list(candidate_bills.values())
     stats = {
         "skipped_processed": skipped_processed,
@@ -584,7 +542,13 @@ def main():
     print(f"Dry run: {args.dry_run}")
     print()
 
-    new_bills, stats = run_search_scan(supabase, states, queries, args.dry_run)
+    # At least one request per query (per state); extra pages come on top
+    try:
+        get_client().limiter.check_quota(len(queries) * len(states or [None]))
+        new_bills, stats = run_search_scan(supabase, states, queries, args.dry_run)
+    except QuotaExceeded as e:
+        print(f"Error: {e}")
+        return 1
 
     # Summary
     print()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Write precompressed .br and .gz variants of the built SPA.
+
+Runs at image build time, after `npm run build` and prerender, so the
+Modal server (modal_app.py) can serve compressed bytes straight from its
+static manifest instead of compressing per request. A variant is only
+written when it is meaningfully smaller than the original, and variants
+newer than their source are left alone; brotli variants need the `brotli`
+package and are skipped without it.
+
+Usage:
+    python scripts/precompress_dist.py            # dist/
+    python scripts/precompress_dist.py /app/dist
+"""
+
+import argparse
+import gzip
+import os
+import sys
+from pathlib import Path
+
+COMPRESSIBLE_SUFFIXES = {
+    ".html", ".js", ".mjs", ".css", ".json", ".svg", ".txt", ".xml", ".map", ".webmanifest",
+}
+
+# Files smaller than this aren't worth a variant (headers dominate)
+MIN_SIZE = 1024
+
+# Keep a variant only if it saves at least this fraction of the original
+MIN_SAVING = 0.1
+
+VARIANT_SUFFIXES = (".br", ".gz")
+
+
+def _compressors():
+    compressors = {".gz": lambda data: gzip.compress(data, compresslevel=9, mtime=0)}
+    try:
+        import brotli
+    except ImportError:
+        print("  brotli not installed; writing .gz variants only")
+    else:
+        compressors[".br"] = lambda data: brotli.compress(data, quality=11)
+    return compressors
+
+
+def precompress(dist_path: str) -> dict:
+    """Write variants for every compressible file; returns byte totals."""
+    compressors = _compressors()
+    totals = {"files": 0, "original": 0, **{suffix: 0 for suffix in compressors}}
+
+    for path in sorted(Path(dist_path).rglob("*")):
+        if not path.is_file() or path.suffix in VARIANT_SUFFIXES:
+            continue
+        if path.suffix not in COMPRESSIBLE_SUFFIXES or path.stat().st_size < MIN_SIZE:
+            continue
+
+        data = path.read_bytes()
+        totals["files"] += 1
+        totals["original"] += len(data)
+
+        for suffix, compress in compressors.items():
+            variant = path.with_name(path.name + suffix)
+            # Incremental prerender leaves most pages untouched; keep their variants
+            if variant.exists() and variant.stat().st_mtime >= path.stat().st_mtime:
+                totals[suffix] += variant.stat().st_size
+                continue
+            compressed = compress(data)
+            if len(compressed) > len(data) * (1 - MIN_SAVING):
+                if variant.exists():
+                    variant.unlink()
+                totals[suffix] += len(data)
+                continue
+            tmp_path = variant.with_name(f".{variant.name}.tmp")
+            tmp_path.write_bytes(compressed)
+            os.replace(tmp_path, variant)
+            totals[suffix] += len(compressed)
+
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write .br/.gz variants of the built SPA")
+    parser.add_argument("dist", nargs="?", default="dist", help="Build output directory (default: dist)")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.dist):
+        print(f"Error: {args.dist} not found. Run `npm run build` first.")
+        return 1
+
+    totals = precompress(args.dist)
+    original = totals["original"] or 1
+    print(f"Precompressed {totals['files']} file(s) in {args.dist} ({totals['original'] / 1024:,.0f} KiB)")
+    for suffix in (s for s in VARIANT_SUFFIXES if s in totals):
+        print(f"  {suffix}: {totals[suffix] / 1024:,.0f} KiB ({totals[suffix] / original:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,12 +7,17 @@
  *
  * Also generates state index pages, sitemap.xml, and robots.txt.
  *
+ * With --incremental, only pages whose source rows changed since the last run
+ * are rewritten and sitemap.xml is updated in place (see "Incremental state").
+ *
  * Usage:
  *   SUPABASE_URL=... SUPABASE_ANON_KEY=... node scripts/prerender.mjs
+ *   SUPABASE_URL=... SUPABASE_ANON_KEY=... node scripts/prerender.mjs --incremental
  */
 
 import { createClient } from "@supabase/supabase-js";
-import { readFileSync, writeFileSync, mkdirSync, existsSync } from "fs";
+import { createHash } from "crypto";
+import { readFileSync, writeFileSync, mkdirSync, existsSync, rmSync } from "fs";
 import { dirname, join } from "path";
 
 const SUPABASE_URL =
@@ -249,15 +254,94 @@ function buildStatePage(template, state, bills) {
   return html;
 }
 
+// ── Incremental state ────────────────────────────────────────────────────────
+//
+// With --incremental, pages are only rewritten when their source changed.
+// Each page's source (the bill/impact fields it renders, or the bill list for
+// state pages and the homepage) is hashed into a manifest kept outside dist/
+// together with the pristine SPA template, since index.html itself is
+// overwritten with the prerendered homepage.
+
+const STATE_DIR =
+  process.env.PRERENDER_STATE_DIR || join(DIST, "..", ".prerender");
+const MANIFEST_PATH = join(STATE_DIR, "manifest.json");
+const TEMPLATE_PATH = join(STATE_DIR, "template.html");
+const MANIFEST_VERSION = 1;
+
+function contentHash(value) {
+  return createHash("sha256").update(JSON.stringify(value)).digest("hex").slice(0, 16);
+}
+
+// Fields buildBillPage reads — anything else changing doesn't touch the page
+function billSource(bill, impact) {
+  return {
+    id: bill.id,
+    state: bill.state,
+    title: bill.title,
+    description: bill.description,
+    url: bill.url,
+    created_at: bill.created_at,
+    provisions: impact?.provisions ?? null,
+    budgetary_impact: impact?.budgetary_impact ?? null,
+    computed_at: impact?.computed_at ?? null,
+  };
+}
+
+function listSource(bills) {
+  return bills.map((b) => [b.id, b.title]);
+}
+
+function loadManifest(templateHash) {
+  if (!existsSync(MANIFEST_PATH)) return null;
+  try {
+    const manifest = JSON.parse(readFileSync(MANIFEST_PATH, "utf-8"));
+    // A new build (different template) invalidates every page
+    if (manifest.version !== MANIFEST_VERSION || manifest.template !== templateHash) return null;
+    return manifest;
+  } catch {
+    return null;
+  }
+}
+
+function readSitemap() {
+  const entries = new Map();
+  const path = join(DIST, "sitemap.xml");
+  if (!existsSync(path)) return entries;
+  const re = /<url><loc>([^<]*)<\/loc>(?:<lastmod>([^<]*)<\/lastmod>)?/g;
+  for (const [, loc, lastmod] of readFileSync(path, "utf-8").matchAll(re)) {
+    entries.set(loc.replace(/&amp;/g, "&"), lastmod || null);
+  }
+  return entries;
+}
+
+function writeIfChanged(path, content) {
+  if (existsSync(path) && readFileSync(path, "utf-8") === content) return false;
+  mkdirSync(dirname(path), { recursive: true });
+  writeFileSync(path, content);
+  return true;
+}
+
 // ── Main ─────────────────────────────────────────────────────────────────────
 
 async function main() {
+  const incremental = process.argv.includes("--incremental");
+
   if (!existsSync(join(DIST, "index.html"))) {
     console.error("dist/index.html not found — run `npm run build` first");
     process.exit(1);
   }
 
-  const template = readFileSync(join(DIST, "index.html"), "utf-8");
+  // Keep the unrendered SPA shell: index.html is replaced by the homepage
+  // below, so only a fresh `vite build` output (no <noscript> yet) is saved
+  const built = readFileSync(join(DIST, "index.html"), "utf-8");
+  if (!built.includes("<noscript>") || !existsSync(TEMPLATE_PATH)) {
+    mkdirSync(STATE_DIR, { recursive: true });
+    writeFileSync(TEMPLATE_PATH, built);
+  }
+  const template = readFileSync(TEMPLATE_PATH, "utf-8");
+  const templateHash = contentHash(template);
+  const previous = incremental ? loadManifest(templateHash) : null;
+  const previousPages = previous?.pages || {};
 
   // Fetch published bills
   const { data: bills, error: billsErr } = await supabase
@@ -271,10 +355,10 @@ async function main() {
     process.exit(1);
   }
 
-  // Fetch impacts
+  // Fetch impacts (only the columns the pages render)
   const { data: impacts, error: impactsErr } = await supabase
     .from("reform_impacts")
-    .select("*");
+    .select("id,computed_at,provisions,budgetary_impact");
 
   if (impactsErr) {
     console.error("Failed to fetch impacts:", impactsErr.message);
@@ -296,8 +380,19 @@ async function main() {
   }
 
   const today = new Date().toISOString().split("T")[0];
-  const sitemapEntries = [{ url: BASE_URL, lastmod: today }];
-  let billCount = 0;
+  const pages = {};
+  let written = 0;
+
+  // Render a page only when its source hash differs from the last run
+  function renderPage(key, source, path, render) {
+    const hash = contentHash(source);
+    pages[key] = hash;
+    if (previousPages[key] === hash && existsSync(path)) return false;
+    mkdirSync(dirname(path), { recursive: true });
+    writeFileSync(path, render());
+    written++;
+    return true;
+  }
 
   // Write the set of valid route prefixes for the server to use for 404 detection
   const validRoutes = new Set(["sitemap.xml", "robots.txt"]);
@@ -311,45 +406,61 @@ async function main() {
   for (const code of Object.keys(STATE_NAMES)) {
     validRoutes.add(code);
   }
-  writeFileSync(
+  writeIfChanged(
     join(DIST, "_valid_routes.json"),
     JSON.stringify([...validRoutes].sort()),
   );
 
   // Update homepage with noscript navigation links
-  const homeParts = [
-    "<h1>2026 State Legislative Tracker | PolicyEngine</h1>",
-    "<p>Track PolicyEngine&apos;s state-level tax and benefit policy research across all 50 states.</p>",
-    "<h2>States with Analyzed Legislation</h2>",
-    "<nav><ul>",
-  ];
-  for (const [state, stateBills] of Object.entries(billsByState).sort()) {
-    const stateName = STATE_NAMES[state] || state;
-    homeParts.push(
-      `<li><a href="${BASE_URL}/${state}">${escapeHtml(stateName)}</a> — ${stateBills.length} bill${stateBills.length !== 1 ? "s" : ""}`,
-    );
-    homeParts.push("<ul>");
-    for (const b of stateBills) {
-      const bn = extractBillNumber(b.id, b.title);
+  const homeSource = Object.entries(billsByState)
+    .sort()
+    .map(([state, stateBills]) => [state, listSource(stateBills)]);
+  const homeChanged = renderPage("", homeSource, join(DIST, "index.html"), () => {
+    const homeParts = [
+      "<h1>2026 State Legislative Tracker | PolicyEngine</h1>",
+      "<p>Track PolicyEngine&apos;s state-level tax and benefit policy research across all 50 states.</p>",
+      "<h2>States with Analyzed Legislation</h2>",
+      "<nav><ul>",
+    ];
+    for (const [state, stateBills] of Object.entries(billsByState).sort()) {
+      const stateName = STATE_NAMES[state] || state;
       homeParts.push(
-        `<li><a href="${BASE_URL}/${state}/${b.id}">${escapeHtml(bn)}: ${escapeHtml(b.title)}</a></li>`,
+        `<li><a href="${BASE_URL}/${state}">${escapeHtml(stateName)}</a> — ${stateBills.length} bill${stateBills.length !== 1 ? "s" : ""}`,
       );
+      homeParts.push("<ul>");
+      for (const b of stateBills) {
+        const bn = extractBillNumber(b.id, b.title);
+        homeParts.push(
+          `<li><a href="${BASE_URL}/${state}/${b.id}">${escapeHtml(bn)}: ${escapeHtml(b.title)}</a></li>`,
+        );
+      }
+      homeParts.push("</ul></li>");
     }
-    homeParts.push("</ul></li>");
+    homeParts.push("</ul></nav>");
+    const homeHtml = addNoscript(template, homeParts.join(""));
+    return addCanonical(homeHtml, BASE_URL);
+  });
+
+  // Sitemap entries are updated in place: unchanged pages keep their lastmod
+  const sitemap = incremental ? readSitemap() : new Map();
+  const sitemapUrls = new Set();
+  function sitemapEntry(url, lastmod, changed) {
+    sitemapUrls.add(url);
+    if (changed || !sitemap.has(url)) sitemap.set(url, lastmod);
   }
-  homeParts.push("</ul></nav>");
-  let homeHtml = addNoscript(template, homeParts.join(""));
-  homeHtml = addCanonical(homeHtml, BASE_URL);
-  writeFileSync(join(DIST, "index.html"), homeHtml);
+  sitemapEntry(BASE_URL, today, homeChanged);
+
+  let billCount = 0;
 
   // Generate pages per state
   for (const [state, stateBills] of Object.entries(billsByState)) {
     // State index page
     const stateDir = join(DIST, state);
-    mkdirSync(stateDir, { recursive: true });
-    writeFileSync(
+    const stateChanged = renderPage(
+      state,
+      listSource(stateBills),
       join(stateDir, "index.html"),
-      buildStatePage(template, state, stateBills),
+      () => buildStatePage(template, state, stateBills),
     );
     // Find most recent update across bills in this state for state page lastmod
     let stateLastmod = null;
@@ -358,54 +469,81 @@ async function main() {
       const d = impact?.computed_at || bill.updated_at || bill.created_at;
       if (d && (!stateLastmod || d > stateLastmod)) stateLastmod = d;
     }
-    sitemapEntries.push({
-      url: `${BASE_URL}/${state}`,
-      lastmod: stateLastmod ? stateLastmod.split("T")[0] : today,
-    });
+    const stateLastmodDay = stateLastmod ? stateLastmod.split("T")[0] : today;
+    sitemapEntry(
+      `${BASE_URL}/${state}`,
+      stateLastmodDay,
+      stateChanged || sitemap.get(`${BASE_URL}/${state}`) !== stateLastmodDay,
+    );
 
     // Per-bill pages
     for (const bill of stateBills) {
       const impact = impactMap[bill.id];
-      const billDir = join(stateDir, bill.id);
-      mkdirSync(billDir, { recursive: true });
-      writeFileSync(
-        join(billDir, "index.html"),
-        buildBillPage(template, bill, impact, state),
+      const changed = renderPage(
+        `${state}/${bill.id}`,
+        billSource(bill, impact),
+        join(stateDir, bill.id, "index.html"),
+        () => buildBillPage(template, bill, impact, state),
       );
       const billLastmod = impact?.computed_at || bill.updated_at || bill.created_at;
-      sitemapEntries.push({
-        url: `${BASE_URL}/${state}/${bill.id}`,
-        lastmod: billLastmod ? billLastmod.split("T")[0] : today,
-      });
+      sitemapEntry(
+        `${BASE_URL}/${state}/${bill.id}`,
+        billLastmod ? billLastmod.split("T")[0] : today,
+        changed,
+      );
       billCount++;
     }
   }
 
+  // Remove pages for bills that were unpublished or deleted since the last run
+  let removed = 0;
+  for (const key of Object.keys(previousPages)) {
+    if (key && !(key in pages)) {
+      for (const suffix of ["", ".br", ".gz"]) {
+        rmSync(join(DIST, key, `index.html${suffix}`), { force: true });
+      }
+      removed++;
+    }
+  }
+  for (const url of [...sitemap.keys()]) {
+    if (!sitemapUrls.has(url)) sitemap.delete(url);
+  }
+
   // Sitemap
-  const sitemap = [
+  const sitemapXml = [
     '<?xml version="1.0" encoding="UTF-8"?>',
     '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">',
-    ...sitemapEntries.map(
-      ({ url, lastmod }) =>
+    ...[...sitemap].map(
+      ([url, lastmod]) =>
         `  <url><loc>${escapeHtml(url)}</loc>${lastmod ? `<lastmod>${lastmod}</lastmod>` : ""}<changefreq>weekly</changefreq></url>`,
     ),
     "</urlset>",
   ].join("\n");
-  writeFileSync(join(DIST, "sitemap.xml"), sitemap);
+  writeIfChanged(join(DIST, "sitemap.xml"), sitemapXml);
 
   // Robots.txt — no Sitemap directive here because this is served from
   // modal.run; the sitemap is submitted via Google Search Console under
   // policyengine.org to avoid cross-domain "URL not allowed" errors.
-  writeFileSync(
+  writeIfChanged(
     join(DIST, "robots.txt"),
     `User-agent: *\nAllow: /\n`,
   );
 
+  writeFileSync(
+    MANIFEST_PATH,
+    JSON.stringify({ version: MANIFEST_VERSION, template: templateHash, pages }),
+  );
+
   console.log(
     `Pre-rendered ${billCount} bill pages across ${Object.keys(billsByState).length} states`,
   );
+  if (incremental) {
+    console.log(
+      `Incremental: ${written} page(s) rewritten, ${Object.keys(pages).length - written} unchanged, ${removed} removed`,
+    );
+  }
   console.log(
-    `Generated sitemap.xml (${sitemapEntries.length} URLs) and robots.txt`,
+    `Generated sitemap.xml (${sitemap.size} URLs) and robots.txt`,
   );
 }
 
@@ -22,19 +22,22 @@ Usage:
 
     # Include all bills (not just scored ones)
     python scripts/refresh_bill_status.py --all
+
+Each bill costs one OpenStates request. Requests are paced by the limiter in
+openstates_client.py, shared with openstates_monitor.py; a run the day's
+remaining quota can't cover is refused up front (lower --limit).
 """
 
 import os
 import sys
 import json
 import argparse
-import time
-import requests
+
+from openstates_client import QuotaExceeded, get_client
 
 # ============== Configuration ==============
 
 OPENSTATES_API_KEY = os.environ.get("OPENSTATES_API_KEY")
-OPENSTATES_BASE_URL = "https://v3.openstates.org"
 
 # Legislative stage classification based on action classifications
 # Order matters — later stages override earlier ones
@@ -91,37 +94,6 @@ STAGE_LABELS = {
 }
 
 
-def openstates_request(endpoint, params=None, max_retries=3):
-    """Make a request to the OpenStates API v3 with retry on rate limit."""
-    if not OPENSTATES_API_KEY:
-        raise ValueError("OPENSTATES_API_KEY environment variable not set")
-
-    headers = {"X-API-KEY": OPENSTATES_API_KEY}
-    url = f"{OPENSTATES_BASE_URL}{endpoint}"
-
-    for attempt in range(max_retries):
-        response = requests.get(url, headers=headers, params=params or {})
-
-        if response.status_code == 429:
-            wait = 15 * (attempt + 1)
-            print(f"  Rate limited, waiting {wait}s...")
-            time.sleep(wait)
-            continue
-
-        if response.status_code == 404:
-            return None
-
-        response.raise_for_status()
-        return response.json()
-
-    response = requests.get(url, headers=headers, params=params or {})
-    if response.status_code == 429:
-        print(f"  Still rate limited after {max_retries} retries, skipping")
-        return None
-    response.raise_for_status()
-    return response.json()
-
-
 def classify_stage(actions):
     """
     Determine legislative stage from a list of actions.
@@ -170,7 +142,7 @@ def search_bill_on_openstates(state_name, bill_number):
         "include": "actions",
     }
 
-    data = openstates_request("/bills", params)
+    data = get_client().get("/bills", params)
     if not data or not data.get("results"):
         return None
 
@@ -192,7 +164,7 @@ def search_bill_on_openstates(state_name, bill_number):
 
 def get_bill_detail(openstates_id):
     """Fetch full bill detail with actions."""
-    return openstates_request(f"/bills/{openstates_id}", {"include": "actions"})
+    return get_client().get(f"/bills/{openstates_id}", {"include": "actions"})
 
 
 # State abbreviation -> name mapping
@@ -265,6 +237,12 @@ def main():
     print(f"Dry run: {args.dry_run}")
     print()
 
+    try:
+        get_client().limiter.check_quota(len(bills))
+    except QuotaExceeded as e:
+        print(f"Error: {e}")
+        return 1
+
     updated = 0
     skipped = 0
     errors = 0
@@ -319,14 +297,15 @@ def main():
 
                 updated += 1
 
+        except QuotaExceeded as e:
+            # Another process used up the shared quota mid-run
+            print(f"ERROR: {e}")
+            errors += 1
+            break
         except Exception as e:
             print(f"ERROR: {e}")
             errors += 1
 
-        # Rate limiting: 10 req/min on free tier
-        if i < len(bills) - 1:
-            time.sleep(7)
-
     print()
     print(f"Done!")
     print(f"  Updated: {updated}")
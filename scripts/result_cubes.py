@@ -0,0 +1,245 @@
+"""
+Persisted per-household result cubes for compute_impacts.py.
+
+A result cube holds the baseline and reform arrays that the impact
+calculations read (household, tax unit and person level), saved as a
+compressed .npz keyed by a fingerprint of the reform run. Loading a cube
+returns simulation stand-ins whose calculate() serves those arrays as
+weighted MicroSeries, so every compute_* function can run unchanged
+without re-simulating.
+
+Layout:
+    <RESULT_CUBE_DIR>/<reform_id>/<fingerprint>.npz
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+RESULT_CUBE_DIR = Path(
+    os.environ.get(
+        "RESULT_CUBE_DIR",
+        Path(__file__).parent.parent / "result_cubes",
+    )
+)
+
+# (variable, entity, map_to, reform_dependent)
+# reform_dependent variables are stored for both simulations; the rest come
+# from the baseline only, matching how the compute_* functions read them.
+CUBE_VARIABLES = [
+    # Tax unit
+    ("state_income_tax", "tax_unit", None, True),
+    ("income_tax", "tax_unit", None, True),
+    ("tax_unit_weight", "tax_unit", None, False),
+    # Household
+    ("household_net_income", "household", None, True),
+    ("equiv_household_net_income", "household", None, True),
+    ("household_tax", "household", None, True),
+    ("household_benefits", "household", None, True),
+    ("household_weight", "household", None, False),
+    ("household_count_people", "household", None, False),
+    ("household_income_decile", "household", None, False),
+    ("congressional_district_geoid", "household", None, False),
+    # Person
+    ("person_in_poverty", "person", None, True),
+    ("person_in_deep_poverty", "person", None, True),
+    ("person_weight", "person", None, False),
+    ("age", "person", None, False),
+    ("congressional_district_geoid", "person", "person", False),
+]
+
+ENTITY_WEIGHTS = {
+    "tax_unit": "tax_unit_weight",
+    "household": "household_weight",
+    "person": "person_weight",
+}
+
+
+# =============================================================================
+# FINGERPRINT
+# =============================================================================
+
+def _params_hash(reform_params: dict) -> str:
+    canonical = json.dumps(reform_params, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def reform_fingerprint(state: str, year: int, reform_params: dict, versions: dict) -> str:
+    """Stable key for a reform run: inputs plus the model/data versions."""
+    payload = {
+        "state": state.upper(),
+        "year": int(year),
+        "params": _params_hash(reform_params),
+        "policyengine_us": versions.get("policyengine_us"),
+        "policyengine_us_data": versions.get("policyengine_us_data"),
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+
+
+def _cube_key(side: str, variable: str, map_to: str | None) -> str:
+    return f"{side}/{variable}@{map_to}" if map_to else f"{side}/{variable}"
+
+
+# =============================================================================
+# SAVE
+# =============================================================================
+
+def save_result_cube(
+    reform_id: str,
+    state: str,
+    year: int,
+    reform_params: dict,
+    baseline,
+    reformed,
+    versions: dict,
+) -> Path:
+    """Extract the cube arrays from a simulation pair and write them to disk.
+
+    Variables the installed model doesn't define are skipped (and recorded
+    as missing in the metadata) rather than failing the run.
+    """
+    arrays = {}
+    entities = {}
+    missing = []
+
+    for variable, entity, map_to, reform_dependent in CUBE_VARIABLES:
+        sides = [("baseline", baseline)]
+        if reform_dependent:
+            sides.append(("reform", reformed))
+        for side, sim in sides:
+            key = _cube_key(side, variable, map_to)
+            try:
+                if map_to:
+                    values = sim.calculate(variable, year, map_to=map_to).values
+                else:
+                    values = sim.calculate(variable, year).values
+            except Exception:
+                missing.append(key)
+                continue
+            arrays[key] = np.asarray(values)
+        entities[f"{variable}@{map_to}" if map_to else variable] = map_to or entity
+
+    fingerprint = reform_fingerprint(state, year, reform_params, versions)
+    meta = {
+        "reform_id": reform_id,
+        "state": state.upper(),
+        "year": int(year),
+        "fingerprint": fingerprint,
+        "params_hash": _params_hash(reform_params),
+        "versions": versions,
+        "entities": entities,
+        "missing": missing,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+    cube_dir = RESULT_CUBE_DIR / reform_id
+    cube_dir.mkdir(parents=True, exist_ok=True)
+    path = cube_dir / f"{fingerprint}.npz"
+    tmp_path = cube_dir / f".{fingerprint}.tmp.npz"
+    np.savez_compressed(tmp_path, __meta__=np.array(json.dumps(meta)), **arrays)
+    tmp_path.replace(path)
+    return path
+
+
+# =============================================================================
+# LOAD
+# =============================================================================
+
+def find_result_cube(
+    reform_id: str, state: str, year: int, reform_params: dict, versions: dict
+) -> Path | None:
+    """Locate the cube for a reform run.
+
+    Prefers an exact fingerprint match for the given versions; otherwise
+    falls back to the newest cube with the same state, year and params
+    (computed under a different model version).
+    """
+    cube_dir = RESULT_CUBE_DIR / reform_id
+    if not cube_dir.exists():
+        return None
+
+    exact = cube_dir / f"{reform_fingerprint(state, year, reform_params, versions)}.npz"
+    if exact.exists():
+        return exact
+
+    params_hash = _params_hash(reform_params)
+    candidates = []
+    for path in cube_dir.glob("*.npz"):
+        if path.name.startswith("."):
+            continue
+        meta = read_cube_meta(path)
+        if (
+            meta.get("params_hash") == params_hash
+            and meta.get("year") == int(year)
+            and meta.get("state") == state.upper()
+        ):
+            candidates.append(path)
+    if not candidates:
+        return None
+    return max(candidates, key=lambda p: p.stat().st_mtime)
+
+
+def read_cube_meta(path: Path) -> dict:
+    with np.load(path, allow_pickle=False) as data:
+        return json.loads(str(data["__meta__"]))
+
+
+class CubeSimulation:
+    """Read-only stand-in for a Microsimulation, backed by cube arrays.
+
+    calculate() mirrors Microsimulation.calculate(): it returns a MicroSeries
+    weighted by the variable's entity weight.
+    """
+
+    def __init__(self, arrays: dict, baseline_arrays: dict, meta: dict, side: str):
+        self._arrays = arrays
+        self._baseline_arrays = baseline_arrays
+        self._meta = meta
+        self._side = side
+
+    def _raw(self, key: str) -> np.ndarray:
+        if key in self._arrays:
+            return self._arrays[key]
+        # Reform-independent variables are only stored on the baseline side
+        if key in self._baseline_arrays:
+            return self._baseline_arrays[key]
+        raise KeyError(
+            f"{key} is not in the result cube for {self._meta['reform_id']}; "
+            f"re-run the simulation (without --aggregate-only) to add it"
+        )
+
+    def calculate(self, variable: str, period=None, map_to: str | None = None):
+        from microdf import MicroSeries
+
+        if period is not None and int(period) != self._meta["year"]:
+            raise ValueError(
+                f"Result cube for {self._meta['reform_id']} holds {self._meta['year']}, "
+                f"not {period}"
+            )
+        name = f"{variable}@{map_to}" if map_to else variable
+        values = self._raw(name)
+        entity = self._meta["entities"].get(name)
+        weight_name = ENTITY_WEIGHTS.get(entity)
+        weights = self._raw(weight_name) if weight_name else None
+        return MicroSeries(values, weights=weights)
+
+
+def load_result_cube(path: Path):
+    """Return (baseline, reformed, meta) stand-ins for a saved cube."""
+    with np.load(path, allow_pickle=False) as data:
+        meta = json.loads(str(data["__meta__"]))
+        sides = {"baseline": {}, "reform": {}}
+        for key in data.files:
+            if key == "__meta__":
+                continue
+            side, name = key.split("/", 1)
+            sides[side][name] = data[key]
+
+    baseline = CubeSimulation(sides["baseline"], sides["baseline"], meta, "baseline")
+    reformed = CubeSimulation(sides["reform"], sides["baseline"], meta, "reform")
+    return baseline, reformed, meta
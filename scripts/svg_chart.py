@@ -0,0 +1,221 @@
+"""
+Static SVG renderer for household earnings sweep charts.
+
+Draws the same chart as generate_household_chart.build_chart (benefit line,
+positive/negative fills, threshold markers, kinks, PolicyEngine branding)
+as a plain SVG string, with no browser or Kaleido involved. PNGs are
+rasterized with cairosvg when it is installed.
+
+Usage (from generate_household_chart.py):
+    --renderer svg            SVG (+ PNG if cairosvg is available)
+    --renderer svg --html     also write the interactive plotly HTML
+"""
+
+import math
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+import numpy as np
+
+WIDTH = 900
+HEIGHT = 500
+MARGIN = {"t": 80, "b": 60, "l": 80, "r": 30}
+FONT = "Inter, Arial, sans-serif"
+
+# Fill colors as (color, opacity); plain hex keeps the SVG valid for every rasterizer
+POSITIVE_FILL = ("#38A169", 0.2)
+NEGATIVE_FILL = ("#E53E3E", 0.2)
+GRID_COLOR = "#EFEFEF"
+
+
+# =============================================================================
+# SCALES
+# =============================================================================
+
+def nice_ticks(low: float, high: float, target: int = 6) -> list[float]:
+    """Round tick values (1/2/5 x 10^n steps) covering [low, high]."""
+    if high <= low:
+        high = low + 1
+    raw = (high - low) / target
+    magnitude = 10 ** math.floor(math.log10(raw))
+    step = next(m * magnitude for m in (1, 2, 5, 10) if m * magnitude >= raw)
+    start = math.floor(low / step) * step
+    ticks = [round(start, 10)]
+    while ticks[-1] < high - step * 1e-9:
+        ticks.append(round(ticks[-1] + step, 10))
+    return ticks
+
+
+def _money(value: float) -> str:
+    return f"-${abs(value):,.0f}" if value < 0 else f"${value:,.0f}"
+
+
+class _Scale:
+    """Linear map from data values onto a pixel range."""
+
+    def __init__(self, domain: tuple[float, float], pixels: tuple[float, float]):
+        self.d0, self.d1 = domain
+        self.p0, self.p1 = pixels
+
+    def __call__(self, values):
+        span = (self.d1 - self.d0) or 1.0
+        return self.p0 + (np.asarray(values, dtype=float) - self.d0) / span * (self.p1 - self.p0)
+
+
+# =============================================================================
+# RENDERING
+# =============================================================================
+
+def _points(xs: np.ndarray, ys: np.ndarray) -> str:
+    return " ".join(f"{x:.1f},{y:.1f}" for x, y in zip(xs, ys))
+
+
+def _fill_polygon(sx, sy, earnings: np.ndarray, values: np.ndarray, fill: tuple[str, float]) -> str:
+    xs = sx(earnings)
+    zero = float(sy(0))
+    outline = _points(xs, sy(values))
+    return (
+        f'<polygon points="{xs[0]:.1f},{zero:.1f} {outline} {xs[-1]:.1f},{zero:.1f}" '
+        f'fill="{fill[0]}" fill-opacity="{fill[1]}" stroke="none"/>'
+    )
+
+
+def render_sweep_svg(
+    earnings: np.ndarray,
+    series: list[dict],
+    title: str,
+    subtitle: str,
+    thresholds: list[float] | None = None,
+    kinks: list[dict] | None = None,
+    fills: bool = True,
+) -> str:
+    """Return an SVG document for one or more benefit curves.
+
+    series: [{"label", "values", "color"}]; fills shade the first series
+    green above zero and red below. A legend is drawn when there is more
+    than one series.
+    """
+    earnings = np.asarray(earnings, dtype=float)
+    plot_left, plot_right = MARGIN["l"], WIDTH - MARGIN["r"]
+    plot_top, plot_bottom = MARGIN["t"], HEIGHT - MARGIN["b"]
+
+    all_values = np.concatenate([np.asarray(s["values"], dtype=float) for s in series] + [[0.0]])
+    y_ticks = nice_ticks(float(all_values.min()), float(all_values.max()))
+    x_ticks = [t for t in nice_ticks(float(earnings[0]), float(earnings[-1])) if t <= earnings[-1]]
+    sx = _Scale((float(earnings[0]), float(earnings[-1])), (plot_left, plot_right))
+    sy = _Scale((y_ticks[0], y_ticks[-1]), (plot_bottom, plot_top))
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{WIDTH}" height="{HEIGHT}" '
+        f'viewBox="0 0 {WIDTH} {HEIGHT}" font-family="{FONT}">',
+        f'<rect width="{WIDTH}" height="{HEIGHT}" fill="white"/>',
+    ]
+
+    # Grid and tick labels
+    for tick in y_ticks:
+        y = float(sy(tick))
+        parts.append(f'<line x1="{plot_left}" x2="{plot_right}" y1="{y:.1f}" y2="{y:.1f}" stroke="{GRID_COLOR}"/>')
+        parts.append(
+            f'<text x="{plot_left - 8}" y="{y + 4:.1f}" font-size="11" fill="#444" '
+            f'text-anchor="end">{escape(_money(tick))}</text>'
+        )
+    for tick in x_ticks:
+        x = float(sx(tick))
+        parts.append(f'<line x1="{x:.1f}" x2="{x:.1f}" y1="{plot_top}" y2="{plot_bottom}" stroke="{GRID_COLOR}"/>')
+        parts.append(
+            f'<text x="{x:.1f}" y="{plot_bottom + 18}" font-size="11" fill="#444" '
+            f'text-anchor="middle">{escape(_money(tick))}</text>'
+        )
+
+    # Fills under the first curve
+    if fills and series:
+        values = np.asarray(series[0]["values"], dtype=float)
+        parts.append(_fill_polygon(sx, sy, earnings, np.where(values >= 0, values, 0), POSITIVE_FILL))
+        if np.any(values < 0):
+            parts.append(_fill_polygon(sx, sy, earnings, np.where(values < 0, values, 0), NEGATIVE_FILL))
+
+    # Zero line
+    zero = float(sy(0))
+    parts.append(f'<line x1="{plot_left}" x2="{plot_right}" y1="{zero:.1f}" y2="{zero:.1f}" stroke="gray" stroke-width="0.8"/>')
+
+    # Threshold markers
+    for thresh in thresholds or []:
+        if earnings[0] <= thresh <= earnings[-1]:
+            x = float(sx(thresh))
+            parts.append(
+                f'<line x1="{x:.1f}" x2="{x:.1f}" y1="{plot_top}" y2="{plot_bottom}" '
+                f'stroke="gray" stroke-dasharray="6,4" opacity="0.6"/>'
+            )
+            parts.append(
+                f'<text x="{x:.1f}" y="{plot_top - 4}" font-size="10" fill="gray" '
+                f'text-anchor="middle">{escape(_money(thresh))}</text>'
+            )
+
+    # Curves
+    for s in series:
+        values = np.asarray(s["values"], dtype=float)
+        parts.append(
+            f'<polyline points="{_points(sx(earnings), sy(values))}" fill="none" '
+            f'stroke="{s["color"]}" stroke-width="2.5" stroke-linejoin="round"/>'
+        )
+
+    # Kink markers
+    if kinks and series:
+        color = series[0]["color"]
+        for kink in kinks:
+            x, y = float(sx(kink["earnings"])), float(sy(kink["benefit"]))
+            parts.append(
+                f'<path d="M{x:.1f},{y - 5:.1f} L{x + 5:.1f},{y:.1f} L{x:.1f},{y + 5:.1f} '
+                f'L{x - 5:.1f},{y:.1f} Z" fill="white" stroke="{color}" stroke-width="1.5"/>'
+            )
+
+    # Legend
+    if len(series) > 1:
+        x = plot_left
+        for s in series:
+            parts.append(
+                f'<line x1="{x}" x2="{x + 18}" y1="{plot_top - 22}" y2="{plot_top - 22}" '
+                f'stroke="{s["color"]}" stroke-width="2.5"/>'
+            )
+            parts.append(f'<text x="{x + 24}" y="{plot_top - 18}" font-size="11" fill="#333">{escape(s["label"])}</text>')
+            x += 34 + 7 * len(s["label"])
+
+    # Axis titles, title and branding
+    parts.extend([
+        f'<text x="{(plot_left + plot_right) / 2:.1f}" y="{HEIGHT - 18}" font-size="13" fill="#333" '
+        f'text-anchor="middle">Employment Income</text>',
+        f'<text x="18" y="{(plot_top + plot_bottom) / 2:.1f}" font-size="13" fill="#333" text-anchor="middle" '
+        f'transform="rotate(-90 18 {(plot_top + plot_bottom) / 2:.1f})">Net Benefit from Reform</text>',
+        f'<text x="{WIDTH / 2}" y="30" font-size="17" font-weight="bold" fill="#2A3F5F" '
+        f'text-anchor="middle">{escape(title)}</text>',
+        f'<text x="{WIDTH / 2}" y="50" font-size="13" fill="gray" text-anchor="middle">{escape(subtitle)}</text>',
+        f'<text x="{plot_right}" y="{HEIGHT - 4}" font-size="11" font-style="italic" fill="gray" '
+        f'text-anchor="end">PolicyEngine</text>',
+        "</svg>",
+    ])
+    return "\n".join(parts)
+
+
+def save_svg(svg: str, output_path: str, png: bool = True) -> str:
+    """Write <output>.svg, plus <output>.png when cairosvg is installed.
+
+    Returns the PNG path if one was written, otherwise the SVG path.
+    """
+    output = Path(output_path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    svg_path = output.with_suffix(".svg")
+    svg_path.write_text(svg)
+
+    if png:
+        try:
+            import cairosvg
+        except ImportError:
+            print(f"  Chart saved: {svg_path} (install cairosvg for PNG output)")
+            return str(svg_path)
+        png_path = output.with_suffix(".png")
+        cairosvg.svg2png(bytestring=svg.encode(), write_to=str(png_path), scale=2)
+        print(f"  Chart saved: {png_path} (+ .svg)")
+        return str(png_path)
+
+    print(f"  Chart saved: {svg_path}")
+    return str(svg_path)
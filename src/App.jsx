@@ -30,7 +30,7 @@ function notifyParent(path) {
 }
 
 function App() {
-  const { statesWithBills, getBillsForState } = useData();
+  const { statesWithBills, getBillsForState, loadStateDetail } = useData();
   const [selectedState, setSelectedState] = useState(() => parsePath().state);
   const [billId, setBillId] = useState(() => parsePath().billId);
 
@@ -95,6 +95,11 @@ function App() {
     return () => window.removeEventListener("popstate", onPopState);
   }, []);
 
+  // Full impact detail (districts, deciles, provisions) is loaded per state
+  useEffect(() => {
+    if (selectedState) loadStateDetail(selectedState);
+  }, [selectedState, loadStateDetail]);
+
   // Resolve bill for bill page
   const activeBill = useMemo(() => {
     if (!selectedState || !billId) return null;
@@ -1,17 +1,48 @@
-import { createContext, useContext, useState, useEffect, useMemo } from 'react';
+import { createContext, useContext, useState, useEffect, useMemo, useCallback, useRef } from 'react';
 import { supabase } from '../lib/supabase';
 import { getDescription } from '../data/analysisDescriptions';
+import { isProxyFailure } from '../hooks/usePolicyEngineAPI';
+import { withBundleImpacts, withDetailImpacts } from '../lib/impacts';
 
 const DataContext = createContext(null);
 
+// Same-origin cached endpoints (modal_app.py). The bundle holds research rows
+// and impact summaries; per-state detail (districts, deciles, provisions) is
+// loaded when a state is opened. Falls back to Supabase when the endpoints
+// aren't deployed (e.g. vite dev) or can't be reached.
+const BUNDLE_ENDPOINT = '/api/bundle';
+const STATE_ENDPOINT = '/api/state';
+
+async function fetchFromProxy(url) {
+  try {
+    const response = await fetch(url);
+    if (response.ok && !isProxyFailure(response.status, response.headers.get('content-type'))) {
+      return await response.json();
+    }
+  } catch {
+    // Network error reaching the proxy — use Supabase directly
+  }
+  return null;
+}
+
 export function DataProvider({ children }) {
   const [research, setResearch] = useState([]);
   const [reformImpacts, setReformImpacts] = useState({});
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
+  // States whose full impact detail is loaded; '*' when everything is
+  const loadedStates = useRef(new Set());
 
   useEffect(() => {
     async function fetchData() {
+      const bundle = await fetchFromProxy(BUNDLE_ENDPOINT);
+      if (bundle) {
+        setResearch(bundle.research || []);
+        setReformImpacts(withBundleImpacts(bundle.impacts));
+        setLoading(false);
+        return;
+      }
+
       if (!supabase) {
         setError('Supabase not configured');
         setLoading(false);
@@ -28,54 +59,8 @@ export function DataProvider({ children }) {
         if (impactsResult.error) throw impactsResult.error;
 
         setResearch(researchResult.data || []);
-
-        // Convert impacts to dict with camelCase
-        const impactsDict = {};
-        for (const item of impactsResult.data || []) {
-          // Parse model_notes if it's a string (Supabase sometimes returns JSON as string)
-          let modelNotes = item.model_notes;
-          if (typeof modelNotes === 'string') {
-            try {
-              modelNotes = JSON.parse(modelNotes);
-            } catch (e) {
-              console.error('Failed to parse model_notes:', e);
-              modelNotes = {};
-            }
-          }
-          modelNotes = modelNotes || {};
-
-          // Parse provisions if it's a string
-          let provisions = item.provisions;
-          if (typeof provisions === 'string') {
-            try {
-              provisions = JSON.parse(provisions);
-            } catch (e) {
-              console.error('Failed to parse provisions:', e);
-              provisions = [];
-            }
-          }
-
-          impactsDict[item.id] = {
-            computed: item.computed,
-            computedAt: item.computed_at,
-            policyId: item.policy_id,
-            budgetaryImpact: item.budgetary_impact,
-            povertyImpact: item.poverty_impact,
-            childPovertyImpact: item.child_poverty_impact,
-            winnersLosers: item.winners_losers,
-            decileImpact: item.decile_impact,
-            inequality: item.inequality,
-            districtImpacts: item.district_impacts,
-            reformParams: item.reform_params,
-            provisions: provisions,
-            modelNotes: modelNotes,
-            analysisYear: modelNotes?.analysis_year,
-            impactsByYear: modelNotes?.impacts_by_year,
-            policyengineUsVersion: item.policyengine_us_version,
-            datasetVersion: item.dataset_version,
-          };
-        }
-        setReformImpacts(impactsDict);
+        setReformImpacts(withDetailImpacts(impactsResult.data));
+        loadedStates.current.add('*');
       } catch (err) {
         console.error('Error fetching data:', err);
         setError(err.message);
@@ -87,6 +72,30 @@ export function DataProvider({ children }) {
     fetchData();
   }, []);
 
+  // Merge full impact detail for a state's bills over the bundle summaries
+  const loadStateDetail = useCallback(async (stateAbbr) => {
+    const loaded = loadedStates.current;
+    if (!stateAbbr || loaded.has('*') || loaded.has(stateAbbr)) return;
+    loaded.add(stateAbbr);
+
+    let rows = (await fetchFromProxy(`${STATE_ENDPOINT}/${stateAbbr}`))?.impacts;
+    if (!rows && supabase) {
+      const { data, error: detailError } = await supabase
+        .from('reform_impacts')
+        .select('*, research!inner(state)')
+        .eq('research.state', stateAbbr);
+      if (detailError) {
+        console.error('Error fetching state detail:', detailError);
+        loaded.delete(stateAbbr);
+        return;
+      }
+      rows = data;
+    }
+    if (rows?.length) {
+      setReformImpacts(withDetailImpacts(rows));
+    }
+  }, []);
+
   const statesWithBills = useMemo(() => {
     const counts = {};
     for (const item of research) {
@@ -162,6 +171,7 @@ export function DataProvider({ children }) {
       getBillsForState,
       getResearchForState,
       getImpact,
+      loadStateDetail,
     }}>
       {children}
     </DataContext.Provider>
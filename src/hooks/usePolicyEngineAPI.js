@@ -2,6 +2,11 @@ import { useState, useCallback, useEffect } from "react";
 
 const API_BASE = "https://api.policyengine.org";
 
+// Same-origin cached proxy for /us/calculate (modal_app.py). Falls back to the
+// public API when the proxy isn't deployed (e.g. vite dev) or can't reach it.
+const HOUSEHOLD_PROXY = "/api/household";
+const PROXY_FAILURE_STATUSES = new Set([404, 405, 502, 503, 504]);
+
 // Module-level cache so all hook instances share the same fetch
 let _apiVersionPromise = null;
 
@@ -78,6 +83,35 @@ export function buildApiPolicy(reform) {
   return apiPolicy;
 }
 
+/**
+ * True if a /api/household response means the proxy itself is unavailable
+ * (missing route, upstream unreachable, or a non-JSON page) rather than a
+ * real calculation result or error from the PolicyEngine API.
+ */
+export function isProxyFailure(status, contentType) {
+  if (PROXY_FAILURE_STATUSES.has(status)) return true;
+  return !(contentType || "").includes("application/json");
+}
+
+async function postCalculation(payload) {
+  const init = {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify(payload),
+  };
+
+  try {
+    const response = await fetch(HOUSEHOLD_PROXY, init);
+    if (!isProxyFailure(response.status, response.headers.get("content-type"))) {
+      return response;
+    }
+  } catch {
+    // Network error reaching the proxy — use the public API directly
+  }
+
+  return fetch(`${API_BASE}/us/calculate`, init);
+}
+
 export function usePolicyEngineAPI() {
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState(null);
@@ -95,11 +129,7 @@ export function usePolicyEngineAPI() {
       payload.policy = buildApiPolicy(reform);
     }
 
-    const response = await fetch(`${API_BASE}/us/calculate`, {
-      method: "POST",
-      headers: { "Content-Type": "application/json" },
-      body: JSON.stringify(payload),
-    });
+    const response = await postCalculation(payload);
 
     const data = await response.json();
 
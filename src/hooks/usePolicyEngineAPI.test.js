@@ -1,5 +1,5 @@
 import { describe, it, expect } from "vitest";
-import { buildApiPolicy, compareSemver, reformNeedsStructuralCode } from "./usePolicyEngineAPI";
+import { buildApiPolicy, compareSemver, isProxyFailure, reformNeedsStructuralCode } from "./usePolicyEngineAPI";
 
 describe("buildApiPolicy", () => {
   it("strips _use_reform and _skip_params from reform params", () => {
@@ -180,3 +180,22 @@ describe("reformNeedsStructuralCode", () => {
     expect(reformNeedsStructuralCode(undefined)).toBe(false);
   });
 });
+
+describe("isProxyFailure", () => {
+  it("passes through JSON results and API errors", () => {
+    expect(isProxyFailure(200, "application/json")).toBe(false);
+    expect(isProxyFailure(400, "application/json; charset=utf-8")).toBe(false);
+    expect(isProxyFailure(500, "application/json")).toBe(false);
+  });
+
+  it("falls back when the proxy route is missing or upstream is unreachable", () => {
+    expect(isProxyFailure(404, "text/plain")).toBe(true);
+    expect(isProxyFailure(405, "application/json")).toBe(true);
+    expect(isProxyFailure(502, "application/json")).toBe(true);
+  });
+
+  it("falls back when an SPA page is returned instead of JSON", () => {
+    expect(isProxyFailure(200, "text/html")).toBe(true);
+    expect(isProxyFailure(200, null)).toBe(true);
+  });
+});
@@ -0,0 +1,60 @@
+// reform_impacts rows -> the camelCase dict components read, plus the state
+// updaters DataContext uses to combine bundle summaries with per-state detail.
+
+export function parseJsonField(value, fallback, label) {
+  // Supabase sometimes returns JSON columns as strings
+  if (typeof value === 'string') {
+    try {
+      return JSON.parse(value);
+    } catch (e) {
+      console.error(`Failed to parse ${label}:`, e);
+      return fallback;
+    }
+  }
+  return value || fallback;
+}
+
+// Convert a reform_impacts row to the camelCase shape components use
+export function toImpact(item) {
+  const modelNotes = parseJsonField(item.model_notes, {}, 'model_notes');
+  const provisions = parseJsonField(item.provisions, [], 'provisions');
+  return {
+    computed: item.computed,
+    computedAt: item.computed_at,
+    policyId: item.policy_id,
+    budgetaryImpact: item.budgetary_impact,
+    povertyImpact: item.poverty_impact,
+    childPovertyImpact: item.child_poverty_impact,
+    winnersLosers: item.winners_losers,
+    decileImpact: item.decile_impact,
+    inequality: item.inequality,
+    districtImpacts: item.district_impacts,
+    reformParams: item.reform_params,
+    provisions: provisions,
+    modelNotes: modelNotes,
+    analysisYear: modelNotes?.analysis_year,
+    impactsByYear: modelNotes?.impacts_by_year,
+    policyengineUsVersion: item.policyengine_us_version,
+    datasetVersion: item.dataset_version,
+  };
+}
+
+export function toImpactsDict(rows) {
+  const impactsDict = {};
+  for (const item of rows || []) {
+    impactsDict[item.id] = toImpact(item);
+  }
+  return impactsDict;
+}
+
+// Bundle summaries fill in around whatever is already loaded: a deep link can
+// fetch its state's detail before the bundle arrives, and the summaries must
+// not overwrite it.
+export function withBundleImpacts(rows) {
+  return prev => ({ ...toImpactsDict(rows), ...prev });
+}
+
+// Full per-state detail always replaces summaries
+export function withDetailImpacts(rows) {
+  return prev => ({ ...prev, ...toImpactsDict(rows) });
+}
@@ -0,0 +1,42 @@
+import { describe, it, expect } from "vitest";
+import { toImpactsDict, withBundleImpacts, withDetailImpacts } from "./impacts";
+
+const summary = { id: "ny-s1", budgetary_impact: { budgetaryImpact: -5e8 } };
+const detail = {
+  ...summary,
+  district_impacts: { "NY-01": { avgBenefit: 120 } },
+  decile_impact: { relative: { 1: 0.01 } },
+  provisions: '[{"label": "Rate cut"}]',
+  model_notes: { impacts_by_year: { 2026: { budgetaryImpact: -5e8 } } },
+};
+const other = { id: "ga-h2", budgetary_impact: { budgetaryImpact: 1e7 } };
+
+function apply(...updaters) {
+  return updaters.reduce((state, update) => update(state), {});
+}
+
+describe("impact state updaters", () => {
+  it("keeps state detail that loaded before the bundle", () => {
+    const impacts = apply(withDetailImpacts([detail]), withBundleImpacts([summary, other]));
+
+    expect(impacts["ny-s1"].districtImpacts).toEqual({ "NY-01": { avgBenefit: 120 } });
+    expect(impacts["ny-s1"].decileImpact).toEqual({ relative: { 1: 0.01 } });
+    expect(impacts["ny-s1"].provisions).toEqual([{ label: "Rate cut" }]);
+    expect(impacts["ny-s1"].impactsByYear).toHaveProperty("2026");
+    expect(impacts["ga-h2"].budgetaryImpact).toEqual({ budgetaryImpact: 1e7 });
+  });
+
+  it("ends in the same state whichever response arrives first", () => {
+    const bundleFirst = apply(withBundleImpacts([summary, other]), withDetailImpacts([detail]));
+    const detailFirst = apply(withDetailImpacts([detail]), withBundleImpacts([summary, other]));
+
+    expect(detailFirst).toEqual(bundleFirst);
+  });
+
+  it("converts rows to camelCase impacts", () => {
+    const impacts = toImpactsDict([detail]);
+
+    expect(impacts["ny-s1"].budgetaryImpact).toEqual({ budgetaryImpact: -5e8 });
+    expect(impacts["ny-s1"].provisions).toEqual([{ label: "Rate cut" }]);
+  });
+});